@@ -18,6 +18,7 @@ from .ensemble.dan import *
 from .regularization.weight_decay import *
 from .regularization.weight_elimination import *
 from .regularization.max_norm import *
+from .regularization.pruning import *
 
 from .step_update.step_decay import *
 from .step_update.search_then_converge import *
@@ -68,6 +68,15 @@ class BaseAssociative(BaseNetwork):
 
         self.weight = self.weight.astype(float)
 
+    def get_training_state(self):
+        state = super(BaseAssociative, self).get_training_state()
+        state['weight'] = self.weight
+        return state
+
+    def set_training_state(self, state):
+        self.weight = state['weight']
+        super(BaseAssociative, self).set_training_state(state)
+
     def format_input_data(self, input_data):
         is_feature1d = self.n_inputs == 1
         input_data = format_data(input_data, is_feature1d)
@@ -176,6 +185,15 @@ class BaseStepAssociative(BaseAssociative):
 
         self.bias = self.bias.astype(float)
 
+    def get_training_state(self):
+        state = super(BaseStepAssociative, self).get_training_state()
+        state['bias'] = self.bias
+        return state
+
+    def set_training_state(self, state):
+        self.bias = state['bias']
+        super(BaseStepAssociative, self).set_training_state(state)
+
     def predict(self, input_data):
         input_data = format_data(input_data, is_feature1d=False)
         raw_output = input_data.dot(self.weight) + self.bias
@@ -118,6 +118,21 @@ class Oja(BaseNetwork):
 
         return mae
 
+    def get_training_state(self):
+        state = super(Oja, self).get_training_state()
+
+        # Weight will be initialized only before the training
+        if isinstance(self.weight, np.ndarray):
+            state['weight'] = self.weight
+
+        return state
+
+    def set_training_state(self, state):
+        if 'weight' in state:
+            self.weight = state['weight']
+
+        super(Oja, self).set_training_state(state)
+
     def train(self, input_data, epsilon=1e-2, epochs=100):
         input_data = format_data(input_data)
         n_input_features = input_data.shape[1]
@@ -1,17 +1,18 @@
 from __future__ import division, absolute_import
 
 import time
-import types
 import numbers
 from itertools import groupby
 
 import six
 import numpy as np
 
+from neupy import storage
 from neupy.utils import preformat_value, AttributeKeyDict, as_tuple
 from neupy.exceptions import StopTraining
 from neupy.core.base import BaseSkeleton
-from neupy.core.properties import BoundedProperty, NumberProperty, Property
+from neupy.core.properties import (BoundedProperty, NumberProperty,
+                                   IntProperty, Property, CallableProperty)
 from .summary_info import SummaryTable, InlineSummary
 from .utils import iter_until_converge, shuffle
 
@@ -211,6 +212,29 @@ class ErrorHistoryList(list):
         return ErrorHistoryList(normalized_errors)
 
 
+def has_training_state(network):
+    """
+    Checks whether network extends training state with the
+    values that it learns. State defined in the ``BaseNetwork``
+    class contains only epoch number and errors, which is not
+    enough in order to continue training.
+
+    Parameters
+    ----------
+    network : BaseNetwork instance
+
+    Returns
+    -------
+    bool
+    """
+    get_training_state = six.get_unbound_function(
+        network.__class__.get_training_state)
+    base_get_training_state = six.get_unbound_function(
+        BaseNetwork.get_training_state)
+
+    return get_training_state is not base_get_training_state
+
+
 class BaseNetwork(BaseSkeleton):
     """
     Base class for Neural Network algorithms.
@@ -243,12 +267,26 @@ class BaseNetwork(BaseSkeleton):
         If it's ``True`` class shuffles all your training data before
         training your network, defaults to ``True``.
 
-    epoch_end_signal : function
+    epoch_end_signal : callable
         Calls this function when train epoch finishes.
 
-    train_end_signal : function
+    train_end_signal : callable
         Calls this function when train process finishes.
 
+    checkpoint_file : str or None
+        Path to the file where network will save its training
+        state during the training. Checkpoint can be loaded with
+        the ``neupy.storage.load_checkpoint`` function in order
+        to continue training from the saved epoch. ``None``
+        value disables checkpoints. Option is available only for
+        networks that store learned values in their training
+        state. Defaults to ``None``.
+
+    checkpoint_epoch : int
+        Defines how often network will save its training state.
+        For instance, value ``10`` means that checkpoint will be
+        saved after every 10th epoch. Defaults to ``1``.
+
     {Verbose.Parameters}
 
     Attributes
@@ -274,8 +312,12 @@ class BaseNetwork(BaseSkeleton):
     show_epoch = ShowEpochProperty(minval=1, default=1)
     shuffle_data = Property(default=False, expected_type=bool)
 
-    epoch_end_signal = Property(expected_type=types.FunctionType)
-    train_end_signal = Property(expected_type=types.FunctionType)
+    epoch_end_signal = CallableProperty()
+    train_end_signal = CallableProperty()
+
+    checkpoint_file = Property(expected_type=six.string_types,
+                               allow_none=True)
+    checkpoint_epoch = IntProperty(minval=1, default=1)
 
     def __init__(self, *args, **options):
         self.errors = self.train_errors = ErrorHistoryList()
@@ -285,6 +327,12 @@ class BaseNetwork(BaseSkeleton):
 
         super(BaseNetwork, self).__init__(*args, **options)
 
+        if self.checkpoint_file is not None and not has_training_state(self):
+            raise ValueError(
+                "Network `{}` doesn't store learned values in its "
+                "training state and cannot save checkpoints"
+                "".format(self.__class__.__name__))
+
         if self.verbose:
             show_network_options(self, highlight_options=options)
 
@@ -314,6 +362,42 @@ class BaseNetwork(BaseSkeleton):
         """
         self.last_epoch = epoch
 
+    def get_training_state(self):
+        """
+        Returns information that's required in order to
+        continue training from the last trained epoch.
+
+        Returns
+        -------
+        dict
+        """
+        return {
+            'last_epoch': self.last_epoch,
+            'errors': list(self.errors),
+            'validation_errors': list(self.validation_errors),
+            'random_state': np.random.get_state(),
+        }
+
+    def set_training_state(self, state):
+        """
+        Restores training state.
+
+        Parameters
+        ----------
+        state : dict
+            Training state returned from the
+            ``get_training_state`` method.
+        """
+        self.last_epoch = state['last_epoch']
+
+        # Errors are modified in place, because the same list can be
+        # accessible from the different attributes of the network
+        self.errors[:] = state['errors']
+        self.validation_errors[:] = state['validation_errors']
+
+        if 'random_state' in state:
+            np.random.set_state(state['random_state'])
+
     def train_epoch(self, input_train, target_train=None):
         raise NotImplementedError()
 
@@ -388,6 +472,9 @@ class BaseNetwork(BaseSkeleton):
         train_end_signal = self.train_end_signal
         on_epoch_start_update = self.on_epoch_start_update
 
+        checkpoint_file = self.checkpoint_file
+        checkpoint_epoch = self.checkpoint_epoch
+
         is_first_iteration = True
         can_compute_validation_error = (input_test is not None)
         last_epoch_shown = 0
@@ -425,6 +512,9 @@ class BaseNetwork(BaseSkeleton):
                     if epoch_end_signal is not None:
                         epoch_end_signal(self)
 
+                    if checkpoint_file and epoch % checkpoint_epoch == 0:
+                        storage.save_checkpoint(self, checkpoint_file)
+
                     is_first_iteration = False
 
                 except StopTraining as err:
@@ -74,6 +74,31 @@ class ART1(BaseNetwork):
     rho = ProperFractionProperty(default=0.5)
     n_clusters = IntProperty(default=2, minval=2)
 
+    def __init__(self, **options):
+        super(ART1, self).__init__(**options)
+
+        if self.checkpoint_file is not None:
+            raise ValueError(
+                "ART1 network trains in a single pass over the data "
+                "and doesn't save checkpoints. Training state can be "
+                "saved with the `neupy.storage.save_checkpoint` function")
+
+    def get_training_state(self):
+        state = super(ART1, self).get_training_state()
+
+        # Weights will be initialized only before the training
+        if hasattr(self, 'weight_21'):
+            state.update(weight_21=self.weight_21, weight_12=self.weight_12)
+
+        return state
+
+    def set_training_state(self, state):
+        if 'weight_21' in state:
+            self.weight_21 = state['weight_21']
+            self.weight_12 = state['weight_12']
+
+        super(ART1, self).set_training_state(state)
+
     def train(self, input_data):
         input_data = format_data(input_data)
 
@@ -288,6 +288,48 @@ class GrowingNeuralGas(BaseNetwork):
         for sample in sample_data_point(data, n=self.n_start_nodes):
             self.graph.add_node(NeuronNode(sample.reshape(1, -1)))
 
+    def get_training_state(self):
+        state = super(GrowingNeuralGas, self).get_training_state()
+
+        nodes = self.graph.nodes
+        node_index = {node: i for i, node in enumerate(nodes)}
+        edges = list(self.graph.edges.items())
+
+        weights = [node.weight.ravel() for node in nodes]
+        edge_nodes = [[node_index[node_1], node_index[node_2]]
+                      for (node_1, node_2), _ in edges]
+
+        state.update(
+            n_updates=self.n_updates,
+            node_weights=np.reshape(weights, (len(nodes), self.n_inputs)),
+            node_errors=np.array([node.error for node in nodes], dtype=float),
+            # Each edge is stored as a pair of node indices
+            edges=np.reshape(edge_nodes, (-1, 2)).astype(int),
+            edge_ages=np.array([age for _, age in edges], dtype=int),
+        )
+        return state
+
+    def set_training_state(self, state):
+        graph = NeuralGasGraph()
+        nodes = []
+
+        for weight, error in zip(state['node_weights'], state['node_errors']):
+            node = NeuronNode(np.array(weight, ndmin=2))
+            node.error = float(error)
+
+            graph.add_node(node)
+            nodes.append(node)
+
+        for (index_1, index_2), age in zip(state['edges'], state['edge_ages']):
+            node_1, node_2 = nodes[index_1], nodes[index_2]
+
+            graph.add_edge(node_1, node_2)
+            graph.edges[make_edge_id(node_1, node_2)] = int(age)
+
+        self.graph = graph
+        self.n_updates = state['n_updates']
+        super(GrowingNeuralGas, self).set_training_state(state)
+
     def train(self, input_train, summary='table', epochs=100):
         input_train = self.format_input_data(input_train)
 
@@ -225,6 +225,17 @@ class LVQ(BaseNetwork):
         updates_ratio = (1 - self.n_updates / self.n_updates_to_stepdrop)
         return self.minstep + (self.step - self.minstep) * updates_ratio
 
+    def get_training_state(self):
+        state = super(LVQ, self).get_training_state()
+        state.update(weight=self.weight, n_updates=self.n_updates)
+        return state
+
+    def set_training_state(self, state):
+        self.weight = state['weight']
+        self.initialized = self.weight is not None
+        self.n_updates = state['n_updates']
+        super(LVQ, self).set_training_state(state)
+
     def predict(self, input_data):
         if not self.initialized:
             raise NotTrained("LVQ network hasn't been trained yet")
@@ -547,6 +547,17 @@ class SOFM(Kohonen):
         if self.distance.name == 'cosine':
             self.weight /= np.linalg.norm(self.weight, axis=0)
 
+    def get_training_state(self):
+        if not self.initialized:
+            raise WeightInitializationError(
+                "Weights haven't been initialized yet")
+
+        return super(SOFM, self).get_training_state()
+
+    def set_training_state(self, state):
+        super(SOFM, self).set_training_state(state)
+        self.initialized = True
+
     def train(self, input_train, summary='table', epochs=100):
         if not self.initialized:
             self.init_weights(input_train)
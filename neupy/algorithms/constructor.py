@@ -1,19 +1,22 @@
 import abc
 import time
 import types
+from collections import OrderedDict
 
 import six
 import theano
 import theano.sparse
 import theano.tensor as T
+import scipy.sparse as sp
 
 from neupy import layers
 from neupy.utils import AttributeKeyDict, asfloat, format_data, as_tuple
 from neupy.layers.utils import preformat_layer_shape, iter_parameters
-from neupy.layers.connections import LayerConnection, is_sequential
+from neupy.layers.connections import (LayerConnection, is_sequential,
+                                      checkpointed_output)
 from neupy.layers.connections.base import create_input_variables
 from neupy.exceptions import InvalidConnection
-from neupy.core.properties import ChoiceProperty
+from neupy.core.properties import ChoiceProperty, Property
 from neupy.algorithms.base import BaseNetwork
 from .gd import errors
 
@@ -36,6 +39,28 @@ def does_layer_accept_1d_feature(layer):
     return (layer.output_shape == (1,))
 
 
+def format_layer_input(layer, input_data):
+    """
+    Format input data for the specified input layer.
+
+    Parameters
+    ----------
+    layer : object
+    input_data : array-like, sparse matrix or None
+
+    Returns
+    -------
+    array-like, sparse matrix or None
+        Sparse matrix in the CSR format for the layers that expect
+        sparse input and array in all other cases.
+    """
+    if input_data is not None and getattr(layer, 'sparse', False):
+        return sp.csr_matrix(input_data, dtype=theano.config.floatX)
+
+    is_feature1d = does_layer_accept_1d_feature(layer)
+    return format_data(input_data, is_feature1d)
+
+
 def generate_layers(layers_sizes):
     """
     Create from list of layer sizes basic linear network.
@@ -136,6 +161,45 @@ class ErrorFunctionProperty(ChoiceProperty):
                                                           founded_value)
 
 
+def find_shared_variables(functions):
+    """
+    Finds shared variables that compiled functions use or update.
+    Each variable identified by its name. Variables without names
+    and variables with the same names identified by the order in
+    which they appear in the functions.
+
+    Parameters
+    ----------
+    functions : list
+        Compiled Theano functions.
+
+    Returns
+    -------
+    OrderedDict
+        Variable identifiers mapped to the shared variables.
+    """
+    variables = OrderedDict()
+    found_variables = set()
+
+    for function in functions:
+        for variable in function.get_shared():
+            if variable in found_variables:
+                continue
+
+            found_variables.add(variable)
+
+            name = variable.name or 'unnamed'
+            key, index = name, 1
+
+            while key in variables:
+                index += 1
+                key = '{}#{}'.format(name, index)
+
+            variables[key] = variable
+
+    return variables
+
+
 class BaseAlgorithm(six.with_metaclass(abc.ABCMeta)):
     """
     Base class for algorithms implemeted in Theano.
@@ -167,6 +231,71 @@ class BaseAlgorithm(six.with_metaclass(abc.ABCMeta)):
                           "It took {:.2f} seconds"
                           "".format(finish_init_time - start_init_time))
 
+    def iter_compiled_functions(self):
+        """
+        Iterates over compiled Theano functions in
+        the fixed order.
+        """
+        for _, method in sorted(self.methods.items()):
+            if isinstance(method, theano.compile.Function):
+                yield method
+
+    def get_training_state(self):
+        """
+        Returns information that's required in order to
+        continue training from the last trained epoch. In
+        addition to the network's attributes, state contains
+        values of all shared variables that compiled functions
+        use, which includes parameters, optimizer's state and
+        states of the random number generators.
+
+        Returns
+        -------
+        dict
+        """
+        state = super(BaseAlgorithm, self).get_training_state()
+        variables = find_shared_variables(self.iter_compiled_functions())
+
+        state['variables'] = OrderedDict(
+            (name, variable.get_value())
+            for name, variable in variables.items())
+
+        return state
+
+    def set_training_state(self, state):
+        """
+        Restores training state.
+
+        Parameters
+        ----------
+        state : dict
+            Training state returned from the
+            ``get_training_state`` method.
+
+        Raises
+        ------
+        ValueError
+            In case if state has been created for the network
+            with different architecture or training algorithm.
+        """
+        variables = find_shared_variables(self.iter_compiled_functions())
+        stored_variables = state['variables']
+
+        if set(variables) != set(stored_variables):
+            missed = set(variables) - set(stored_variables)
+            unexpected = set(stored_variables) - set(variables)
+
+            raise ValueError(
+                "Training state doesn't match the network. \n"
+                "  Missed variables: {}\n"
+                "  Unexpected variables: {}"
+                "".format(sorted(missed), sorted(unexpected)))
+
+        for name, value in stored_variables.items():
+            variables[name].set_value(value)
+
+        super(BaseAlgorithm, self).set_training_state(state)
+
     @abc.abstractmethod
     def init_input_output_variables(self):
         """
@@ -241,6 +370,17 @@ class ConstructibleNetwork(BaseAlgorithm, BaseNetwork):
             def custom_func(expected, predicted):
                 return expected - predicted
 
+    checkpoints : int, list or None
+        Enables gradient checkpointing. Network will be split into
+        segments and during training only activations at the end of
+        each segment will be stored for the backward pass. All other
+        activations will be recomputed during the backward pass,
+        which reduces memory usage at the cost of one extra forward
+        pass. Integer value defines number of layers per segment.
+        List should contain layers or layer names and output from
+        each of these layers ends the segment. ``None`` disables
+        checkpointing. Defaults to ``None``.
+
     {BaseNetwork.Parameters}
 
     Attributes
@@ -274,6 +414,8 @@ class ConstructibleNetwork(BaseAlgorithm, BaseNetwork):
         'binary_hinge': errors.binary_hinge,
         'categorical_hinge': errors.categorical_hinge,
     })
+    checkpoints = Property(default=None, allow_none=True,
+                           expected_type=(int, list, tuple))
 
     def __init__(self, connection, *args, **kwargs):
         self.connection = clean_layers(connection)
@@ -304,7 +446,12 @@ class ConstructibleNetwork(BaseAlgorithm, BaseNetwork):
         network_inputs = self.variables.network_inputs
         network_output = self.variables.network_output
 
-        train_prediction = self.connection.output(*network_inputs)
+        if self.checkpoints is None:
+            train_prediction = self.connection.output(*network_inputs)
+        else:
+            train_prediction = checkpointed_output(
+                self.connection, network_inputs, self.checkpoints)
+
         with self.connection.disable_training_state():
             prediction = self.connection.output(*network_inputs)
 
@@ -397,14 +544,11 @@ class ConstructibleNetwork(BaseAlgorithm, BaseNetwork):
         input_layers = self.connection.input_layers
 
         if not isinstance(input_data, (tuple, list)):
-            input_layer = input_layers[0]
-            is_feature1d = does_layer_accept_1d_feature(input_layer)
-            return format_data(input_data, is_feature1d)
+            return format_layer_input(input_layers[0], input_data)
 
         formated_data = []
         for input_to_layer, input_layer in zip(input_data, input_layers):
-            is_feature1d = does_layer_accept_1d_feature(input_layer)
-            data = format_data(input_to_layer, is_feature1d)
+            data = format_layer_input(input_layer, input_to_layer)
             formated_data.append(data)
 
         return tuple(formated_data)
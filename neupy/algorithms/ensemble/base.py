@@ -18,7 +18,8 @@ class BaseEnsemble(BaseSkeleton, Configurable):
     ------
     ValueError
     """
-    def __init__(self, networks):
+    def __init__(self, networks, **options):
+        super(BaseEnsemble, self).__init__(**options)
         self.networks = networks
         n_networks = len(self.networks)
 
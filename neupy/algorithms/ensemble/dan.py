@@ -1,12 +1,71 @@
+import theano
+import theano.tensor as T
 import numpy as np
 
+from neupy import parallel
+from neupy.core.properties import IntProperty
+from neupy.algorithms.constructor import ConstructibleNetwork
+from neupy.algorithms.gd.base import MinibatchTrainingMixin
+from neupy.layers.connections.base import create_input_variables
 from .base import BaseEnsemble
 
 
 __all__ = ('DynamicallyAveragedNetwork',)
 
 
-class DynamicallyAveragedNetwork(BaseEnsemble):
+def can_fuse_predictions(networks):
+    """
+    Checks whether predictions from all networks can be
+    computed with one Theano function.
+
+    Parameters
+    ----------
+    networks : list of networks
+
+    Returns
+    -------
+    bool
+    """
+    if not all(isinstance(net, ConstructibleNetwork) for net in networks):
+        return False
+
+    input_shapes = [net.connection.input_shape for net in networks]
+    return all(shape == input_shapes[0] for shape in input_shapes)
+
+
+def compile_fused_prediction(networks):
+    """
+    Compile one function that computes forward pass for all networks
+    in the single call. Each network has to have one output unit.
+
+    Parameters
+    ----------
+    networks : list of ConstructibleNetwork instances
+
+    Returns
+    -------
+    Theano function
+        Function returns matrix with shape ``(n_samples, n_networks)``.
+    """
+    input_layers = networks[0].connection.input_layers
+    network_inputs = create_input_variables(input_layers)
+    outputs = []
+
+    for network in networks:
+        replacements = zip(network.variables.network_inputs, network_inputs)
+        output = theano.clone(
+            network.variables.prediction_func,
+            replace=dict(replacements))
+        outputs.append(output)
+
+    return theano.function(
+        inputs=network_inputs,
+        outputs=T.concatenate(outputs, axis=1),
+        name='algo:dan/func:predict'
+    )
+
+
+class DynamicallyAveragedNetwork(BaseEnsemble, MinibatchTrainingMixin):
     """
     Dynamically Averaged Network (DAN) weighted ensemble
     for binary classification problems.
@@ -16,10 +75,22 @@ class DynamicallyAveragedNetwork(BaseEnsemble):
     networks : list
         List of Neural Networks.
 
+    n_workers : int
+        Number of processes that train networks in parallel.
+        Parameters and training history of the networks trained
+        in the other processes are copied back into the networks
+        from the ``networks`` list. Value ``1`` means that networks
+        will be trained one by one in the main process.
+        Defaults to ``1``.
+
+    {MinibatchTrainingMixin.batch_size}
+
     Methods
     -------
     train(self, input_data, target_data, \*args, \*\*kwargs)
-        Use input data to train all neural network one by one.
+        Use input data to train all neural networks. Networks are
+        trained one by one or in parallel processes in case if
+        ``n_workers`` is greater than ``1``.
 
     Attributes
     ----------
@@ -32,6 +103,11 @@ class DynamicallyAveragedNetwork(BaseEnsemble):
     - Every network must has 1 output and result must
       be between ``0`` and ``1``.
 
+    - In case if all networks have the same input shape, forward
+      passes for all networks are compiled into one Theano function
+      and outputs from all networks are computed in the single call
+      per each mini-batch.
+
     Examples
     --------
     >>> import numpy as np
@@ -59,9 +135,12 @@ class DynamicallyAveragedNetwork(BaseEnsemble):
     >>> metrics.accuracy_score(y_test, y_predicted)
     0.97777777777777775
     """
-    def __init__(self, networks):
-        super(DynamicallyAveragedNetwork, self).__init__(networks)
+    n_workers = IntProperty(default=1, minval=1)
+
+    def __init__(self, networks, **options):
+        super(DynamicallyAveragedNetwork, self).__init__(networks, **options)
         self.weight = None
+        self.fused_predict = None
 
         for network in networks:
             output_layer_size = network.output_layer.size
@@ -73,28 +152,72 @@ class DynamicallyAveragedNetwork(BaseEnsemble):
                     "{}".format(self.__class__.__name__, output_layer_size))
 
     def train(self, input_data, target_data, *args, **kwargs):
-        for network in self.networks:
-            network.train(input_data, target_data, *args, **kwargs)
+        self.fused_predict = None
+
+        if self.n_workers == 1:
+            for network in self.networks:
+                network.train(input_data, target_data, *args, **kwargs)
+            return
+
+        trained_networks = parallel.train_networks(
+            self.networks, input_data, target_data, *args,
+            n_workers=self.n_workers, **kwargs)
+
+        # Networks returned from the workers are copies. Trained
+        # parameters are copied back in order to keep references
+        # to the original networks valid.
+        for network, trained_network in zip(self.networks,
+                                            trained_networks):
+            state = trained_network.get_training_state()
+            # Random state belongs to the worker's process
+            del state['random_state']
+            network.set_training_state(state)
+
+    def predict_networks(self, input_data):
+        """
+        Predict outputs from all networks.
+
+        Parameters
+        ----------
+        input_data : array-like
+
+        Returns
+        -------
+        array-like
+            Matrix with shape ``(n_samples, n_networks)``.
+        """
+        if not can_fuse_predictions(self.networks):
+            outputs = [network.predict(input_data)
+                       for network in self.networks]
+            return np.concatenate(outputs, axis=1)
+
+        if self.fused_predict is None:
+            self.fused_predict = compile_fused_prediction(self.networks)
+
+        input_data = self.networks[0].format_input_data(input_data)
+        outputs = self.apply_batches(
+            function=self.fused_predict,
+            input_data=input_data,
+
+            description='Prediction batches',
+            show_progressbar=False,
+            show_error_output=False,
+        )
+        return np.concatenate(outputs, axis=0)
 
     def predict_proba(self, input_data):
-        n_inputs = input_data.shape[0]
-        n_networks = len(self.networks)
-        network_certainties = np.zeros((n_inputs, n_networks))
-        network_outputs = network_certainties.copy()
-
-        for i, network in enumerate(self.networks):
-            output = network.predict(input_data)
-            minval, maxval = output.min(), output.max()
+        network_outputs = self.predict_networks(input_data)
+        n_inputs = network_outputs.shape[0]
 
-            if not (0 <= minval <= 1 and 0 <= maxval <= 1):
-                raise ValueError(
-                    "Netwrok output must be in range [0, 1]. Network output "
-                    "was in range [{}, {}]".format(minval, maxval))
+        minval, maxval = network_outputs.min(), network_outputs.max()
 
-            certainty = np.where(output > 0.5, output, 1 - output)
+        if not (0 <= minval <= 1 and 0 <= maxval <= 1):
+            raise ValueError(
+                "Netwrok output must be in range [0, 1]. Network output "
+                "was in range [{}, {}]".format(minval, maxval))
 
-            network_certainties[:, i:i + 1] = certainty
-            network_outputs[:, i:i + 1] = output
+        network_certainties = np.where(
+            network_outputs > 0.5, network_outputs, 1 - network_outputs)
 
         total_output_sum = np.reshape(
             network_certainties.sum(axis=1), (n_inputs, 1))
@@ -32,12 +32,22 @@ class Adam(MinibatchGradientDescent):
 
     {MinibatchGradientDescent.batch_size}
 
+    {MinibatchGradientDescent.accumulate_steps}
+
+    {MinibatchGradientDescent.n_workers}
+
+    {MinibatchGradientDescent.batch_sampler}
+
     {GradientDescent.addons}
 
+    {GradientDescent.sparse_updates}
+
     {ConstructibleNetwork.connection}
 
     {ConstructibleNetwork.error}
 
+    {ConstructibleNetwork.checkpoints}
+
     {BaseNetwork.show_epoch}
 
     {BaseNetwork.shuffle_data}
@@ -1,21 +1,29 @@
 from __future__ import division
 
 import math
+import itertools
 
 import six
 import theano
 import theano.tensor as T
 import numpy as np
 import progressbar
+from scipy.sparse import issparse
 
 from neupy.core.config import Configurable
-from neupy.core.properties import Property, BoundedProperty
-from neupy.utils import as_tuple
+from neupy.core.properties import Property, BoundedProperty, IntProperty
+from neupy.utils import as_tuple, asfloat
+from neupy.layers.utils import iter_parameters
+from neupy.layers.recurrent import BaseRNNLayer
 from neupy.algorithms.constructor import ConstructibleNetwork
 from neupy.algorithms.gd import addon_types
+from neupy.algorithms.gd.parallel import DataParallelWorkers
+from neupy.algorithms.gd.sparse import (find_row_subtensors, sparse_gradient,
+                                        make_sparse_updates)
 
 
-__all__ = ('GradientDescent', 'MinibatchGradientDescent')
+__all__ = ('GradientDescent', 'MinibatchGradientDescent',
+           'LengthBucketSampler')
 
 
 class GradientDescent(ConstructibleNetwork):
@@ -32,6 +40,17 @@ class GradientDescent(ConstructibleNetwork):
         will inherit all from this list. Support two types of
         addon algorithms: weight update and step update.
 
+    sparse_updates : bool
+        If ``True``, parameters that are used in the network only
+        through the row selection, like weight in the ``Embedding``
+        layer, will be updated only for the rows that were used
+        in the mini-batch. Variables that optimizer associates with
+        the parameter, like momentum or moving averages, also get
+        updated only for these rows, which means that they won't
+        decay for the rows that weren't used. Option works with
+        algorithms that update each parameter independently.
+        Defaults to ``False``.
+
     Attributes
     ----------
     {ConstructibleNetwork.Attributes}
@@ -54,6 +73,7 @@ class GradientDescent(ConstructibleNetwork):
     supported_addon_types = addon_types.keys()
 
     addons = Property(default=None, expected_type=list)
+    sparse_updates = Property(default=False, expected_type=bool)
 
     # TODO: The arguments that have default value equal to `None`
     # are useful only in case if we need to save network in the
@@ -112,6 +132,67 @@ class GradientDescent(ConstructibleNetwork):
             options = kwargs
         super(GradientDescent, self).__init__(connection, **options)
 
+    def init_train_updates(self):
+        if not self.sparse_updates:
+            return super(GradientDescent, self).init_train_updates()
+
+        error_func = self.variables.error_func
+        updates = []
+
+        for layer, _, parameter in iter_parameters(self.layers):
+            subtensors = find_row_subtensors(error_func, parameter)
+
+            if subtensors is None:
+                updates.extend(self.init_param_updates(layer, parameter))
+            else:
+                updates.extend(self.init_sparse_param_updates(
+                    layer, parameter, subtensors))
+
+        for layer in self.layers:
+            updates.extend(layer.updates)
+
+        return updates
+
+    def init_sparse_param_updates(self, layer, parameter, subtensors):
+        """
+        Initialize updates only for the rows of the parameter
+        that were used in the network.
+
+        Parameters
+        ----------
+        layer : object
+            Any layer that inherit from BaseLayer class.
+
+        parameter : object
+            Parameter that is used only through the row selection.
+
+        subtensors : list
+            Variables that select rows from the parameter.
+
+        Returns
+        -------
+        list
+            List of updates related to the specified parameter.
+        """
+        error_func = self.variables.error_func
+        rows, gradient = sparse_gradient(error_func, subtensors)
+
+        # Gradient of the surrogate error function with respect to the
+        # parameter is equal to the placeholder. Algorithm builds
+        # updates for the whole parameter and later each occurrence
+        # of the parameter related variables will be replaced with
+        # their rows.
+        dense_gradient = parameter.type('dense-gradient')
+        self.variables.error_func = T.sum(parameter * dense_gradient)
+
+        try:
+            updates = self.init_param_updates(layer, parameter)
+        finally:
+            self.variables.error_func = error_func
+
+        return make_sparse_updates(
+            updates, parameter, dense_gradient, rows, gradient)
+
     def init_param_updates(self, layer, parameter):
         step = self.variables.step
         gradient = T.grad(self.variables.error_func, wrt=parameter)
@@ -208,16 +289,13 @@ def cannot_divide_into_batches(data, batch_size):
     -------
     bool
     """
-    if isinstance(data, (list, tuple)):
-        # In case if network has more than one input
-        data = data[0]
-
-    n_samples = len(data)
+    n_samples = count_samples(data)
     return batch_size is None or n_samples <= batch_size
 
 
 def apply_batches(function, arguments, batch_size, description='',
-                  show_progressbar=False, show_error_output=True):
+                  show_progressbar=False, show_error_output=True,
+                  batches=None):
     """
     Apply batches to a specified function.
 
@@ -249,6 +327,13 @@ def apply_batches(function, arguments, batch_size, description='',
         Error will be related to the last epoch.
         Defaults to ``True``.
 
+    batches : iterable or None
+        Mini-batches with arguments to the function. Number of
+        mini-batches should be the same as the number of
+        ``batch_size`` slices of the arguments. Value ``None``
+        means that arguments will be sliced into the mini-batches
+        in the same order as they are. Defaults to ``None``.
+
     Returns
     -------
     list
@@ -258,10 +343,14 @@ def apply_batches(function, arguments, batch_size, description='',
         raise ValueError("The argument parameter should be list or "
                          "tuple with at least one element.")
 
-    samples = arguments[0]
-    n_samples = len(samples)
+    n_samples = count_samples(arguments[0])
     batch_iterator = list(iter_batches(n_samples, batch_size))
 
+    if batches is None:
+        batches = (
+            [argument[batch] for argument in arguments]
+            for batch in batch_iterator)
+
     if show_progressbar:
         widgets = [
             progressbar.Timer(format='Time: %(elapsed)s'), ' |',
@@ -283,9 +372,7 @@ def apply_batches(function, arguments, batch_size, description='',
         bar = progressbar.NullBar()
 
     outputs = []
-    for i, batch in enumerate(batch_iterator):
-        sliced_arguments = [argument[batch] for argument in arguments]
-
+    for i, sliced_arguments in enumerate(batches):
         output = function(*sliced_arguments)
         outputs.append(output)
 
@@ -357,7 +444,8 @@ class MinibatchTrainingMixin(Configurable):
     batch_size = BatchSizeProperty(default=128)
 
     def apply_batches(self, function, input_data, arguments=(), description='',
-                      show_progressbar=None, show_error_output=False):
+                      show_progressbar=None, show_error_output=False,
+                      batches=None):
         """
         Apply function per each mini-batch.
 
@@ -386,6 +474,12 @@ class MinibatchTrainingMixin(Configurable):
             ``True`` will show information in the progressbar.
             Error will be related to the last epoch.
 
+        batches : iterable or None
+            Mini-batches with arguments to the function, for
+            instance, from the ``LengthBucketSampler``. Value ``None``
+            means that input data and arguments will be divided
+            into mini-batches in the same order. Defaults to ``None``.
+
         Returns
         -------
         list
@@ -393,8 +487,14 @@ class MinibatchTrainingMixin(Configurable):
             object that ``function`` returned.
         """
         arguments = as_tuple(input_data, arguments)
+        batch_size = self.batch_size
+
+        if batches is not None:
+            # Sampler puts all samples into one mini-batch
+            # in case if batch size hasn't been specified
+            batch_size = batch_size or count_samples(input_data)
 
-        if cannot_divide_into_batches(input_data, self.batch_size):
+        elif cannot_divide_into_batches(input_data, batch_size):
             return [function(*arguments)]
 
         if show_progressbar is None:
@@ -407,11 +507,12 @@ class MinibatchTrainingMixin(Configurable):
         return apply_batches(
             function=function,
             arguments=arguments,
-            batch_size=self.batch_size,
+            batch_size=batch_size,
 
             description=description,
             show_progressbar=show_progressbar,
             show_error_output=show_error_output,
+            batches=batches,
         )
 
 
@@ -421,7 +522,7 @@ def count_samples(input_data):
 
     Parameters
     ----------
-    input_data : array-like or list/tuple of array-like objects
+    input_data : array-like, sparse matrix or list/tuple of them
         Input data to the network
 
     Returns
@@ -430,10 +531,184 @@ def count_samples(input_data):
         Number of samples in the input data.
     """
     if isinstance(input_data, (list, tuple)):
-        return len(input_data[0])
+        input_data = input_data[0]
+
+    if issparse(input_data):
+        return input_data.shape[0]
+
     return len(input_data)
 
 
+def accumulate_gradients(accumulate, apply_updates, accumulate_steps):
+    """
+    Creates function that accumulates gradients per each
+    mini-batch and applies updates after every ``accumulate_steps``
+    mini-batches.
+
+    Parameters
+    ----------
+    accumulate : callable
+        Function that accumulates gradients for one mini-batch
+        and returns error.
+
+    apply_updates : callable
+        Function that applies accumulated gradients.
+
+    accumulate_steps : int
+        Number of mini-batches per one update.
+
+    Returns
+    -------
+    callable
+        Function that has the same interface
+        as the ``accumulate`` function.
+    """
+    batch_counter = itertools.count(start=1)
+
+    def train_batch(*arguments):
+        error = accumulate(*arguments)
+
+        if next(batch_counter) % accumulate_steps == 0:
+            apply_updates()
+
+        return error
+
+    return train_batch
+
+
+class LengthBucketSampler(object):
+    """
+    Mini-batch sampler for the networks that train on padded
+    sequences. Sampler groups samples with similar sequence length
+    into the same mini-batches and removes time steps that are
+    padded for all samples in the mini-batch. Recurrent layers
+    iterate over fewer time steps and spend less time on padding.
+
+    Parameters
+    ----------
+    mask_index : int
+        Index of the mask in the list of network's inputs. Mask is
+        a matrix with shape ``(n_samples, n_time_steps)`` that has
+        non-zero values for valid time steps and zeros for the
+        padded ones. Defaults to ``-1``, which means that mask
+        is the last input.
+
+    trim_padding : bool
+        If ``True``, time steps that are padded for all samples in
+        the mini-batch will be removed from the mask and from all
+        other inputs that have the same number of time steps in
+        the second dimension. Network shouldn't depend on the fixed
+        number of time steps, for instance, ``Reshape`` layer before
+        the recurrent layer won't work. Recurrent layers with
+        ``unroll_scan=True`` also require fixed number of time steps
+        and network will raise ``ValueError`` in case if they are
+        used with trimmed padding. Targets are never trimmed.
+        Defaults to ``True``.
+
+    shuffle : bool
+        If ``True``, order of the mini-batches and order of the samples
+        with the same sequence length will be random. Otherwise,
+        mini-batches go from the shortest to the longest sequences.
+        Defaults to ``True``.
+
+    Examples
+    --------
+    >>> from neupy import algorithms, layers
+    >>>
+    >>> sequence = layers.Input(40) > layers.Embedding(20, 10)
+    >>> mask = layers.Input(40)
+    >>>
+    >>> network = algorithms.RMSProp(
+    ...     [sequence, mask] > layers.LSTM(20) > layers.Sigmoid(1),
+    ...     batch_size=32,
+    ...     batch_sampler=algorithms.LengthBucketSampler(),
+    ... )
+    >>> network.train([x_train, mask_train], y_train, epochs=10)
+    """
+    def __init__(self, mask_index=-1, trim_padding=True, shuffle=True):
+        self.mask_index = mask_index
+        self.trim_padding = trim_padding
+        self.shuffle = shuffle
+
+    def trim(self, input_data):
+        """
+        Remove time steps that are padded for all samples.
+
+        Parameters
+        ----------
+        input_data : list of array-like
+            Mini-batch inputs.
+
+        Returns
+        -------
+        list of array-like
+        """
+        mask = input_data[self.mask_index]
+        n_time_steps = mask.shape[1]
+        valid_steps = np.flatnonzero(mask.any(axis=0))
+
+        if valid_steps.size == 0:
+            return input_data
+
+        steps = slice(valid_steps[0], valid_steps[-1] + 1)
+        trimmed_data = []
+
+        for data in input_data:
+            if data.ndim >= 2 and data.shape[1] == n_time_steps:
+                data = data[:, steps]
+            trimmed_data.append(data)
+
+        return trimmed_data
+
+    def iter_batches(self, input_data, target_data, batch_size):
+        """
+        Iterates over mini-batches.
+
+        Parameters
+        ----------
+        input_data : array-like or tuple of array-like
+            Network's inputs. One of them should be a mask.
+
+        target_data : array-like
+
+        batch_size : int or None
+            Mini-batch size. ``None`` means that all samples
+            will be in one mini-batch.
+
+        Yields
+        ------
+        tuple
+            Inputs and target for the mini-batch.
+        """
+        input_data = list(as_tuple(input_data))
+        mask = input_data[self.mask_index]
+
+        n_samples = len(mask)
+        sequence_lengths = (mask != 0).sum(axis=1)
+
+        if self.shuffle:
+            # Random keys shuffle samples that have the same length
+            indices = np.lexsort((np.random.random(n_samples),
+                                  sequence_lengths))
+        else:
+            indices = np.argsort(sequence_lengths, kind='mergesort')
+
+        batch_indices = [
+            indices[batch] for batch in
+            iter_batches(n_samples, batch_size or n_samples)]
+
+        if self.shuffle:
+            np.random.shuffle(batch_indices)
+
+        for indices in batch_indices:
+            batch_input = [data[indices] for data in input_data]
+
+            if self.trim_padding:
+                batch_input = self.trim(batch_input)
+
+            yield as_tuple(tuple(batch_input), target_data[indices])
+
+
 class MinibatchGradientDescent(GradientDescent, MinibatchTrainingMixin):
     """
     Mini-batch Gradient Descent algorithm.
@@ -442,6 +717,32 @@ class MinibatchGradientDescent(GradientDescent, MinibatchTrainingMixin):
     ----------
     {MinibatchTrainingMixin.Parameters}
 
+    accumulate_steps : int
+        Number of mini-batches that network accumulates gradients
+        from before applying one parameter update. Gradients
+        from each mini-batch are weighted by the number of samples
+        in it, so update is equivalent to the one that would be made
+        using mini-batch of size ``accumulate_steps * batch_size``.
+        Parameter allows to train network with large effective
+        batch size when it doesn't fit into the memory.
+        Defaults to ``1``.
+
+    n_workers : int
+        Number of processes that train network in parallel.
+        Each mini-batch splits into ``n_workers`` equal parts and
+        each worker computes gradients for its own part using
+        replica of the network. Gradients from all workers are
+        averaged through the shared memory and parameters are updated
+        once per mini-batch in the main process. Value ``1`` means
+        that network is trained without additional processes.
+        Defaults to ``1``.
+
+    batch_sampler : LengthBucketSampler or None
+        Sampler that defines how training samples are grouped into
+        the mini-batches. Value ``None`` means that mini-batches
+        take samples in the same order as they are in the training
+        data. Defaults to ``None``.
+
     {GradientDescent.Parameters}
 
     Attributes
@@ -469,6 +770,167 @@ class MinibatchGradientDescent(GradientDescent, MinibatchTrainingMixin):
     --------
     :network:`GradientDescent` : GradientDescent algorithm.
     """
+    accumulate_steps = IntProperty(default=1, minval=1)
+    n_workers = IntProperty(default=1, minval=1)
+    batch_sampler = Property(default=None, allow_none=True,
+                             expected_type=LengthBucketSampler)
+
+    def __init__(self, connection, options=None, floatX=None, **kwargs):
+        self.workers = None
+        super(MinibatchGradientDescent, self).__init__(
+            connection, options, floatX, **kwargs)
+
+        sampler = self.batch_sampler
+
+        if sampler is not None and sampler.trim_padding:
+            for layer in self.layers:
+                if isinstance(layer, BaseRNNLayer) and layer.unroll_scan:
+                    raise ValueError(
+                        "Layer `{}` has fixed number of unrolled steps "
+                        "and cannot process sequences with trimmed "
+                        "padding. Set up `trim_padding=False` for the "
+                        "batch sampler".format(layer.name))
+
+    @property
+    def accumulates_gradients(self):
+        """
+        ``True`` in case if parameter updates are computed
+        from the accumulated gradients.
+        """
+        return self.accumulate_steps > 1 or self.n_workers > 1
+
+    def init_variables(self):
+        super(MinibatchGradientDescent, self).init_variables()
+
+        if self.accumulates_gradients:
+            parameters, accumulated_gradients = [], []
+
+            for _, _, parameter in iter_parameters(self.layers):
+                parameters.append(parameter)
+                accumulated_gradients.append(theano.shared(
+                    name="{}/accumulated-gradient".format(parameter.name),
+                    value=asfloat(np.zeros_like(parameter.get_value())),
+                ))
+
+            layer_updates = []
+            for layer in self.layers:
+                layer_updates.extend(layer.updates)
+
+            self.variables.update(
+                layer_updates=layer_updates,
+                layer_states=[variable for variable, _ in layer_updates],
+                accumulated_parameters=parameters,
+                accumulated_gradients=accumulated_gradients,
+                n_accumulated_samples=theano.shared(
+                    name='algo:network/scalar:n-accumulated-samples',
+                    value=asfloat(0),
+                ),
+            )
+
+    def init_methods(self):
+        if not self.accumulates_gradients:
+            return super(MinibatchGradientDescent, self).init_methods()
+
+        network_inputs = self.variables.network_inputs
+        network_output = self.variables.network_output
+        n_accumulated_samples = self.variables.n_accumulated_samples
+        accumulated_gradients = self.variables.accumulated_gradients
+        parameters = self.variables.accumulated_parameters
+        layer_updates = self.variables.layer_updates
+        layer_states = self.variables.layer_states
+
+        gradients = T.grad(self.variables.error_func, wrt=parameters)
+        n_samples = T.cast(network_inputs[0].shape[0], theano.config.floatX)
+
+        accumulate_updates = [
+            (n_accumulated_samples, n_accumulated_samples + n_samples)]
+
+        for accumulated_gradient, gradient in zip(accumulated_gradients,
+                                                  gradients):
+            accumulate_updates.append((
+                accumulated_gradient,
+                accumulated_gradient + n_samples * gradient,
+            ))
+
+        # Parameter updates expect gradient of the error function
+        # with respect to each parameter. Temporary error function
+        # is linear with respect to the parameters and its gradient
+        # is exactly equal to the average accumulated gradient.
+        error_func = self.variables.error_func
+        self.variables.error_func = sum(
+            T.sum(parameter * accumulated_gradient / n_accumulated_samples)
+            for parameter, accumulated_gradient
+            in zip(parameters, accumulated_gradients)
+        )
+
+        try:
+            train_updates = self.init_train_updates()
+        finally:
+            self.variables.error_func = error_func
+
+        # Layers updates depend on the input data and they
+        # has been already triggered during the accumulation step.
+        train_updates = [
+            (variable, value) for variable, value in train_updates
+            if variable not in layer_states
+        ]
+        train_updates.append((n_accumulated_samples, asfloat(0)))
+
+        for accumulated_gradient in accumulated_gradients:
+            train_updates.append((
+                accumulated_gradient,
+                T.zeros_like(accumulated_gradient),
+            ))
+
+        self.methods.update(
+            predict=theano.function(
+                inputs=network_inputs,
+                outputs=self.variables.prediction_func,
+                name='algo:network/func:predict'
+            ),
+            train_epoch=theano.function(
+                inputs=network_inputs + [network_output],
+                outputs=self.variables.error_func,
+                updates=accumulate_updates + layer_updates,
+                name='algo:network/func:accumulate-gradients'
+            ),
+            apply_accumulated_gradients=theano.function(
+                inputs=[],
+                updates=train_updates,
+                name='algo:network/func:apply-accumulated-gradients'
+            ),
+            prediction_error=theano.function(
+                inputs=network_inputs + [network_output],
+                outputs=self.variables.validation_error_func,
+                name='algo:network/func:prediction-error'
+            )
+        )
+
+        if self.n_workers > 1:
+            self.methods.compute_gradients = theano.function(
+                inputs=network_inputs + [network_output],
+                outputs=[self.variables.error_func] + gradients,
+                updates=layer_updates,
+                name='algo:network/func:compute-gradients'
+            )
+
+    def train(self, input_train, target_train, *args, **kwargs):
+        """
+        Train neural network.
+        """
+        if self.n_workers == 1:
+            return super(MinibatchGradientDescent, self).train(
+                input_train, target_train, *args, **kwargs)
+
+        self.workers = DataParallelWorkers(self, n_workers=self.n_workers)
+        self.workers.start()
+
+        try:
+            return super(MinibatchGradientDescent, self).train(
+                input_train, target_train, *args, **kwargs)
+        finally:
+            self.workers.stop()
+            self.workers = None
 
     def train_epoch(self, input_train, target_train):
         """
@@ -487,19 +949,63 @@ class MinibatchGradientDescent(GradientDescent, MinibatchTrainingMixin):
         float
             Training error.
         """
-        errors = self.apply_batches(
-            function=self.methods.train_epoch,
-            input_data=input_train,
-            arguments=as_tuple(target_train),
+        train_batch = self.methods.train_epoch
 
-            description='Training batches',
-            show_error_output=True,
-        )
-        return average_batch_errors(
-            errors,
-            n_samples=count_samples(input_train),
-            batch_size=self.batch_size,
-        )
+        if self.workers is not None:
+            train_batch = self.workers.accumulate
+
+        if self.accumulates_gradients:
+            train_batch = accumulate_gradients(
+                accumulate=train_batch,
+                apply_updates=self.methods.apply_accumulated_gradients,
+                accumulate_steps=self.accumulate_steps,
+            )
+
+        if self.batch_sampler is None:
+            errors = self.apply_batches(
+                function=train_batch,
+                input_data=input_train,
+                arguments=as_tuple(target_train),
+
+                description='Training batches',
+                show_error_output=True,
+            )
+            error = average_batch_errors(
+                errors,
+                n_samples=count_samples(input_train),
+                batch_size=self.batch_size,
+            )
+
+        else:
+            batch_sizes = []
+
+            def train_sampled_batch(*arguments):
+                # Sampler changes order of the mini-batches, which
+                # means that the last one might not be the smallest
+                batch_sizes.append(count_samples(arguments[0]))
+                return train_batch(*arguments)
+
+            errors = self.apply_batches(
+                function=train_sampled_batch,
+                input_data=input_train,
+                arguments=as_tuple(target_train),
+                batches=self.batch_sampler.iter_batches(
+                    input_train, target_train, self.batch_size),
+
+                description='Training batches',
+                show_error_output=True,
+            )
+            error = np.average(errors, weights=batch_sizes)
+
+        if self.accumulates_gradients:
+            n_accumulated_samples = self.variables.n_accumulated_samples
+
+            # Apply gradients accumulated from the last few
+            # mini-batches that haven't been used yet.
+            if n_accumulated_samples.get_value() > 0:
+                self.methods.apply_accumulated_gradients()
+
+        return error
 
     def prediction_error(self, input_data, target_data):
         """
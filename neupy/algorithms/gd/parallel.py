@@ -0,0 +1,343 @@
+from __future__ import division
+
+import traceback
+import multiprocessing
+
+import theano
+import numpy as np
+
+from neupy.utils import asfloat
+
+
+__all__ = ('DataParallelWorkers',)
+
+
+def create_shared_buffer(arrays):
+    """
+    Allocate buffer in the shared memory that has enough space
+    to store all specified arrays one after another.
+
+    Parameters
+    ----------
+    arrays : list of array-like
+
+    Returns
+    -------
+    multiprocessing.RawArray
+    """
+    typecode = 'f' if theano.config.floatX == 'float32' else 'd'
+    n_elements = sum(np.size(array) for array in arrays)
+    # Buffer can't be empty, otherwise numpy fails to create view
+    return multiprocessing.RawArray(typecode, max(n_elements, 1))
+
+
+def iter_buffer_views(buffer, shapes):
+    """
+    Iterate over NumPy views to the shared memory buffer.
+
+    Parameters
+    ----------
+    buffer : multiprocessing.RawArray
+
+    shapes : list of tuples
+        Shapes of the arrays stored in the buffer.
+
+    Yields
+    ------
+    array-like
+        Array that shares memory with the buffer.
+    """
+    flat_array = np.frombuffer(buffer, dtype=theano.config.floatX)
+    start = 0
+
+    for shape in shapes:
+        end = start + int(np.prod(shape))
+        yield flat_array[start:end].reshape(shape)
+        start = end
+
+
+def write_to_buffer(buffer, arrays):
+    shapes = [np.shape(array) for array in arrays]
+
+    for view, array in zip(iter_buffer_views(buffer, shapes), arrays):
+        view[...] = array
+
+
+def read_from_buffer(buffer, shapes):
+    return list(iter_buffer_views(buffer, shapes))
+
+
+def split_into_parts(n_samples, n_parts):
+    """
+    Split samples into almost equal parts.
+
+    Parameters
+    ----------
+    n_samples : int
+    n_parts : int
+
+    Returns
+    -------
+    list of slices
+        Slices for all non-empty parts.
+    """
+    part_sizes = [len(part) for part in np.array_split(
+        np.arange(n_samples), n_parts)]
+
+    slices, start = [], 0
+    for part_size in part_sizes:
+        if part_size > 0:
+            slices.append(slice(start, start + part_size))
+            start += part_size
+
+    return slices
+
+
+def run_worker(connection, compute_gradients, variables, states,
+               shared_variables, shared_gradients, shared_states):
+    """
+    Worker's main loop. Worker waits for the data, loads the latest
+    values of the parameters from the shared memory, computes gradients
+    and puts them back into the shared memory.
+    """
+    variable_shapes = [
+        variable.get_value(borrow=True).shape for variable in variables]
+
+    while True:
+        arguments = connection.recv()
+
+        if arguments is None:
+            break
+
+        try:
+            variable_values = read_from_buffer(
+                shared_variables, variable_shapes)
+
+            for variable, value in zip(variables, variable_values):
+                variable.set_value(value)
+
+            outputs = compute_gradients(*arguments)
+            error, gradients = outputs[0], outputs[1:]
+
+            n_samples = arguments[0].shape[0]
+            write_to_buffer(shared_gradients, [
+                n_samples * gradient for gradient in gradients])
+            write_to_buffer(shared_states, [
+                state.get_value() for state in states])
+
+            connection.send((float(error), None))
+
+        except Exception:
+            connection.send((None, traceback.format_exc()))
+
+    connection.close()
+
+
+class DataParallelWorkers(object):
+    """
+    Pool of processes that compute gradients for the different
+    parts of the mini-batch. Each worker holds replica of the
+    network. Parameters and gradients are exchanged through the
+    shared memory.
+
+    Parameters
+    ----------
+    network : MinibatchGradientDescent instance
+        Network with compiled ``compute_gradients`` function and
+        initialized variables for the gradient accumulation.
+
+    n_workers : int
+        Number of worker processes.
+
+    Attributes
+    ----------
+    processes : list
+        List of the worker processes. List is empty in case if
+        workers haven't been started.
+    """
+    # Number of seconds between checks whether worker
+    # process is still alive while main process waits for it
+    poll_interval = 0.1
+
+    def __init__(self, network, n_workers):
+        self.network = network
+        self.n_workers = n_workers
+
+        self.parameters = network.variables.accumulated_parameters
+        self.states = network.variables.layer_states
+        self.accumulated_gradients = network.variables.accumulated_gradients
+
+        self.processes = []
+        self.connections = []
+        self.shared_gradients = []
+        self.shared_states = []
+
+    def start(self):
+        """
+        Start worker processes.
+        """
+        parameters, states = self.parameters, self.states
+        variables = parameters + states
+
+        self.shared_variables = create_shared_buffer(
+            [variable.get_value() for variable in variables])
+
+        for _ in range(self.n_workers):
+            shared_gradients = create_shared_buffer(
+                [parameter.get_value() for parameter in parameters])
+            shared_states = create_shared_buffer(
+                [state.get_value() for state in states])
+
+            parent_connection, child_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=run_worker, args=(
+                child_connection,
+                self.network.methods.compute_gradients,
+                variables, states,
+                self.shared_variables, shared_gradients, shared_states,
+            ))
+            process.daemon = True
+            process.start()
+
+            # Only worker should have this end of the pipe, otherwise
+            # pipe won't be closed when worker terminates
+            child_connection.close()
+
+            self.processes.append(process)
+            self.connections.append(parent_connection)
+            self.shared_gradients.append(shared_gradients)
+            self.shared_states.append(shared_states)
+
+    def stop(self):
+        """
+        Stop all worker processes.
+        """
+        for connection in self.connections:
+            try:
+                connection.send(None)
+
+            except (IOError, OSError):
+                # Terminated workers cannot receive stop signal
+                pass
+
+            connection.close()
+
+        for process in self.processes:
+            process.join()
+
+        self.processes = []
+        self.connections = []
+        self.shared_gradients = []
+        self.shared_states = []
+
+    def receive(self, connection, process):
+        """
+        Waits for the result from the worker process.
+
+        Returns
+        -------
+        tuple
+            Error and traceback. Traceback is equal to ``None`` in
+            case if worker computed gradients successfully.
+        """
+        # Process can be killed by the signal, for instance,
+        # by the OOM killer, and it won't send anything back
+        while process.is_alive() or connection.poll():
+            if not connection.poll(self.poll_interval):
+                continue
+
+            try:
+                return connection.recv()
+            except EOFError:
+                break
+
+        process.join()
+        return None, ("Worker process has been terminated "
+                      "with exit code {}".format(process.exitcode))
+
+    def accumulate(self, *arguments):
+        """
+        Compute gradients for the mini-batch in parallel and add them
+        to the accumulated gradients of the network.
+
+        Parameters
+        ----------
+        *arguments
+            Inputs and target for the mini-batch.
+
+        Returns
+        -------
+        float
+            Average error for the mini-batch.
+        """
+        if not self.processes:
+            raise RuntimeError("Workers haven't been started")
+
+        parameters, states = self.parameters, self.states
+        n_samples = arguments[0].shape[0]
+
+        write_to_buffer(self.shared_variables, [
+            variable.get_value() for variable in parameters + states])
+
+        batch_parts = split_into_parts(n_samples, self.n_workers)
+        active_workers = list(zip(
+            self.connections, self.processes, self.shared_gradients,
+            self.shared_states, batch_parts))
+
+        for connection, _, _, _, batch_part in active_workers:
+            try:
+                connection.send(
+                    [argument[batch_part] for argument in arguments])
+
+            except (IOError, OSError):
+                # Worker has been terminated and main process
+                # will find it out while waiting for the result
+                pass
+
+        total_error = 0
+        parameter_shapes = [
+            param.get_value(borrow=True).shape for param in parameters]
+        state_shapes = [state.get_value(borrow=True).shape for state in states]
+
+        gradients = [np.zeros(shape) for shape in parameter_shapes]
+        state_values = [np.zeros(shape) for shape in state_shapes]
+        worker_errors = []
+
+        for worker in active_workers:
+            (connection, process, shared_gradients,
+             shared_states, batch_part) = worker
+            error, worker_traceback = self.receive(connection, process)
+
+            if worker_traceback is not None:
+                worker_errors.append(worker_traceback)
+                continue
+
+            n_part_samples = batch_part.stop - batch_part.start
+            total_error += error * n_part_samples
+
+            part_gradients = read_from_buffer(
+                shared_gradients, parameter_shapes)
+            part_states = read_from_buffer(shared_states, state_shapes)
+
+            for gradient, part_gradient in zip(gradients, part_gradients):
+                gradient += part_gradient
+
+            for state_value, part_state in zip(state_values, part_states):
+                state_value += part_state * n_part_samples / n_samples
+
+        if worker_errors:
+            raise RuntimeError("Worker failed with exception:\n{}"
+                               "".format(worker_errors[0]))
+
+        for accumulated_gradient, gradient in zip(self.accumulated_gradients,
+                                                  gradients):
+            accumulated_gradient.set_value(
+                asfloat(accumulated_gradient.get_value() + gradient))
+
+        for state, state_value in zip(states, state_values):
+            state.set_value(state_value.astype(state.dtype))
+
+        n_accumulated_samples = self.network.variables.n_accumulated_samples
+        n_accumulated_samples.set_value(
+            n_accumulated_samples.get_value() + n_samples)
+
+        return total_error / n_samples
@@ -144,6 +144,8 @@ class IRPROPPlus(RPROP):
 
     {ConstructibleNetwork.error}
 
+    {ConstructibleNetwork.checkpoints}
+
     {BaseNetwork.show_epoch}
 
     {BaseNetwork.shuffle_data}
@@ -0,0 +1,135 @@
+import theano
+import theano.tensor as T
+from theano.gof.graph import inputs, io_toposort
+from theano.compile.ops import Shape, Shape_i
+from theano.tensor.subtensor import AdvancedSubtensor1
+
+
+__all__ = ('find_row_subtensors', 'sparse_gradient', 'make_sparse_updates')
+
+
+def find_row_subtensors(cost, parameter):
+    """
+    Find all places where rows of the parameter are used in
+    the cost function. For instance, ``Embedding`` layer uses
+    only rows associated with the input indeces.
+
+    Parameters
+    ----------
+    cost : Theano variable
+
+    parameter : Theano shared variable
+
+    Returns
+    -------
+    list or None
+        List of variables that select rows from the parameter.
+        Function returns ``None`` in case if parameter is used
+        in some other way in the cost function or if it's not
+        used at all.
+    """
+    subtensors = []
+
+    for node in io_toposort(inputs([cost]), [cost]):
+        if parameter not in node.inputs:
+            continue
+
+        # Shape of the parameter doesn't depend on its values
+        if isinstance(node.op, (Shape, Shape_i)):
+            continue
+
+        selects_rows = (
+            isinstance(node.op, AdvancedSubtensor1) and
+            node.inputs[0] is parameter and
+            node.inputs.count(parameter) == 1
+        )
+
+        if not selects_rows:
+            return None
+
+        subtensors.append(node.outputs[0])
+
+    return subtensors or None
+
+
+def sparse_gradient(cost, subtensors):
+    """
+    Compute gradient only for the rows that were
+    used in the cost function.
+
+    Parameters
+    ----------
+    cost : Theano variable
+
+    subtensors : list of Theano variables
+        Variables that select rows from the parameter.
+
+    Returns
+    -------
+    tuple
+        Tuple that contains vector with unique row indeces
+        and gradient for each of these rows. Gradients for the
+        rows that were selected multiple times are summed up.
+    """
+    gradients = T.grad(cost, wrt=subtensors)
+
+    parameter = subtensors[0].owner.inputs[0]
+    indices = T.concatenate([
+        subtensor.owner.inputs[1] for subtensor in subtensors])
+
+    rows, inverse_indices = T.extra_ops.Unique(return_inverse=True)(indices)
+    gradient = T.inc_subtensor(
+        T.zeros_like(parameter[rows])[inverse_indices],
+        T.concatenate(gradients, axis=0),
+    )
+
+    return rows, gradient
+
+
+def make_sparse_updates(updates, parameter, dense_gradient, rows, gradient):
+    """
+    Convert dense parameter updates into updates that change
+    only specified rows. Each variable that has the same shape as
+    the parameter, like momentum or moving average of the squared
+    gradient, also gets updated only for the specified rows.
+
+    Parameters
+    ----------
+    updates : list
+        Updates that depend on the ``dense_gradient`` variable.
+
+    parameter : Theano shared variable
+
+    dense_gradient : Theano variable
+        Variable that has been used as a parameter's gradient.
+
+    rows : Theano variable
+        Vector with unique row indeces.
+
+    gradient : Theano variable
+        Gradient for the rows.
+
+    Returns
+    -------
+    list
+        Updates for the specified rows.
+    """
+    parameter_shape = parameter.get_value(borrow=True).shape
+    row_variables = [
+        variable for variable, _ in updates
+        if variable.get_value(borrow=True).shape == parameter_shape]
+
+    replacements = {dense_gradient: gradient}
+    for variable in row_variables:
+        replacements[variable] = variable[rows]
+
+    sparse_updates = []
+    for variable, update in updates:
+        update = theano.clone(update, replace=replacements)
+
+        if variable in row_variables:
+            update = T.set_subtensor(variable[rows], update)
+
+        sparse_updates.append((variable, update))
+
+    return sparse_updates
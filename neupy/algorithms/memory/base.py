@@ -47,6 +47,28 @@ class DiscreteMemory(BaseSkeleton, Configurable):
             self.logs.warning("You can use `n_times` property only in "
                               "`async` mode.")
 
+    def get_training_state(self):
+        """
+        Returns information that's required in order to
+        restore memorized patterns.
+
+        Returns
+        -------
+        dict
+        """
+        return {'weight': self.weight}
+
+    def set_training_state(self, state):
+        """
+        Restores memorized patterns.
+
+        Parameters
+        ----------
+        state : dict
+            State returned from the ``get_training_state`` method.
+        """
+        self.weight = state['weight']
+
     def discrete_validation(self, matrix):
         """
         Validate discrete matrix.
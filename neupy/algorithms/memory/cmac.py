@@ -131,6 +131,32 @@ class CMAC(BaseNetwork):
 
         return errors / n_samples
 
+    def get_training_state(self):
+        state = super(CMAC, self).get_training_state()
+
+        coords = list(self.weight.keys())
+        values = [np.ravel(value) for value in self.weight.values()]
+        n_outputs = max([value.size for value in values] or [1])
+
+        # Memory is stored as two arrays, where each row
+        # has coordinates and value stored in memory cell
+        values = [np.broadcast_to(value, n_outputs) for value in values]
+        state.update(
+            weight_coords=np.array(coords, dtype=int),
+            weight_values=np.reshape(values, (len(values), n_outputs)),
+        )
+        return state
+
+    def set_training_state(self, state):
+        coords = state['weight_coords']
+        values = np.array(state['weight_values'])
+
+        self.weight = {
+            tuple(coord): value
+            for coord, value in zip(coords.tolist(), values)
+        }
+        super(CMAC, self).set_training_state(state)
+
     def prediction_error(self, input_data, target_data):
         predicted = self.predict(input_data)
         return np.mean(np.abs(predicted - target_data))
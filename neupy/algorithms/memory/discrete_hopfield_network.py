@@ -167,6 +167,15 @@ class DiscreteHopfieldNetwork(DiscreteMemory):
         np.fill_diagonal(self.weight, np.zeros(len(self.weight)))
         self.n_memorized_samples = n_rows_after_update
 
+    def get_training_state(self):
+        state = super(DiscreteHopfieldNetwork, self).get_training_state()
+        state['n_memorized_samples'] = self.n_memorized_samples
+        return state
+
+    def set_training_state(self, state):
+        self.n_memorized_samples = state['n_memorized_samples']
+        super(DiscreteHopfieldNetwork, self).set_training_state(state)
+
     def predict(self, input_data, n_times=None):
         self.discrete_validation(input_data)
         input_data = format_data(
@@ -106,6 +106,17 @@ class GRNN(LazyLearningMixin, BaseNetwork):
 
         LazyLearningMixin.train(self, input_train, target_train)
 
+    def get_training_state(self):
+        state = super(GRNN, self).get_training_state()
+        state.update(input_train=self.input_train,
+                     target_train=self.target_train)
+        return state
+
+    def set_training_state(self, state):
+        self.input_train = state['input_train']
+        self.target_train = state['target_train']
+        super(GRNN, self).set_training_state(state)
+
     def predict(self, input_data):
         """
         Make a prediction from the input data.
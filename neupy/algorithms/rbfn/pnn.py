@@ -134,6 +134,25 @@ class PNN(BaseNetwork, LazyLearningMixin, MinibatchTrainingMixin):
             row_comb_matrix[i, class_val_positions.ravel()] = 1
             class_ratios[i] = np.sum(class_val_positions)
 
+    def get_training_state(self):
+        state = super(PNN, self).get_training_state()
+        state.update(
+            input_train=self.input_train,
+            target_train=self.target_train,
+            classes=self.classes,
+            class_ratios=getattr(self, 'class_ratios', None),
+            row_comb_matrix=getattr(self, 'row_comb_matrix', None),
+        )
+        return state
+
+    def set_training_state(self, state):
+        self.input_train = state['input_train']
+        self.target_train = state['target_train']
+        self.classes = state['classes']
+        self.class_ratios = state['class_ratios']
+        self.row_comb_matrix = state['row_comb_matrix']
+        super(PNN, self).set_training_state(state)
+
     def predict_proba(self, input_data):
         """
         Predict probabilities for each class.
@@ -92,6 +92,15 @@ class RBFKMeans(StepSelectionBuiltIn, BaseNetwork):
 
         return classes
 
+    def get_training_state(self):
+        state = super(RBFKMeans, self).get_training_state()
+        state['centers'] = self.centers
+        return state
+
+    def set_training_state(self, state):
+        self.centers = state['centers']
+        super(RBFKMeans, self).set_training_state(state)
+
     def train_epoch(self, input_train, target_train):
         centers = self.centers
         old_centers = centers.copy()
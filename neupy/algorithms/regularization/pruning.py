@@ -0,0 +1,194 @@
+from collections import OrderedDict
+
+import numpy as np
+import theano
+
+from neupy.utils import asfloat
+from neupy.core.properties import ProperFractionProperty, IntProperty
+from .base import WeightUpdateConfigurable
+
+
+__all__ = ('MagnitudePruning',)
+
+
+def magnitude_mask(weight, sparsity):
+    """
+    Creates mask that excludes weights with the smallest
+    absolute values.
+
+    Parameters
+    ----------
+    weight : array-like
+
+    sparsity : float
+        Fraction of the weights that should be excluded.
+
+    Returns
+    -------
+    array-like
+        Mask with the same shape as the weight, that has zeros
+        for the excluded weights and ones for the others.
+    """
+    mask = np.ones(weight.size)
+    n_pruned = int(np.round(sparsity * weight.size))
+
+    if n_pruned > 0:
+        smallest = np.argpartition(np.abs(weight).ravel(), n_pruned - 1)
+        mask[smallest[:n_pruned]] = 0
+
+    return asfloat(mask.reshape(weight.shape))
+
+
+class MagnitudePruning(WeightUpdateConfigurable):
+    """
+    Magnitude pruning algorithm gradually sets weights with the
+    smallest absolute values to zero during the training. Pruned
+    weights are excluded with masks, which means that they stay
+    equal to zero after each update. Algorithm prunes only weights
+    that have at least two dimensions, like weights of the
+    ``Linear`` and ``Convolution`` layers. Biases won't be pruned.
+
+    Sparsity of each weight increases at the beginning of each
+    epoch from ``pruning_start`` to ``pruning_end`` epochs.
+
+    .. code-block:: python
+
+        progress = (epoch - pruning_start) / (pruning_end - pruning_start)
+        sparsity = target_sparsity * (1 - (1 - progress) ** 3)
+
+    .. raw:: html
+
+        <br>
+
+    Network quickly prunes redundant weights and has more time to
+    recover from pruning once there are only a few weights left.
+    Sparse weights can be used for inference with the
+    :class:`sparsify_for_inference <neupy.layers.sparsify_for_inference>`
+    function.
+
+    Parameters
+    ----------
+    target_sparsity : float
+        Fraction of the weights that will be pruned
+        by the ``pruning_end`` epoch. Defaults to ``0.9``.
+
+    pruning_start : int
+        Epoch at which pruning starts. Defaults to ``1``.
+
+    pruning_end : int
+        Epoch at which sparsity reaches ``target_sparsity``.
+        Training can continue after this epoch with fixed
+        masks. Defaults to ``10``.
+
+    Warns
+    -----
+    {WeightUpdateConfigurable.Warns}
+
+    Attributes
+    ----------
+    pruning_masks : OrderedDict
+        Weights and Theano shared variables with their masks.
+
+    Examples
+    --------
+    >>> from neupy import algorithms, layers
+    >>> bpnet = algorithms.Momentum(
+    ...     [
+    ...         layers.Input(784),
+    ...         layers.Relu(1000),
+    ...         layers.Softmax(10),
+    ...     ],
+    ...     target_sparsity=0.9,
+    ...     pruning_end=20,
+    ...     addons=[algorithms.MagnitudePruning]
+    ... )
+    >>> bpnet.train(x_train, y_train, epochs=30)
+    >>> sparse_network = layers.sparsify_for_inference(bpnet)
+
+    See Also
+    --------
+    :network:`WeightDecay`
+    :network:`WeightElimination`
+
+    References
+    ----------
+    [1] M. Zhu, S. Gupta. To prune, or not to prune: exploring
+        the efficacy of pruning for model compression.
+        https://arxiv.org/abs/1710.01878
+    """
+    target_sparsity = ProperFractionProperty(default=0.9)
+    pruning_start = IntProperty(default=1, minval=1)
+    pruning_end = IntProperty(default=10, minval=1)
+
+    def __init__(self, *args, **kwargs):
+        super(MagnitudePruning, self).__init__(*args, **kwargs)
+
+        if self.pruning_end < self.pruning_start:
+            raise ValueError("Pruning cannot end before it starts. "
+                             "Start epoch: {}, end epoch: {}"
+                             "".format(self.pruning_start, self.pruning_end))
+
+    def init_variables(self):
+        self.pruning_masks = OrderedDict()
+        super(MagnitudePruning, self).init_variables()
+
+    def init_param_updates(self, layer, parameter):
+        updates = super(MagnitudePruning, self).init_param_updates(
+            layer, parameter)
+
+        if parameter.ndim < 2:
+            return updates
+
+        if parameter not in self.pruning_masks:
+            value = parameter.get_value()
+            self.pruning_masks[parameter] = theano.shared(
+                value=asfloat(np.ones(value.shape)),
+                name='magnitude-pruning/mask:{}'.format(parameter.name))
+
+        mask = self.pruning_masks[parameter]
+
+        updates_mapper = dict(updates)
+        updates_mapper[parameter] *= mask
+
+        return list(updates_mapper.items())
+
+    def sparsity(self, epoch):
+        """
+        Returns fraction of the pruned weights for the epoch.
+
+        Parameters
+        ----------
+        epoch : int
+
+        Returns
+        -------
+        float
+        """
+        if epoch < self.pruning_start:
+            return 0.
+
+        if epoch >= self.pruning_end:
+            return self.target_sparsity
+
+        progress = (
+            float(epoch - self.pruning_start) /
+            (self.pruning_end - self.pruning_start)
+        )
+        return self.target_sparsity * (1 - (1 - progress) ** 3)
+
+    def on_epoch_start_update(self, epoch):
+        super(MagnitudePruning, self).on_epoch_start_update(epoch)
+
+        if not self.pruning_start <= epoch <= self.pruning_end:
+            return
+
+        sparsity = self.sparsity(epoch)
+
+        for parameter, mask in self.pruning_masks.items():
+            # Weights that have been pruned are equal to zero,
+            # which means that they will be pruned again
+            weight = parameter.get_value() * mask.get_value()
+            new_mask = magnitude_mask(weight, sparsity)
+
+            mask.set_value(new_mask)
+            parameter.set_value(weight * new_mask)
@@ -56,7 +56,7 @@ def check_if_gating_layer_valid(gating_layer, n_layers_to_combine):
             "".format(output_shape, n_layers_to_combine))
 
 
-def mixture_of_experts(networks, gating_layer=None):
+def mixture_of_experts(networks, gating_layer=None, top_k=None):
     """
     Generates mixture of experts architecture from the set of
     networks that has the same input and output shapes.
@@ -87,6 +87,14 @@ def mixture_of_experts(networks, gating_layer=None):
         Output from the gating layer should be 1D and equal to
         the number of networks.
 
+    top_k : int or None
+        Number of networks that will be used per each sample. Samples
+        are dispatched only to the ``top_k`` networks with the largest
+        weights from the gating layer, so each network computes output
+        only for the part of the mini-batch. Value ``None`` means
+        that all networks contribute to each prediction.
+        Defaults to ``None``.
+
     Raises
     ------
     ValueError
@@ -150,4 +158,4 @@ def mixture_of_experts(networks, gating_layer=None):
         # Note: Gating network should be specified
         # as a first parameter.
         [gating_layer] + connections,
-        layers.GatedAverage())
+        layers.GatedAverage(top_k=top_k))
@@ -12,3 +12,6 @@ from .recurrent import *
 
 from .connections import join
 from .utils import count_parameters
+from .inference import *
+from .quantization import *
+from .sparse import *
@@ -4,7 +4,7 @@ from neupy import init
 from neupy.utils import asfloat, as_tuple
 from neupy.core.properties import (NumberProperty, TypedListProperty,
                                    ParameterProperty, IntProperty)
-from .utils import dimshuffle
+from .utils import dimshuffle, dot
 from .base import ParameterBasedLayer
 
 
@@ -55,7 +55,7 @@ class ActivationLayer(ParameterBasedLayer):
 
     def output(self, input_value):
         if self.size is not None:
-            input_value = T.dot(input_value, self.weight)
+            input_value = dot(input_value, self.weight)
 
             if self.bias is not None:
                 input_value += self.bias
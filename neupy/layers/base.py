@@ -123,10 +123,12 @@ class BaseLayer(BaseConnection, Configurable):
         self.name = generate_layer_name(layer=self)
         self.input_shape_ = None
 
-        self.graph.add_layer(self)
-
         Configurable.__init__(self, **options)
 
+        # Layer should be added after the configuration, because
+        # name can be specified in the options
+        self.graph.add_layer(self)
+
     def validate(self, input_shape):
         """
         Validate input shape value before assigning it.
@@ -1,3 +1,4 @@
 from .graph import *
 from .base import *
 from .utils import *
+from .checkpoints import *
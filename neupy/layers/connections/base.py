@@ -1,12 +1,14 @@
 import copy
 from itertools import product
+from collections import OrderedDict
 from contextlib import contextmanager
 
 import six
 import theano
+import numpy as np
 
 from neupy.layers.utils import preformat_layer_shape, create_input_variable
-from neupy.utils import as_tuple
+from neupy.utils import as_tuple, asfloat
 from .utils import join, is_sequential
 from .graph import LayerGraph
 from .inline import InlineConnection
@@ -33,7 +35,8 @@ def create_input_variables(input_layers):
     for input_layer in input_layers:
         variable = create_input_variable(
             input_layer.input_shape,
-            name="layer:{}/var:input".format(input_layer.name))
+            name="layer:{}/var:input".format(input_layer.name),
+            sparse=getattr(input_layer, 'sparse', False))
         inputs.append(variable)
 
     return inputs
@@ -128,13 +131,19 @@ class BaseConnection(InlineConnection):
         """
 
     @contextmanager
-    def disable_training_state(self):
+    def disable_training_state(self, training_state=False):
         """
-        Disable connection's training state
+        Disable connection's training state. Other state can be
+        specified with the ``training_state`` argument. Previous
+        state will be restored on exit.
         """
-        self.training_state = False
-        yield
-        self.training_state = True
+        training_state_before = self.training_state
+        self.training_state = training_state
+
+        try:
+            yield
+        finally:
+            self.training_state = training_state_before
 
     def compile(self, *inputs):
         """
@@ -166,53 +175,38 @@ def make_common_graph(left_layer, right_layer):
     LayerGraph instance
         Graph that contains both layers and their connections.
     """
-    graph = LayerGraph.merge(left_layer.graph, right_layer.graph)
+    graph = left_layer.graph
+    right_graph = right_layer.graph
+
+    if graph is right_graph:
+        return graph
+
+    # All layers from the left graph will point to the common
+    # graph, which means that we can extend left graph instead of
+    # copying it. It makes sequential graph construction faster.
+    graph.add_graph(right_graph)
 
-    for layer in graph.forward_graph.keys():
+    for layer in right_graph.forward_graph:
         layer.graph = graph
 
     return graph
 
 
-def topological_sort(graph):
+def clean_compiled_functions(connection):
     """
-    Repeatedly go through all of the nodes in the graph, moving each of
-    the nodes that has all its edges resolved, onto a sequence that
-    forms our sorted graph. A node has all of its edges resolved and
-    can be moved once all the nodes its edges point to, have been moved
-    from the unsorted graph onto the sorted one.
+    Removes functions that have been compiled for the connection
+    and for the connections that it combines in parallel.
 
     Parameters
     ----------
-    graph : dict
-        Dictionary that has graph structure.
-
-    Raises
-    ------
-    RuntimeError
-        If graph has cycles.
-
-    Returns
-    -------
-    list
-        List of nodes sorted in topological order.
+    connection : layer or connection
     """
-    sorted_nodes = []
-    graph_unsorted = graph.copy()
-
-    while graph_unsorted:
-        acyclic = False
-
-        for node, edges in list(graph_unsorted.items()):
-            if all(edge not in graph_unsorted for edge in edges):
-                acyclic = True
-                del graph_unsorted[node]
-                sorted_nodes.append(node)
-
-        if not acyclic:
-            raise RuntimeError("A cyclic dependency occurred")
+    if isinstance(connection, ParallelConnection):
+        for subconnection in connection.connections:
+            clean_compiled_functions(subconnection)
 
-    return sorted_nodes
+    elif isinstance(connection, LayerConnection):
+        connection.compiled_functions = {}
 
 
 class ParallelConnection(BaseConnection):
@@ -330,20 +324,25 @@ class ParallelConnection(BaseConnection):
         return outputs
 
     @contextmanager
-    def disable_training_state(self):
+    def disable_training_state(self, training_state=False):
         """
         Disable training state for all layers in all
-        connections.
+        connections. Other state can be specified with the
+        ``training_state`` argument. Previous states will be
+        restored on exit.
         """
-        for connection in self.connections:
-            for layer in connection:
-                layer.training_state = False
+        layers = [layer for connection in self.connections
+                  for layer in connection]
+        training_states_before = [layer.training_state for layer in layers]
 
-        yield
+        for layer in layers:
+            layer.training_state = training_state
 
-        for connection in self.connections:
-            for layer in connection:
-                layer.training_state = True
+        try:
+            yield
+        finally:
+            for layer, state in zip(layers, training_states_before):
+                layer.training_state = state
 
     def __iter__(self):
         for connection in self.connections:
@@ -403,13 +402,40 @@ class LayerConnection(BaseConnection):
 
         self.full_graph.connect_layers(left.output_layers, right.input_layers)
 
+        # Layers have been added to the graph of the left and right
+        # connections and functions compiled for them can be outdated
+        clean_compiled_functions(left)
+        clean_compiled_functions(right)
+
         self.input_layers = self.left.input_layers
         self.output_layers = self.right.output_layers
 
-        # Generates subgraph that contains only connections
-        # between specified input and output layers
-        self.graph = self.full_graph.subgraph(
-            self.input_layers, self.output_layers)
+        # Subgraph will be generated only when it's needed. It
+        # helps to avoid extra work for intermediate connections
+        # that appear when multiple layers are joined together.
+        self.graph = None
+
+    @property
+    def graph(self):
+        """
+        Subgraph that contains only connections between
+        connection's input and output layers.
+        """
+        if self.cached_graph is None:
+            self.cached_graph = self.full_graph.subgraph(
+                self.input_layers, self.output_layers)
+        return self.cached_graph
+
+    @graph.setter
+    def graph(self, graph):
+        self.cached_graph = graph
+
+        # Compiled functions that return outputs from the layers.
+        # Keys are defined by the input and output layers, and
+        # by the training state. Functions compiled for the
+        # previous graph could use layers that are not in the
+        # new graph anymore.
+        self.compiled_functions = {}
 
     @property
     def input_shape(self):
@@ -615,25 +641,158 @@ class LayerConnection(BaseConnection):
         """
         return self.graph.find_layer_by_name(layer_name)
 
+    def compile_layer_outputs(self, layers, training_state=False):
+        """
+        Compile Theano function that returns outputs from the
+        specified layers. Outputs will be computed in a single
+        forward pass. Compiled functions are cached, so that
+        the same function won't be compiled twice.
+
+        Parameters
+        ----------
+        layers : list
+            List of layer instances and layer names.
+
+        training_state : bool
+            Defines whether layers should produce outputs
+            in the training state. For instance, dropout can be
+            applied only in case if training state is enabled.
+            Defaults to ``False``.
+
+        Raises
+        ------
+        ValueError
+            In case if layer doesn't appear in the connection.
+
+        Returns
+        -------
+        callable object
+            Function accepts one input per each input layer of the
+            connection and returns list of outputs from the layers.
+        """
+        layers = clean_layer_references(self.graph, layers)
+
+        for layer in layers:
+            if layer not in self.graph.forward_graph:
+                raise ValueError("The `{}` layer doesn't appear "
+                                 "in the connection".format(layer))
+
+        key = (tuple(self.input_layers), tuple(layers), training_state)
+
+        if key not in self.compiled_functions:
+            inputs = create_input_variables(self.input_layers)
+            input_values = dict(zip(self.input_layers, inputs))
+
+            with self.disable_training_state(training_state):
+                outputs = self.graph.propagate_forward(input_values, layers)
+
+            if len(layers) == 1:
+                outputs = [outputs]
+
+            self.compiled_functions[key] = theano.function(
+                inputs, outputs, name='connection/func:layer-outputs')
+
+        return self.compiled_functions[key]
+
+    def layer_outputs(self, input_data, layers, batch_size=None,
+                      training_state=False):
+        """
+        Propagate input data through the connection and return
+        outputs from the specified layers. Outputs from all layers
+        will be computed in a single forward pass.
+
+        Parameters
+        ----------
+        input_data : array-like or list of array-like
+            Input per each input layer of the connection.
+
+        layers : list
+            List of layer instances and layer names.
+
+        batch_size : int or None
+            Number of samples that will be propagated through
+            the network at the same time. Large batches might not
+            fit in memory. Value ``None`` means that all samples
+            will be propagated at once. Defaults to ``None``.
+
+        training_state : bool
+            Defines whether layers should produce outputs
+            in the training state. Defaults to ``False``.
+
+        Returns
+        -------
+        OrderedDict
+            Layer names and outputs from these layers.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from neupy import layers
+        >>>
+        >>> connection = layers.join(
+        ...     layers.Input(10),
+        ...     layers.Relu(5, name='embedding'),
+        ...     layers.Softmax(2, name='prediction'),
+        ... )
+        >>> x = np.random.random((1000, 10))
+        >>> outputs = connection.layer_outputs(
+        ...     x, ['embedding', 'prediction'], batch_size=100)
+        >>> outputs['embedding'].shape
+        (1000, 5)
+        """
+        layers = clean_layer_references(self.graph, layers)
+        compute_outputs = self.compile_layer_outputs(layers, training_state)
+
+        if not isinstance(input_data, (list, tuple)):
+            input_data = [input_data]
+
+        input_data = [asfloat(data) for data in input_data]
+        n_samples = input_data[0].shape[0]
+
+        if batch_size is None or n_samples == 0:
+            batch_size = max(n_samples, 1)
+
+        outputs = [[] for _ in layers]
+
+        # Function will be triggered at least once, even
+        # if there are no samples in the input data
+        for start in range(0, max(n_samples, 1), batch_size):
+            batch = slice(start, start + batch_size)
+            batch_outputs = compute_outputs(
+                *[data[batch] for data in input_data])
+
+            for layer_outputs, batch_output in zip(outputs, batch_outputs):
+                layer_outputs.append(batch_output)
+
+        return OrderedDict(
+            (layer.name, np.concatenate(layer_outputs, axis=0))
+            for layer, layer_outputs in zip(layers, outputs))
+
     @contextmanager
-    def disable_training_state(self):
+    def disable_training_state(self, training_state=False):
         """
         Disable training state for all layers in the
-        connection.
+        connection. Other state can be specified with the
+        ``training_state`` argument. Previous states will be
+        restored on exit.
         """
-        for layer in self:
-            layer.training_state = False
+        layers = list(self)
+        training_states_before = [layer.training_state for layer in layers]
 
-        yield
+        for layer in layers:
+            layer.training_state = training_state
 
-        for layer in self:
-            layer.training_state = True
+        try:
+            yield
+        finally:
+            for layer, state in zip(layers, training_states_before):
+                layer.training_state = state
 
     def __len__(self):
         return len(self.graph.forward_graph)
 
     def __iter__(self):
-        for layer in topological_sort(self.graph.backward_graph):
+        for layer in self.graph.layers:
             yield layer
 
     def __repr__(self):
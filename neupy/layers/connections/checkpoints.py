@@ -0,0 +1,214 @@
+import six
+import theano
+from theano.compile import SharedVariable
+from theano.gof.graph import inputs as graph_inputs
+
+
+__all__ = ('split_into_segments', 'checkpointed_output')
+
+
+def split_into_segments(layers, checkpoints):
+    """
+    Split topologically sorted layers into segments.
+
+    Parameters
+    ----------
+    layers : list
+        Topologically sorted layers.
+
+    checkpoints : int or list
+        Integer defines number of layers per segment. List
+        should contain layers or layer names. Output from each
+        of the specified layers ends current segment.
+
+    Raises
+    ------
+    ValueError
+        In case if checkpoint layer cannot be found.
+
+    Returns
+    -------
+    list of lists
+
+    Examples
+    --------
+    >>> from neupy.layers.connections import split_into_segments
+    >>> split_into_segments([1, 2, 3, 4, 5], checkpoints=2)
+    [[1, 2], [3, 4], [5]]
+    """
+    if isinstance(checkpoints, int):
+        if checkpoints < 1:
+            raise ValueError("Number of layers per segment should be "
+                             "positive, got {}".format(checkpoints))
+
+        return [layers[i:i + checkpoints]
+                for i in range(0, len(layers), checkpoints)]
+
+    layer_names = [layer.name for layer in layers]
+    checkpoint_layers = []
+
+    for checkpoint in checkpoints:
+        if isinstance(checkpoint, six.string_types):
+            if checkpoint not in layer_names:
+                raise ValueError("Cannot find layer with name {!r}"
+                                 "".format(checkpoint))
+
+            checkpoint = layers[layer_names.index(checkpoint)]
+
+        if checkpoint not in layers:
+            raise ValueError("Layer `{}` doesn't appear in the "
+                             "network".format(checkpoint))
+
+        checkpoint_layers.append(checkpoint)
+
+    segments = [[]]
+    for layer in layers:
+        segments[-1].append(layer)
+
+        if layer in checkpoint_layers:
+            segments.append([])
+
+    return [segment for segment in segments if segment]
+
+
+def replace_in_layer_updates(layers, replacements):
+    """
+    Layers within segment and random streams have updates
+    that depend on the segment's inner variables. Function
+    makes them dependent on the variables from the outer graph.
+    """
+    for layer in layers:
+        layer.updates = [
+            (variable, theano.clone(update, replace=replacements))
+            for variable, update in layer.updates]
+
+
+def replace_in_default_updates(outputs, replacements):
+    for variable in graph_inputs(outputs):
+        default_update = getattr(variable, 'default_update', None)
+
+        if isinstance(variable, SharedVariable) and default_update:
+            variable.default_update = theano.clone(
+                default_update, replace=replacements)
+
+
+def segment_output(graph, segment, outputs, output_layers):
+    """
+    Propagate values through the segment. Only inputs and outputs
+    of the segment will be stored for the backward pass. Internal
+    activations will be recomputed during gradient computation.
+
+    Parameters
+    ----------
+    graph : LayerGraph instance
+
+    segment : list of layers
+
+    outputs : dict
+        Outputs from the layers that have been already computed.
+        Function adds outputs from the segment to this dictionary.
+
+    output_layers : list
+        Connection's output layers.
+    """
+    segment_inputs = []
+    segment_outputs = []
+
+    for layer in segment:
+        for input_layer in graph.backward_graph[layer]:
+            is_new_input = input_layer not in segment_inputs
+            if input_layer not in segment and is_new_input:
+                segment_inputs.append(input_layer)
+
+        next_layers = graph.forward_graph[layer]
+        used_outside = any(l not in segment for l in next_layers)
+
+        if layer in output_layers or used_outside:
+            segment_outputs.append(layer)
+
+    outer_values = [outputs[layer] for layer in segment_inputs]
+    inner_values = [value.type() for value in outer_values]
+    inner_outputs = dict(zip(segment_inputs, inner_values))
+
+    for layer in segment:
+        inputs = [inner_outputs[l] for l in graph.backward_graph[layer]]
+        inner_outputs[layer] = layer.output(*inputs)
+
+    replacements = dict(zip(inner_values, outer_values))
+    inner_outputs = [inner_outputs[layer] for layer in segment_outputs]
+
+    # Some layers, like residual connections, return their inputs
+    # without modifications. These outputs don't need to be computed
+    # inside of the segment and each output should be unique.
+    computed_outputs = []
+    for inner_output in inner_outputs:
+        if inner_output not in replacements:
+            if inner_output not in computed_outputs:
+                computed_outputs.append(inner_output)
+
+    replace_in_layer_updates(segment, replacements)
+    replace_in_default_updates(computed_outputs, replacements)
+
+    if computed_outputs:
+        # Gradient of the OpFromGraph ignores contribution from
+        # the other outputs in case if output is used in order to
+        # compute them. Copies make all outputs independent.
+        checkpoint = theano.OpFromGraph(
+            inner_values, [output.copy() for output in computed_outputs])
+        segment_values = checkpoint(*outer_values, return_list=True)
+        replacements.update(zip(computed_outputs, segment_values))
+
+    for layer, inner_output in zip(segment_outputs, inner_outputs):
+        outputs[layer] = replacements[inner_output]
+
+
+def checkpointed_output(connection, input_values, checkpoints):
+    """
+    Propagate input values through the network and store
+    activations only at the end of each segment. During
+    backpropagation, activations inside each segment will be
+    recomputed. It reduces amount of memory required in order
+    to train deep networks at the cost of one extra forward
+    pass per segment.
+
+    Parameters
+    ----------
+    connection : connection
+
+    input_values : list
+        Input values per each input layer of the connection.
+
+    checkpoints : int or list
+        Defines how network should be split into segments.
+        Integer defines number of layers per segment. List
+        should contain layers or layer names. Output from each
+        of the specified layers ends current segment.
+
+    Returns
+    -------
+    Theano variable or list of Theano variables
+        Output from the final layer/layers.
+    """
+    graph = connection.graph
+    output_layers = connection.output_layers
+    outputs = {}
+
+    for layer, value in zip(connection.input_layers, input_values):
+        outputs[layer] = layer.output(value)
+
+    layers = [layer for layer in connection if layer not in outputs]
+
+    for segment in split_into_segments(layers, checkpoints):
+        if len(segment) == 1:
+            layer = segment[0]
+            inputs = [outputs[l] for l in graph.backward_graph[layer]]
+            outputs[layer] = layer.output(*inputs)
+        else:
+            segment_output(graph, segment, outputs, output_layers)
+
+    results = [outputs[layer] for layer in output_layers]
+
+    if len(results) == 1:
+        return results[0]
+
+    return results
@@ -21,7 +21,7 @@ def filter_list(iterable, include_values):
     iterable : list
         List that needs to be filtered.
 
-    include_values : list, tuple
+    include_values : list, tuple or set
         List of values that needs to be included in the
         filtered list. Other values that hasn't been
         defined in the list will be excluded from the
@@ -32,13 +32,7 @@ def filter_list(iterable, include_values):
     list
         Filtered list.
     """
-    filtered_list = []
-
-    for value in iterable:
-        if value in include_values:
-            filtered_list.append(value)
-
-    return filtered_list
+    return [value for value in iterable if value in include_values]
 
 
 def filter_dict(dictionary, include_keys):
@@ -60,6 +54,7 @@ def filter_dict(dictionary, include_keys):
     dict
     """
     filtered_dict = OrderedDict()
+    include_keys = set(include_keys)
 
     for key, value in dictionary.items():
         if key in include_keys:
@@ -89,7 +84,7 @@ def merge_dicts_with_list(first_dict, second_dict):
     for key, value in first_dict.items():
         # To make sure that we copied lists inside of the
         # dictionary, but didn't copied values inside of the list
-        common_dict[key] = copy.copy(value)
+        common_dict[key] = list(value)
 
     for key, values in second_dict.items():
         if key in common_dict:
@@ -97,7 +92,7 @@ def merge_dicts_with_list(first_dict, second_dict):
                 if value not in common_dict[key]:
                     common_dict[key].append(value)
         else:
-            common_dict[key] = copy.copy(values)
+            common_dict[key] = list(values)
 
     return common_dict
 
@@ -144,6 +139,152 @@ def is_cyclic(graph):
     return any(visit(vertex) for vertex in graph)
 
 
+def is_reachable(graph, from_vertex, to_vertex):
+    """
+    Check if there is a path between two vertices in the graph.
+    Function visits only vertices that can be reached from
+    the ``from_vertex``.
+
+    Parameters
+    ----------
+    graph : dict
+        must be represented as a dictionary mapping vertices to
+        iterables of neighbouring vertices.
+
+    from_vertex : object
+    to_vertex : object
+
+    Returns
+    -------
+    bool
+
+    Examples
+    --------
+    >>> is_reachable({1: (2,), 2: (3,), 3: ()}, 1, 3)
+    True
+    >>> is_reachable({1: (2,), 2: (3,), 3: ()}, 3, 1)
+    False
+    """
+    visited = set([from_vertex])
+    vertices = [from_vertex]
+
+    while vertices:
+        vertex = vertices.pop()
+
+        if vertex is to_vertex:
+            return True
+
+        for neighbour in graph.get(vertex, ()):
+            if neighbour not in visited:
+                visited.add(neighbour)
+                vertices.append(neighbour)
+
+    return False
+
+
+def topological_sort(graph):
+    """
+    Repeatedly go through all of the nodes in the graph, moving each of
+    the nodes that has all its edges resolved, onto a sequence that
+    forms our sorted graph. A node has all of its edges resolved and
+    can be moved once all the nodes its edges point to, have been moved
+    from the unsorted graph onto the sorted one.
+
+    Parameters
+    ----------
+    graph : dict
+        Dictionary that has graph structure.
+
+    Raises
+    ------
+    RuntimeError
+        If graph has cycles.
+
+    Returns
+    -------
+    list
+        List of nodes sorted in topological order.
+    """
+    sorted_nodes = []
+    graph_unsorted = graph.copy()
+
+    while graph_unsorted:
+        acyclic = False
+
+        for node, edges in list(graph_unsorted.items()):
+            if all(edge not in graph_unsorted for edge in edges):
+                acyclic = True
+                del graph_unsorted[node]
+                sorted_nodes.append(node)
+
+        if not acyclic:
+            raise RuntimeError("A cyclic dependency occurred")
+
+    return sorted_nodes
+
+
+def sort_reachable_vertices(graph, from_vertices):
+    """
+    Find all vertices that can be reached from the specified
+    vertices and sort them in topological order. Function visits
+    each vertex only once, so the number of paths between
+    vertices doesn't affect its speed.
+
+    Parameters
+    ----------
+    graph : dict
+        must be represented as a dictionary mapping vertices to
+        iterables of neighbouring vertices.
+
+    from_vertices : list
+        Vertices from which search starts. They will be
+        included in the output.
+
+    Returns
+    -------
+    list
+
+    Examples
+    --------
+    >>> graph = {1: [2, 3], 2: [4], 3: [4], 4: [], 5: [4]}
+    >>> sort_reachable_vertices(graph, [1])
+    [1, 3, 2, 4]
+    """
+    observed_vertices = set()
+    sorted_vertices = []
+
+    for from_vertex in from_vertices:
+        if from_vertex in observed_vertices:
+            continue
+
+        observed_vertices.add(from_vertex)
+        stack = [(from_vertex, iter(graph[from_vertex]))]
+
+        while stack:
+            vertex, neighbours = stack[-1]
+
+            for neighbour in neighbours:
+                if neighbour not in observed_vertices:
+                    observed_vertices.add(neighbour)
+                    stack.append((neighbour, iter(graph[neighbour])))
+                    break
+            else:
+                # Vertex added only after all of its
+                # neighbours have been added
+                stack.pop()
+                sorted_vertices.append(vertex)
+
+    sorted_vertices.reverse()
+    return sorted_vertices
+
+
+# Maps layer's output method to the flag that defines whether
+# method accepts only one input. Inspection of the method's
+# signature is quite slow and result is the same for all layers
+# that share the same output method.
+one_input_layers_cache = {}
+
+
 def does_layer_expect_one_input(layer):
     """
     Check whether layer can except only one input layer.
@@ -171,14 +312,18 @@ def does_layer_expect_one_input(layer):
         raise ValueError("Layer has an `output` property, "
                          "but it not a method")
 
-    arginfo = inspect.getargspec(layer.output)
+    output_method = layer.output.__func__
 
-    if arginfo.varargs is not None:
-        return False
+    if output_method not in one_input_layers_cache:
+        arginfo = inspect.getargspec(output_method)
+
+        # In case if layer expects fixed number of input layers
+        n_args = len(arginfo.args) - 1  # Ignore `self` argument
+        expect_one_input = arginfo.varargs is None and n_args == 1
+
+        one_input_layers_cache[output_method] = expect_one_input
 
-    # In case if layer expects fixed number of input layers
-    n_args = len(arginfo.args) - 1  # Ignore `self` argument
-    return n_args == 1
+    return one_input_layers_cache[output_method]
 
 
 class LayerGraph(object):
@@ -194,6 +339,14 @@ class LayerGraph(object):
     ------
     LayerConnectionError
         If graph cannot connect layers.
+
+    Notes
+    -----
+    Graph caches list of layers sorted in topological order,
+    input and output layers. Cache is invalidated every time
+    graph changes with ``add_layer`` or ``add_connection`` methods,
+    which means that graph shouldn't be modified directly with
+    ``forward_graph`` and ``backward_graph`` attributes.
     """
     def __init__(self, forward_graph=None, backward_graph=None):
         if forward_graph is None:
@@ -205,6 +358,17 @@ class LayerGraph(object):
         self.forward_graph = forward_graph
         self.backward_graph = backward_graph
 
+        self.cached_layers_by_name = None
+        self.clean_cache()
+
+    def clean_cache(self):
+        """
+        Remove cached information about graph's structure.
+        """
+        self.cached_layers = None
+        self.cached_input_layers = None
+        self.cached_output_layers = None
+
     @classmethod
     def merge(cls, left_graph, right_graph):
         """
@@ -231,6 +395,35 @@ class LayerGraph(object):
         )
         return cls(forward_graph, backward_graph)
 
+    def add_graph(self, graph):
+        """
+        Add layers and connections from the other graph
+        into this graph.
+
+        Parameters
+        ----------
+        graph : LayerGraph instance
+        """
+        for layer, next_layers in graph.forward_graph.items():
+            if layer not in self.forward_graph:
+                self.forward_graph[layer] = list(next_layers)
+                self.backward_graph[layer] = list(graph.backward_graph[layer])
+                continue
+
+            forward_connections = self.forward_graph[layer]
+            backward_connections = self.backward_graph[layer]
+
+            for next_layer in next_layers:
+                if next_layer not in forward_connections:
+                    forward_connections.append(next_layer)
+
+            for prev_layer in graph.backward_graph[layer]:
+                if prev_layer not in backward_connections:
+                    backward_connections.append(prev_layer)
+
+        self.cached_layers_by_name = None
+        self.clean_cache()
+
     def add_layer(self, layer):
         """
         Add new layer into the graph.
@@ -249,14 +442,15 @@ class LayerGraph(object):
         if layer in self.forward_graph:
             return False
 
-        for existed_layer in self.forward_graph:
-            if existed_layer.name == layer.name:
-                raise LayerConnectionError(
-                    "Cannot connect {} layer. Layer with name {!r} has been "
-                    "already defined in the graph.".format(layer, layer.name))
+        if layer.name in self.layers_by_name:
+            raise LayerConnectionError(
+                "Cannot connect {} layer. Layer with name {!r} has been "
+                "already defined in the graph.".format(layer, layer.name))
 
         self.forward_graph[layer] = []
         self.backward_graph[layer] = []
+        self.layers_by_name[layer.name] = layer
+        self.clean_cache()
 
         return True
 
@@ -295,15 +489,19 @@ class LayerGraph(object):
             # Layers have been already connected
             return False
 
-        forward_connections.append(to_layer)
-        backward_connections.append(from_layer)
-
-        if is_cyclic(self.forward_graph):
+        # Graph was acyclic before the new connection, which means
+        # that cycle can appear only in case if there is a path
+        # from the second layer to the first one.
+        if is_reachable(self.forward_graph, to_layer, from_layer):
             raise LayerConnectionError(
                 "Cannot connect layer `{}` to `{}`, because this "
                 "connection creates cycle in the graph."
                 "".format(from_layer, to_layer))
 
+        forward_connections.append(to_layer)
+        backward_connections.append(from_layer)
+        self.clean_cache()
+
         return True
 
     def connect_layers(self, from_layers, to_layers):
@@ -353,43 +551,53 @@ class LayerGraph(object):
         # Layer has an input shape which means that we can
         # propagate this information through the graph and
         # set up input shape for layers that don't have it.
-        layers = copy.copy(from_layers)
-        forward_graph = self.forward_graph
+        # Layers are sorted in topological order, which means
+        # that all previous layers will be processed before
+        # the current one.
+        layers = sort_reachable_vertices(self.forward_graph, from_layers)
+        reached_layers = set(layers)
 
         # We need to know whether all input layers
         # have defined input shape
-        all_inputs_has_shape = all(
-            layer.input_shape for layer in self.input_layers)
+        all_inputs_has_shape = None
 
-        while layers:
-            current_layer = layers.pop()
-            next_layers = forward_graph[current_layer]
+        for next_layer in layers:
+            prev_layers = [layer for layer in self.backward_graph[next_layer]
+                           if layer in reached_layers]
 
-            for next_layer in next_layers:
-                next_inp_shape = next_layer.input_shape
-                current_out_shape = current_layer.output_shape
-                expect_one_input = does_layer_expect_one_input(next_layer)
+            if not prev_layers:
+                continue
 
-                if not next_inp_shape and expect_one_input:
-                    next_layer.input_shape = current_out_shape
+            if not does_layer_expect_one_input(next_layer):
+                if all_inputs_has_shape is None:
+                    all_inputs_has_shape = all(
+                        layer.input_shape for layer in self.input_layers)
+
+                if not all_inputs_has_shape:
+                    continue
+
+                input_shapes = []
+                for incoming_layer in self.backward_graph[next_layer]:
+                    input_shapes.append(incoming_layer.output_shape)
+
+                # Some of the previous layers still don't have
+                # input shape. Layer's input shape will be defined
+                # when shape will be propagated to all previous layers.
+                if None not in input_shapes:
+                    next_layer.input_shape = input_shapes
                     next_layer.initialize()
 
-                elif not expect_one_input and all_inputs_has_shape:
-                    input_shapes = []
-                    for incoming_layer in self.backward_graph[next_layer]:
-                        input_shapes.append(incoming_layer.output_shape)
+                continue
 
-                    if None not in input_shapes:
-                        next_layer.input_shape = input_shapes
-                        next_layer.initialize()
+            for current_layer in prev_layers:
+                next_inp_shape = next_layer.input_shape
+                current_out_shape = current_layer.output_shape
 
-                    else:
-                        # Some of the previous layers still don't
-                        # have input shape. We can put layer at the
-                        # end of the stack and check it again at the end
-                        layers.insert(0, current_layer)
+                if not next_inp_shape:
+                    next_layer.input_shape = current_out_shape
+                    next_layer.initialize()
 
-                elif expect_one_input and next_inp_shape != current_out_shape:
+                elif next_inp_shape != current_out_shape:
                     raise LayerConnectionError(
                         "Cannot connect `{}` to the `{}`. Output shape "
                         "from one layer is equal to {} and input shape "
@@ -398,8 +606,6 @@ class LayerGraph(object):
                             current_out_shape, next_inp_shape,
                         ))
 
-            layers.extend(next_layers)
-
         return True
 
     def reverse(self):
@@ -427,7 +633,7 @@ class LayerGraph(object):
         if all(layer not in self.forward_graph for layer in output_layers):
             return LayerGraph()
 
-        observed_layers = []
+        observed_layers = set(output_layers)
         layers = copy.copy(output_layers)
 
         while layers:
@@ -436,10 +642,9 @@ class LayerGraph(object):
 
             for next_layer in next_layers:
                 if next_layer not in observed_layers:
+                    observed_layers.add(next_layer)
                     layers.append(next_layer)
 
-            observed_layers.append(current_layer)
-
         forward_subgraph = filter_dict(self.forward_graph,
                                        observed_layers)
         backward_subgraph = filter_dict(self.backward_graph,
@@ -491,6 +696,39 @@ class LayerGraph(object):
         subgraph = self.subgraph_for_input(input_layers)
         return subgraph.subgraph_for_output(output_layers)
 
+    @property
+    def layers_by_name(self):
+        """
+        Dictionary that maps layer names to the layers. Index
+        will be created only when it's used for the first time.
+
+        Returns
+        -------
+        dict
+        """
+        if self.cached_layers_by_name is None:
+            self.cached_layers_by_name = dict(
+                (layer.name, layer) for layer in self.forward_graph)
+        return self.cached_layers_by_name
+
+    @property
+    def layers(self):
+        """
+        List of layers sorted in topological order.
+
+        Raises
+        ------
+        RuntimeError
+            If graph has cycles.
+
+        Returns
+        -------
+        list
+        """
+        if self.cached_layers is None:
+            self.cached_layers = topological_sort(self.backward_graph)
+        return list(self.cached_layers)
+
     @property
     def input_layers(self):
         """
@@ -506,13 +744,12 @@ class LayerGraph(object):
         list
             List of input layers.
         """
-        input_layers = []
+        if self.cached_input_layers is None:
+            self.cached_input_layers = [
+                layer for layer, prev_layers in self.backward_graph.items()
+                if not prev_layers]
 
-        for layer, next_layers in self.backward_graph.items():
-            if not next_layers:
-                input_layers.append(layer)
-
-        return input_layers
+        return list(self.cached_input_layers)
 
     @property
     def output_layers(self):
@@ -529,13 +766,12 @@ class LayerGraph(object):
         list
             List of output layers.
         """
-        output_layers = []
-
-        for layer, next_layers in self.forward_graph.items():
-            if not next_layers:
-                output_layers.append(layer)
+        if self.cached_output_layers is None:
+            self.cached_output_layers = [
+                layer for layer, next_layers in self.forward_graph.items()
+                if not next_layers]
 
-        return output_layers
+        return list(self.cached_output_layers)
 
     def find_layer_by_name(self, layer_name):
         """
@@ -557,13 +793,21 @@ class LayerGraph(object):
         -------
         layer
         """
-        for layer in self.forward_graph:
-            if layer.name == layer_name:
-                return layer
+        layer = self.layers_by_name.get(layer_name)
+
+        if layer is None or layer.name != layer_name:
+            # Layer could have been renamed after it was added
+            # into the graph. In this case we need to update index.
+            self.cached_layers_by_name = None
+            layer = self.layers_by_name.get(layer_name)
+
+        if layer is None:
+            raise NameError(
+                "Cannot find layer with name {!r}".format(layer_name))
 
-        raise NameError("Cannot find layer with name {!r}".format(layer_name))
+        return layer
 
-    def propagate_forward(self, input_value):
+    def propagate_forward(self, input_value, output_layers=None):
         """
         Propagates input variable through the directed acyclic
         graph and returns output from the final layers.
@@ -581,11 +825,19 @@ class LayerGraph(object):
               be an instance of the ``layers.Input`` class. It can be
               any layer from the graph.
 
+        output_layers : list of layers or None
+            Layers from which outputs should be returned. Value
+            ``None`` means that function returns outputs from the
+            graph's output layers. Defaults to ``None``.
+
         Returns
         -------
         object
             Output from the final layer/layers.
         """
+        if output_layers is None:
+            output_layers = self.output_layers
+
         outputs = {}
 
         if isinstance(input_value, dict):
@@ -602,26 +854,29 @@ class LayerGraph(object):
             for input_layer in self.input_layers:
                 outputs[input_layer] = input_layer.output(input_value)
 
-        def output_from_layer(layer):
-            if layer in outputs:
-                return outputs[layer]
+        # Layers that were specified in the input can be
+        # located somewhere in the middle of the graph. In this
+        # case only part of the graph has to be computed.
+        required_layers = set()
+        layers = list(output_layers)
+
+        while layers:
+            layer = layers.pop()
 
-            input_layers = self.backward_graph[layer]
-            inputs = []
-            for input_layer in input_layers:
-                if input_layer in outputs:
-                    res = outputs[input_layer]
-                else:
-                    res = output_from_layer(input_layer)
-                    outputs[input_layer] = res
+            if layer in required_layers or layer in outputs:
+                continue
 
-                inputs.append(res)
+            required_layers.add(layer)
+            layers.extend(self.backward_graph[layer])
 
-            return layer.output(*inputs)
+        # Layers are sorted in topological order, which guarantees
+        # that outputs from all previous layers have been computed.
+        for layer in self.layers:
+            if layer in required_layers:
+                inputs = [outputs[l] for l in self.backward_graph[layer]]
+                outputs[layer] = layer.output(*inputs)
 
-        results = []
-        for output_layer in self.output_layers:
-            results.append(output_from_layer(output_layer))
+        results = [outputs[layer] for layer in output_layers]
 
         if len(results) == 1:
             results = results[0]
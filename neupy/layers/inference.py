@@ -0,0 +1,336 @@
+import copy
+from collections import OrderedDict
+
+import numpy as np
+import theano.tensor as T
+
+from neupy.utils import asfloat
+from .connections import LayerGraph, LayerConnection
+from .normalization import BatchNorm, find_opposite_axes
+from .stochastic import Dropout, GaussianNoise
+from .convolutions import Convolution
+from .activations import Linear
+
+
+__all__ = ('optimize_for_inference',)
+
+
+def is_shared_parameter(parameter):
+    return isinstance(parameter, T.sharedvar.SharedVariable)
+
+
+def can_fold_batch_norm(layer, batch_norm):
+    """
+    Check whether batch normalization layer can be
+    folded into the previous layer.
+
+    Parameters
+    ----------
+    layer : layer
+        Layer that precedes batch normalization layer.
+
+    batch_norm : BatchNorm instance
+
+    Returns
+    -------
+    bool
+    """
+    if isinstance(layer, Linear) and layer.size is None:
+        return False
+
+    if not isinstance(layer, (Convolution, Linear)):
+        return False
+
+    ndim = len(batch_norm.input_shape) + 1
+    if find_opposite_axes(batch_norm.axes, ndim) != [1]:
+        # Statistics should be defined per output channel
+        return False
+
+    parameters = [layer.weight, batch_norm.gamma, batch_norm.beta,
+                  batch_norm.running_mean, batch_norm.running_inv_std]
+
+    if layer.bias is not None:
+        parameters.append(layer.bias)
+
+    return all(is_shared_parameter(p) for p in parameters)
+
+
+def fold_batch_norm(layer, batch_norm):
+    """
+    Creates copy of the layer with weight and bias that
+    include transformation from the batch normalization layer.
+
+    Parameters
+    ----------
+    layer : Convolution or Linear instance
+    batch_norm : BatchNorm instance
+
+    Returns
+    -------
+    layer
+    """
+    gamma = batch_norm.gamma.get_value()
+    beta = batch_norm.beta.get_value()
+    mean = batch_norm.running_mean.get_value()
+    inv_std = batch_norm.running_inv_std.get_value()
+
+    weight = layer.weight.get_value()
+    bias = np.zeros(mean.shape)
+
+    if layer.bias is not None:
+        bias = layer.bias.get_value()
+
+    scale = gamma * inv_std
+
+    if isinstance(layer, Convolution):
+        # Weight has shape (n_filters, n_channels, n_rows, n_cols)
+        weight = weight * scale.reshape((-1, 1, 1, 1))
+    else:
+        # Weight has shape (n_inputs, n_outputs)
+        weight = weight * scale.reshape((1, -1))
+
+    folded_layer = copy.copy(layer)
+    folded_layer.parameters = OrderedDict()
+    folded_layer.updates = []
+
+    folded_layer.add_parameter(
+        value=asfloat(weight), name='weight',
+        shape=weight.shape, trainable=True)
+
+    folded_layer.add_parameter(
+        value=asfloat((bias - mean) * scale + beta), name='bias',
+        shape=mean.shape, trainable=True)
+
+    return folded_layer
+
+
+def replace_layer(layers, layer, new_layers):
+    """
+    Replace layer in the list with the new layers, but keep
+    the order. Layers that already exist in the list
+    won't be added the second time.
+    """
+    index = layers.index(layer)
+    new_layers = [l for l in new_layers if l not in layers]
+    layers[index:index + 1] = new_layers
+
+
+class InferenceGraphBuilder(object):
+    """
+    Builds simplified copy of the connection's graph.
+
+    Parameters
+    ----------
+    connection : LayerConnection instance
+    """
+    def __init__(self, connection):
+        graph = connection.graph
+
+        self.forward_graph = OrderedDict(
+            (layer, copy.copy(next_layers))
+            for layer, next_layers in graph.forward_graph.items())
+
+        self.backward_graph = OrderedDict(
+            (layer, copy.copy(prev_layers))
+            for layer, prev_layers in graph.backward_graph.items())
+
+        self.input_layers = copy.copy(connection.input_layers)
+        self.output_layers = copy.copy(connection.output_layers)
+
+    def can_exclude(self, layer):
+        """
+        Layer can be excluded from the graph only in case if it
+        has one input and its output can be passed directly to
+        all next layers.
+        """
+        prev_layers = self.backward_graph[layer]
+        next_layers = self.forward_graph[layer]
+
+        if len(prev_layers) != 1 or layer in self.input_layers:
+            return False
+
+        prev_layer = prev_layers[0]
+
+        if layer in self.output_layers and prev_layer in self.output_layers:
+            return False
+
+        return all(next_layer not in self.forward_graph[prev_layer]
+                   for next_layer in next_layers)
+
+    def exclude(self, layer):
+        """
+        Remove layer from the graph and connect its input
+        layer with all of its output layers.
+        """
+        prev_layer = self.backward_graph.pop(layer)[0]
+        next_layers = self.forward_graph.pop(layer)
+
+        replace_layer(self.forward_graph[prev_layer], layer, next_layers)
+
+        for next_layer in next_layers:
+            replace_layer(self.backward_graph[next_layer], layer, [prev_layer])
+
+        if layer in self.output_layers:
+            replace_layer(self.output_layers, layer, [prev_layer])
+
+    def replace(self, layer, new_layer):
+        """
+        Replace layer in the graph with the new one.
+        """
+        def replace_key(graph):
+            return OrderedDict(
+                (new_layer if key is layer else key, value)
+                for key, value in graph.items())
+
+        self.forward_graph = replace_key(self.forward_graph)
+        self.backward_graph = replace_key(self.backward_graph)
+
+        for next_layer in self.forward_graph[new_layer]:
+            replace_layer(self.backward_graph[next_layer], layer, [new_layer])
+
+        for prev_layer in self.backward_graph[new_layer]:
+            replace_layer(self.forward_graph[prev_layer], layer, [new_layer])
+
+        for layers in (self.input_layers, self.output_layers):
+            if layer in layers:
+                replace_layer(layers, layer, [new_layer])
+
+    def remove_stochastic_layer(self, layer):
+        if self.can_exclude(layer):
+            self.exclude(layer)
+
+    def fold_batch_norm(self, batch_norm):
+        if not self.can_exclude(batch_norm):
+            return
+
+        layer = self.backward_graph[batch_norm][0]
+
+        if self.forward_graph[layer] != [batch_norm]:
+            # Other layers depend on the non-normalized output
+            return
+
+        if layer in self.output_layers:
+            return
+
+        if can_fold_batch_norm(layer, batch_norm):
+            self.replace(layer, fold_batch_norm(layer, batch_norm))
+            self.exclude(batch_norm)
+
+    def build(self, layers):
+        """
+        Simplify graph.
+
+        Parameters
+        ----------
+        layers : list
+            Topologically sorted layers from the graph.
+
+        Returns
+        -------
+        LayerGraph instance
+        """
+        for layer in layers:
+            if isinstance(layer, (Dropout, GaussianNoise)):
+                self.remove_stochastic_layer(layer)
+
+            elif isinstance(layer, BatchNorm):
+                self.fold_batch_norm(layer)
+
+        return LayerGraph(self.forward_graph, self.backward_graph)
+
+
+def optimize_for_inference(connection):
+    """
+    Creates simplified copy of the trained network that can be
+    used only for inference. The following transformations
+    will be applied to the graph.
+
+    - Batch normalization layers that follow ``Convolution`` or
+      ``Linear`` layers will be folded into the weight and bias
+      of the previous layer, since at inference time batch
+      normalization uses fixed statistics and can be expressed
+      as a linear transformation.
+
+    - ``Dropout`` and ``GaussianNoise`` layers will be removed
+      from the graph, since they don't modify inputs at
+      inference time.
+
+    Layers that haven't been changed will be shared between
+    original and optimized networks. Layers with folded
+    parameters are copies and changes in the original
+    network won't affect them.
+
+    Parameters
+    ----------
+    connection : ConstructibleNetwork instance or connection
+
+    Raises
+    ------
+    ValueError
+        In case if connection has only one layer.
+
+    Returns
+    -------
+    connection
+        Network that produces the same output as the original
+        network with disabled training state.
+
+    Examples
+    --------
+    >>> from neupy import architectures, layers
+    >>> resnet50 = architectures.resnet50()
+    >>> resnet50
+    (3, 224, 224) -> [... 187 layers ...] -> 1000
+    >>>
+    >>> layers.optimize_for_inference(resnet50)
+    (3, 224, 224) -> [... 134 layers ...] -> 1000
+    """
+    connection = getattr(connection, 'connection', connection)
+
+    if not isinstance(connection, LayerConnection):
+        raise ValueError("Cannot optimize connection `{}`, because "
+                         "it has only one layer".format(connection))
+
+    builder = InferenceGraphBuilder(connection)
+    graph = builder.build(list(connection))
+
+    return create_inference_connection(connection, builder, graph)
+
+
+def create_inference_connection(connection, builder, graph):
+    """
+    Creates copy of the connection that uses graph
+    simplified by the builder.
+
+    Parameters
+    ----------
+    connection : LayerConnection instance
+
+    builder : InferenceGraphBuilder instance
+
+    graph : LayerGraph instance
+        Graph returned from the builder.
+
+    Returns
+    -------
+    connection
+    """
+    new_connection = copy.copy(connection)
+    new_connection.graph = graph
+    new_connection.input_layers = builder.input_layers
+    new_connection.output_layers = builder.output_layers
+
+    # Optimized connection cannot be extended in the same way
+    # as original connection. Remove references to make sure
+    # that other functions won't use invalid layers.
+    if hasattr(new_connection, 'left'):
+        del new_connection.left
+
+    if hasattr(new_connection, 'right'):
+        del new_connection.right
+
+    for layer in graph.forward_graph:
+        if layer not in connection.graph.forward_graph:
+            layer.graph = graph
+
+    return new_connection
@@ -1,5 +1,5 @@
 from neupy.utils import as_tuple
-from neupy.core.properties import TypedListProperty
+from neupy.core.properties import TypedListProperty, Property
 from .base import BaseLayer
 
 
@@ -35,6 +35,13 @@ class Input(BaseLayer):
     size : int, tuple or None
         Identifies input's feature shape.
 
+    sparse : bool
+        If ``True``, layer expects input as a sparse matrix in the
+        CSR format. Input can have only one feature dimension and next
+        layer should be able to handle sparse input, for instance,
+        layers like ``Relu`` or ``Sigmoid`` with specified size.
+        Defaults to ``False``.
+
     {BaseLayer.Parameters}
 
     Methods
@@ -51,12 +58,21 @@ class Input(BaseLayer):
     >>> input_layer = layers.Input(10)
     >>> input_layer
     Input(10)
+    >>>
+    >>> # Input for the bag-of-words features
+    >>> connection = layers.Input(10000, sparse=True) > layers.Relu(100)
     """
     size = ArrayShapeProperty(element_type=(int, type(None)))
+    sparse = Property(default=False, expected_type=bool)
 
     def __init__(self, size, **options):
         super(Input, self).__init__(size=size, **options)
 
+        if self.sparse and len(as_tuple(self.size)) != 1:
+            raise ValueError("Sparse input can have only one feature "
+                             "dimension, got input with shape {}"
+                             "".format(self.size))
+
         self.input_shape = as_tuple(self.size)
         self.initialize()
 
@@ -1,11 +1,13 @@
 import copy
 from functools import reduce
 
+import theano
 import theano.tensor as T
+import numpy as np
 
 from neupy.core.properties import IntProperty, CallableProperty
 from neupy.exceptions import LayerConnectionError
-from neupy.utils import as_tuple, all_equal
+from neupy.utils import as_tuple, all_equal, asfloat
 from .base import BaseLayer
 
 
@@ -157,6 +159,36 @@ def exclude_index(array, index):
     return copied_array
 
 
+def select_samples(variable, indices):
+    """
+    Rebuilds expression for the variable in the way that it will
+    be computed only from the specified samples of its inputs.
+    All inputs of the expression have to store samples
+    along the first dimension.
+
+    Parameters
+    ----------
+    variable : Theano variable
+
+    indices : Theano variable
+        Indices of the samples.
+
+    Returns
+    -------
+    Theano variable
+    """
+    replacements = {}
+
+    for input_variable in theano.gof.graph.inputs([variable]):
+        is_data_variable = not isinstance(
+            input_variable, (T.sharedvar.SharedVariable, theano.gof.Constant))
+
+        if is_data_variable:
+            replacements[input_variable] = input_variable[indices]
+
+    return theano.clone(variable, replace=replacements)
+
+
 class GatedAverage(BaseLayer):
     """
     Using output from the gated layer weights outputs from the
@@ -169,6 +201,16 @@ class GatedAverage(BaseLayer):
         index in which it can find gating network. Defaults to `0`,
         which means that it expects to see gating layer in zeros position.
 
+    top_k : int or None
+        Enables sparse gating. For each sample layer selects only
+        ``top_k`` networks with the largest gating weights and
+        normalizes their weights, so that they sum up to one.
+        Each network gets only samples that were dispatched to it,
+        which means that amount of computations scales with ``top_k``
+        rather than with the total number of networks. Value ``None``
+        means that all networks will be combined for each sample.
+        Defaults to ``None``.
+
     {BaseLayer.Parameters}
 
     Methods
@@ -179,6 +221,16 @@ class GatedAverage(BaseLayer):
     ----------
     {BaseLayer.Attributes}
 
+    expert_load : Theano shared variable or None
+        Fraction of samples from the last training mini-batch that
+        were dispatched to each network. Available only in case
+        if ``top_k`` was specified.
+
+    expert_importance : Theano shared variable or None
+        Average gating weight per network obtained from the last
+        training mini-batch. Available only in case if
+        ``top_k`` was specified.
+
     Examples
     --------
     >>> from neupy.layers import *
@@ -192,6 +244,12 @@ class GatedAverage(BaseLayer):
     [(10,), (20,), (20,)] -> [... 8 layers ...] -> 10
     """
     gating_layer_index = IntProperty(default=0)
+    top_k = IntProperty(default=None, minval=1, allow_none=True)
+
+    def __init__(self, *args, **options):
+        super(GatedAverage, self).__init__(*args, **options)
+        self.expert_load = None
+        self.expert_importance = None
 
     def validate(self, input_shapes):
         n_input_layers = len(input_shapes)
@@ -225,6 +283,23 @@ class GatedAverage(BaseLayer):
                 "Output layer that has to be merged expect to have the "
                 "same shapes. Shapes: {!r}".format(other_layers_shape))
 
+        if self.top_k is not None and self.top_k > n_gating_weights:
+            raise LayerConnectionError(
+                "Cannot select {} networks, because layer combines only "
+                "{} networks".format(self.top_k, n_gating_weights))
+
+    def initialize(self):
+        super(GatedAverage, self).initialize()
+
+        if self.top_k is not None:
+            n_experts = len(self.input_shape) - 1
+            self.expert_load = theano.shared(
+                name='layer:{}/expert-load'.format(self.name),
+                value=asfloat(np.zeros(n_experts)))
+            self.expert_importance = theano.shared(
+                name='layer:{}/expert-importance'.format(self.name),
+                value=asfloat(np.zeros(n_experts)))
+
     @property
     def output_shape(self):
         if not self.input_shape:
@@ -243,6 +318,9 @@ class GatedAverage(BaseLayer):
         gating_value = input_values[self.gating_layer_index]
         other_values = exclude_index(input_values, self.gating_layer_index)
 
+        if self.top_k is not None:
+            return self.sparse_output(gating_value, other_values)
+
         # Input shape is exactly the same as output shape
         n_output_dim = len(self.output_shape)
 
@@ -255,3 +333,46 @@ class GatedAverage(BaseLayer):
             output_values.append(output_value)
 
         return sum(output_values)
+
+    def sparse_output(self, gating_value, other_values):
+        """
+        Combines outputs only from the ``top_k`` networks per sample.
+        Output from each network is recomputed only for the samples
+        that were dispatched to it and result scatters back to the
+        positions of these samples in the mini-batch.
+        """
+        n_samples = gating_value.shape[0]
+        n_experts = len(other_values)
+        n_output_dim = len(self.output_shape)
+
+        top_k_indices = T.argsort(gating_value, axis=1)[:, -self.top_k:]
+        mask = T.zeros_like(gating_value)
+
+        for i in range(self.top_k):
+            mask = T.set_subtensor(
+                mask[T.arange(n_samples), top_k_indices[:, i]], 1)
+
+        gates = gating_value * mask
+        gates = gates / gates.sum(axis=1, keepdims=True)
+
+        self.updates = [
+            (self.expert_load, mask.mean(axis=0)),
+            (self.expert_importance, gates.mean(axis=0)),
+        ]
+
+        output_value = T.zeros(
+            [n_samples] + list(self.output_shape),
+            dtype=theano.config.floatX)
+
+        for i in range(n_experts):
+            indices = T.nonzero(mask[:, i])[0]
+            expert_output = select_samples(other_values[i], indices)
+
+            gate = gates[indices, i]
+            new_shape = [0] + ['x'] * n_output_dim
+
+            output_value = T.inc_subtensor(
+                output_value[indices],
+                expert_output * gate.dimshuffle(*new_shape))
+
+        return output_value
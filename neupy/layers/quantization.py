@@ -0,0 +1,356 @@
+import copy
+from collections import OrderedDict
+
+import numpy as np
+import theano
+import theano.tensor as T
+
+from neupy.utils import asfloat
+from neupy.core.properties import Property, NumberProperty, IntProperty
+from .base import BaseLayer
+from .convolutions import Convolution
+from .activations import ActivationLayer
+from .inference import (InferenceGraphBuilder, optimize_for_inference,
+                        create_inference_connection, is_shared_parameter)
+
+
+__all__ = ('QuantizedLayer', 'quantize_for_inference', 'quantization_errors')
+
+
+# Weights are quantized into the symmetric range, so
+# that zero always has exact integer representation.
+MAX_WEIGHT_VALUE = 127
+MAX_INPUT_VALUE = 255
+
+
+def can_quantize(layer, backward_graph):
+    """
+    Checks whether layer's weight can be quantized.
+
+    Parameters
+    ----------
+    layer : layer
+
+    backward_graph : dict
+        Relations between layer and its input layers.
+
+    Returns
+    -------
+    bool
+    """
+    if isinstance(layer, ActivationLayer) and layer.size is None:
+        return False
+
+    if not isinstance(layer, (Convolution, ActivationLayer)):
+        return False
+
+    if len(backward_graph[layer]) != 1:
+        return False
+
+    return is_shared_parameter(layer.weight)
+
+
+def quantize_weight(weight, axis=None):
+    """
+    Quantizes weight into the 8-bit integers.
+
+    Parameters
+    ----------
+    weight : array-like
+
+    axis : int or None
+        Weight will be quantized with separate scale per each
+        index along specified axis. Value ``None`` means that
+        one scale will be used for all values. Defaults to ``None``.
+
+    Returns
+    -------
+    tuple
+        Quantized weight and scale. Scale has the same
+        number of dimensions as the weight.
+    """
+    if axis is None:
+        max_value = np.abs(weight).max(keepdims=True)
+    else:
+        other_axes = tuple(i for i in range(weight.ndim) if i != axis)
+        max_value = np.abs(weight).max(axis=other_axes, keepdims=True)
+
+    scale = max_value / MAX_WEIGHT_VALUE
+    # Weights that have only zeros don't need scaling
+    scale[scale == 0] = 1
+
+    quantized_weight = np.round(weight / scale).astype(np.int8)
+    return quantized_weight, asfloat(scale)
+
+
+def input_quantization_range(input_data):
+    """
+    Finds scale and zero point for the unsigned 8-bit quantization
+    of the input. Range always includes zero, so that zero padding
+    and zeros produced by the activation functions, like ``relu``,
+    don't introduce quantization errors.
+
+    Parameters
+    ----------
+    input_data : array-like
+        Samples that have been propagated to the layer.
+
+    Returns
+    -------
+    tuple
+        Scale and zero point.
+    """
+    min_value = min(float(np.min(input_data)), 0)
+    max_value = max(float(np.max(input_data)), 0)
+
+    scale = (max_value - min_value) / MAX_INPUT_VALUE
+
+    if scale == 0:
+        return 1., 0
+
+    zero_point = int(np.round(-min_value / scale))
+    return scale, zero_point
+
+
+class QuantizedLayer(BaseLayer):
+    """
+    Layer that quantizes its input into the unsigned 8-bit integers
+    and propagates it through the layer with 8-bit integer weights.
+
+    Parameters
+    ----------
+    layer : Convolution or ActivationLayer instance
+        Layer that has to be quantized. Its weight will be replaced
+        with the quantized weight.
+
+    input_scale : float
+        Difference between two neighbouring quantized input values.
+
+    input_zero_point : int
+        Quantized value that corresponds to zero in the input.
+
+    weight_axis : int or None
+        Axis along which weight will be quantized with separate
+        scales. Value ``None`` means that one scale will be used
+        for the whole weight. Defaults to ``None``.
+
+    {BaseLayer.Parameters}
+
+    Methods
+    -------
+    {BaseLayer.Methods}
+
+    Attributes
+    ----------
+    quantized_weight : Theano shared variable
+        Weight stored as 8-bit integers.
+
+    weight_scale : Theano shared variable
+        Scales that convert quantized weight to the original range.
+
+    {BaseLayer.Attributes}
+    """
+    layer = Property(expected_type=(Convolution, ActivationLayer),
+                     required=True)
+    input_scale = NumberProperty(minval=0, required=True)
+    input_zero_point = IntProperty(minval=0, maxval=MAX_INPUT_VALUE,
+                                   required=True)
+    weight_axis = IntProperty(minval=0, default=None, allow_none=True)
+
+    def __init__(self, layer, **options):
+        super(QuantizedLayer, self).__init__(layer=copy.copy(layer),
+                                             **options)
+        layer = self.layer
+        self.input_shape = layer.input_shape
+
+        quantized_weight, scale = quantize_weight(
+            layer.weight.get_value(), self.weight_axis)
+
+        self.quantized_weight = theano.shared(
+            value=quantized_weight, borrow=True,
+            name='layer:{}/quantized-weight'.format(self.name))
+        self.quantized_weight.trainable = False
+
+        self.add_parameter(value=scale, name='weight_scale',
+                           shape=scale.shape, trainable=False)
+        self.parameters['quantized_weight'] = self.quantized_weight
+
+        # Layer uses integer weight converted to floatX, because
+        # Theano doesn't have operations for the integer types
+        layer.parameters = OrderedDict()
+        layer.updates = []
+        weight_scale = T.patternbroadcast(
+            self.weight_scale, [size == 1 for size in scale.shape])
+        layer.weight = weight_scale * T.cast(
+            self.quantized_weight, theano.config.floatX)
+
+        if layer.bias is not None:
+            self.parameters['bias'] = layer.bias
+
+    @property
+    def output_shape(self):
+        return self.layer.output_shape
+
+    def output(self, input_value):
+        scale = asfloat(self.input_scale)
+        zero_point = asfloat(self.input_zero_point)
+
+        quantized_input = T.clip(
+            T.round(input_value / scale) + zero_point,
+            0, MAX_INPUT_VALUE)
+
+        return self.layer.output((quantized_input - zero_point) * scale)
+
+    def __repr__(self):
+        return '{name}({layer})'.format(
+            name=self.__class__.__name__, layer=self.layer)
+
+
+def quantize_for_inference(connection, calibration_data, batch_size=None):
+    """
+    Creates copy of the trained network that uses 8-bit integer
+    weights in the ``Convolution`` layers and in the layers based
+    on activation functions, like ``Linear`` or ``Relu``. Network
+    will be optimized with the ``optimize_for_inference`` function
+    before quantization.
+
+    Inputs to the quantized layers are quantized into the unsigned
+    8-bit integers. Their ranges will be calibrated from the outputs
+    of the original network for the calibration data. Weights are
+    quantized symmetrically around zero, with one scale per each
+    output channel in the ``Convolution`` layer and with one scale
+    per weight in the other layers.
+
+    Parameters
+    ----------
+    connection : ConstructibleNetwork instance or connection
+
+    calibration_data : array-like or list of array-like
+        Samples that represent inputs to the network. Input per
+        each input layer of the connection.
+
+    batch_size : int or None
+        Number of samples that will be propagated through the
+        network at the same time during calibration. Value ``None``
+        means that all samples will be propagated at once.
+        Defaults to ``None``.
+
+    Raises
+    ------
+    ValueError
+        In case if connection has only one layer.
+
+    Returns
+    -------
+    connection
+        Network with ``QuantizedLayer`` layers instead of the
+        quantized layers. Quantized layers have the same names
+        as the original layers.
+
+    Examples
+    --------
+    >>> from neupy import layers
+    >>>
+    >>> network = layers.join(
+    ...     layers.Input(784),
+    ...     layers.Relu(500),
+    ...     layers.Softmax(10),
+    ... )
+    >>> quantized = layers.quantize_for_inference(network, x_train[:1000])
+    >>> quantized
+    Input(784) > QuantizedLayer(Relu(500)) > QuantizedLayer(Softmax(10))
+    """
+    connection = optimize_for_inference(connection)
+    builder = InferenceGraphBuilder(connection)
+
+    layers = [layer for layer in connection
+              if can_quantize(layer, builder.backward_graph)]
+
+    input_layers = []
+    for layer in layers:
+        input_layer = builder.backward_graph[layer][0]
+
+        if input_layer not in input_layers:
+            input_layers.append(input_layer)
+
+    if input_layers:
+        outputs = connection.layer_outputs(
+            calibration_data, input_layers, batch_size)
+
+    for layer in layers:
+        input_layer = builder.backward_graph[layer][0]
+        scale, zero_point = input_quantization_range(
+            outputs[input_layer.name])
+
+        quantized_layer = QuantizedLayer(
+            layer, name=layer.name,
+            input_scale=scale,
+            input_zero_point=zero_point,
+            weight_axis=0 if isinstance(layer, Convolution) else None)
+
+        builder.replace(layer, quantized_layer)
+
+    graph = builder.build([])
+    return create_inference_connection(connection, builder, graph)
+
+
+def quantization_errors(connection, quantized_connection, input_data,
+                        batch_size=None):
+    """
+    Compares outputs from the quantized layers with outputs from
+    the same layers in the original network. Error for each layer
+    includes errors from all of the previous quantized layers,
+    which helps to find layers that reduce accuracy of the
+    quantized network.
+
+    Parameters
+    ----------
+    connection : ConstructibleNetwork instance or connection
+        Original network.
+
+    quantized_connection : connection
+        Network returned from the ``quantize_for_inference``
+        function.
+
+    input_data : array-like or list of array-like
+        Input per each input layer of the connection.
+
+    batch_size : int or None
+        Number of samples that will be propagated through the
+        network at the same time. Defaults to ``None``.
+
+    Returns
+    -------
+    OrderedDict
+        Layer names and relative errors, defined as a norm of
+        the difference between outputs divided by norm of the
+        original output.
+
+    Examples
+    --------
+    >>> quantized = layers.quantize_for_inference(network, x_train)
+    >>> layers.quantization_errors(network, quantized, x_test)
+    OrderedDict([('relu-1', 0.0041), ('softmax-1', 0.0013)])
+    """
+    # Quantized layers replace layers from the optimized network
+    # that could include parameters from the folded layers
+    connection = optimize_for_inference(connection)
+    layer_names = [layer.name for layer in quantized_connection
+                   if isinstance(layer, QuantizedLayer)]
+
+    if not layer_names:
+        return OrderedDict()
+
+    outputs = connection.layer_outputs(input_data, layer_names, batch_size)
+    quantized_outputs = quantized_connection.layer_outputs(
+        input_data, layer_names, batch_size)
+
+    errors = OrderedDict()
+
+    for name in layer_names:
+        output = outputs[name]
+        error = np.linalg.norm(quantized_outputs[name] - output)
+        norm = np.linalg.norm(output)
+        errors[name] = error / norm if norm > 0 else error
+
+    return errors
@@ -80,6 +80,45 @@ def unroll_scan(fn, sequences, outputs_info, non_sequences, n_steps,
     return output_scan
 
 
+def mask_step(step, n_outputs):
+    """
+    Wraps recurrent step function in order to make it skip padded
+    time steps. For the samples where mask value is equal to zero
+    step function doesn't change recurrent values and carries
+    them from the previous step.
+
+    Parameters
+    ----------
+    step : function
+        Step function that accepts input for the current time step,
+        previous recurrent values and non sequences.
+
+    n_outputs : int
+        Number of recurrent values that step function returns.
+
+    Returns
+    -------
+    function
+        Step function that expects mask for the current
+        time step as the second argument.
+    """
+    def one_masked_step(input_n, mask_n, *args):
+        previous_outputs = args[:n_outputs]
+        outputs = step(input_n, *args)
+
+        if not isinstance(outputs, list):
+            outputs = [outputs]
+
+        # Mask has shape (n_batch,) and we need to broadcast
+        # it along the feature dimension
+        mask_n = mask_n.dimshuffle(0, 'x')
+
+        return [T.switch(mask_n, output, previous_output)
+                for output, previous_output in zip(outputs, previous_outputs)]
+
+    return one_masked_step
+
+
 class MultiParameterProperty(ParameterProperty):
     expected_type = as_tuple(init.Initializer, dict)
 
@@ -144,14 +183,85 @@ class BaseRNNLayer(BaseLayer):
         sequence is desired). In this case, Theano makes an
         optimization which saves memory. Defaults to ``True``.
 
+    stack_parameters : bool
+        If ``True``, gate parameters will be stored in the stacked
+        shared variables, one for the input weights, one for the hidden
+        weights and one for the biases. Recurrent step computes all
+        gates with one matrix multiplication and graph doesn't need
+        to concatenate parameters. Each gate parameter, like
+        ``weight_in_to_ingate``, still gets its own initialization
+        and available as an attribute that refers to the part of the
+        stacked parameter. Stored parameters have the same format
+        for both options. Defaults to ``False``.
+
     {BaseLayer.Parameters}
+
+    Notes
+    -----
+    Layer accepts optional mask as the second input. Mask is a matrix
+    with shape ``(n_samples, n_time_steps)`` that has ones for the
+    valid time steps and zeros for the padded ones. Padded time steps
+    don't change hidden states, which means that each sequence gets
+    the same output as it would get without padding.
+
+    .. code-block:: python
+
+        from neupy import layers
+
+        n_time_steps = 40
+
+        sequence = layers.Input(n_time_steps) > layers.Embedding(20, 10)
+        mask = layers.Input(n_time_steps)
+
+        connection = [sequence, mask] > layers.LSTM(20)
     """
     size = IntProperty(minval=1)
     only_return_final = Property(default=True, expected_type=bool)
+    stack_parameters = Property(default=False, expected_type=bool)
+
+    # Gate parameters that can be stacked in one parameter. Each
+    # element is a tuple with stacked parameter's name, axis along
+    # which parameters are concatenated and names of the parameters.
+    parameter_stacks = ()
+
+    # Names of the recurrent states. Initial value for each
+    # state is stored in the ``<name>_init`` parameter.
+    state_names = ()
 
     def __init__(self, size, **kwargs):
         super(BaseRNNLayer, self).__init__(size=size, **kwargs)
 
+        # Theano variables that replace default initial states and
+        # final states from the last built graph. Both of them are
+        # used for the step by step inference.
+        self.initial_states = None
+        self.final_states = None
+
+    @property
+    def input_shape(self):
+        return self.input_shape_
+
+    @input_shape.setter
+    def input_shape(self, shape):
+        # Layer gets list of shapes in case if it's connected
+        # to the sequence and mask layers
+        if isinstance(shape, list):
+            if len(shape) > 2:
+                raise LayerConnectionError(
+                    "{} layer expects at most two inputs: sequence and "
+                    "mask, got {} inputs instead"
+                    "".format(self.__class__.__name__, len(shape)))
+
+            shape, mask_shape = shape[0], shape[1:]
+
+            self.validate(shape)
+            self.validate_mask(shape, *mask_shape)
+
+        else:
+            self.validate(shape)
+
+        self.input_shape_ = shape
+
     def validate(self, input_shape):
         n_input_dims = len(input_shape) + 1  # +1 for batch dimension
         clsname = self.__class__.__name__
@@ -162,6 +272,120 @@ class BaseRNNLayer(BaseLayer):
                 "dimensions, got input with {} dimensions instead"
                 "".format(clsname, n_input_dims))
 
+    def validate_mask(self, input_shape, mask_shape=None):
+        """
+        Validate mask shape.
+
+        Parameters
+        ----------
+        input_shape : tuple
+            Shape of the input sequence.
+
+        mask_shape : tuple or None
+            Shape of the mask. ``None`` means that mask
+            wasn't specified.
+        """
+        if mask_shape is not None and mask_shape != input_shape[:1]:
+            raise LayerConnectionError(
+                "Mask for the {} layer should have shape equal to the "
+                "number of time steps {}, got {} instead"
+                "".format(self.__class__.__name__, input_shape[:1],
+                          mask_shape))
+
+    def add_parameter(self, value, name, shape=None, trainable=True):
+        parameter = self.parameters.get(name)
+        expected_shape = np.shape(value) if shape is None else shape
+
+        # Layer can be initialized multiple times, for instance, after
+        # loading stored parameters. In this case existing parameters
+        # shouldn't be replaced with the new ones.
+        if parameter is not None and not isinstance(value, T.Variable):
+            if parameter.get_value(borrow=True).shape == expected_shape:
+                value = parameter
+
+        return super(BaseRNNLayer, self).add_parameter(
+            value, name, shape, trainable)
+
+    def stack_gate_parameters(self):
+        """
+        Replace gate parameters with the stacked parameters.
+        Gate parameter attributes will refer to the parts
+        of the stacked parameter.
+        """
+        gate_values = list(self.weights.values()) + list(self.biases.values())
+
+        if any(isinstance(value, T.Variable) for value in gate_values):
+            # Stacked parameter will have a copy of the value, which
+            # means that it won't be shared with the other graph
+            raise ValueError("Gate parameters specified as Theano "
+                             "variables cannot be stacked")
+
+        for stacked_name, axis, names in self.parameter_stacks:
+            parameters = [self.parameters.pop(name) for name in names]
+
+            stacked_parameter = self.add_parameter(
+                name=stacked_name,
+                value=np.concatenate(
+                    [parameter.get_value() for parameter in parameters],
+                    axis=axis),
+            )
+
+            start = 0
+            for parameter in parameters:
+                value = parameter.get_value()
+                end = start + value.shape[axis]
+
+                index = [slice(None)] * value.ndim
+                index[axis] = slice(start, end)
+                view = stacked_parameter[tuple(index)]
+
+                # Some parameters are available by different attribute
+                # names, that's why we replace all references to them.
+                for attrname, attrvalue in list(vars(self).items()):
+                    if attrvalue is parameter:
+                        setattr(self, attrname, view)
+
+                start = end
+
+    def stacked_parameters(self):
+        """
+        Returns parameters stacked per each group
+        from the ``parameter_stacks`` attribute.
+
+        Returns
+        -------
+        list of Theano variables
+        """
+        if self.stack_parameters:
+            return [self.parameters[stacked_name]
+                    for stacked_name, _, _ in self.parameter_stacks]
+
+        return [
+            T.concatenate([getattr(self, name) for name in names], axis=axis)
+            for _, axis, names in self.parameter_stacks]
+
+    def init_states(self, n_batch):
+        """
+        Returns initial values for the recurrent states.
+
+        Parameters
+        ----------
+        n_batch : Theano scalar
+            Number of samples in the batch.
+
+        Returns
+        -------
+        list of Theano variables
+            Matrices with shape ``(n_batch, size)`` in the same
+            order as in the ``state_names`` attribute.
+        """
+        if self.initial_states is not None:
+            return list(self.initial_states)
+
+        ones = T.ones((n_batch, 1))
+        return [T.dot(ones, self.parameters[name + '_init'])
+                for name in self.state_names]
+
     @property
     def output_shape(self):
         if self.only_return_final:
@@ -408,6 +632,18 @@ class LSTM(BaseRNNLayer):
     n_gradient_steps = IntProperty(default=-1)
     gradient_clipping = NumberProperty(default=0, minval=0)
 
+    state_names = ('cell', 'hid')
+    parameter_stacks = (
+        ('weight_in_stacked', 1, (
+            'weight_in_to_ingate', 'weight_in_to_forgetgate',
+            'weight_in_to_cell', 'weight_in_to_outgate')),
+        ('weight_hid_stacked', 1, (
+            'weight_hid_to_ingate', 'weight_hid_to_forgetgate',
+            'weight_hid_to_cell', 'weight_hid_to_outgate')),
+        ('bias_stacked', 0, (
+            'bias_ingate', 'bias_forgetgate', 'bias_cell', 'bias_outgate')),
+    )
+
     def initialize(self):
         super(LSTM, self).initialize()
 
@@ -490,7 +726,10 @@ class LSTM(BaseRNNLayer):
         self.add_parameter(value=self.hid_init, shape=(1, self.size),
                            name="hid_init", trainable=self.learn_init)
 
-    def output(self, input_value):
+        if self.stack_parameters:
+            self.stack_gate_parameters()
+
+    def output(self, input_value, mask=None):
         # Treat all dimensions after the second as flattened
         # feature dimensions
         if input_value.ndim > 3:
@@ -501,27 +740,12 @@ class LSTM(BaseRNNLayer):
         input_value = input_value.dimshuffle(1, 0, 2)
         seq_len, n_batch, _ = input_value.shape
 
-        # Stack input weight matrices into a (num_inputs, 4 * num_units)
-        # matrix, which speeds up computation
-        weight_in_stacked = T.concatenate([
-            self.weight_in_to_ingate,
-            self.weight_in_to_forgetgate,
-            self.weight_in_to_cell,
-            self.weight_in_to_outgate], axis=1)
-
-        # Same for hidden weight matrices
-        weight_hid_stacked = T.concatenate([
-            self.weight_hid_to_ingate,
-            self.weight_hid_to_forgetgate,
-            self.weight_hid_to_cell,
-            self.weight_hid_to_outgate], axis=1)
-
-        # Stack biases into a (4 * num_units) vector
-        bias_stacked = T.concatenate([
-            self.bias_ingate,
-            self.bias_forgetgate,
-            self.bias_cell,
-            self.bias_outgate], axis=0)
+        # Stacked input weight matrix has (num_inputs, 4 * num_units)
+        # shape, which speeds up computation. Hidden weight matrices
+        # are stacked in the same way and biases are stacked into
+        # a (4 * num_units) vector.
+        weight_in_stacked, weight_hid_stacked, bias_stacked = \
+            self.stacked_parameters()
 
         if self.precompute_input:
             # Because the input is given for all time steps, we can
@@ -576,9 +800,7 @@ class LSTM(BaseRNNLayer):
             hid = outgate * T.tanh(cell)
             return [cell, hid]
 
-        ones = T.ones((n_batch, 1))
-        cell_init = T.dot(ones, self.cell_init)
-        hid_init = T.dot(ones, self.hid_init)
+        cell_init, hid_init = self.init_states(n_batch)
 
         non_sequences = [weight_hid_stacked]
         # When we aren't precomputing the input outside of scan, we need to
@@ -593,29 +815,43 @@ class LSTM(BaseRNNLayer):
                               self.weight_cell_to_forgetgate,
                               self.weight_cell_to_outgate]
 
+        step = one_lstm_step
+        sequences = [input_value]
+
+        if mask is not None:
+            # Scan iterates over time steps, which means that mask
+            # has to be in the (n_time_steps, n_batch) format
+            step = mask_step(one_lstm_step, n_outputs=2)
+            sequences.append(mask.dimshuffle(1, 0))
+
         if self.unroll_scan:
             # Retrieve the dimensionality of the incoming layer
             n_time_steps = self.input_shape[0]
 
             # Explicitly unroll the recurrence instead of using scan
-            _, hid_out = unroll_scan(
-                fn=one_lstm_step,
-                sequences=[input_value],
+            cell_out, hid_out = unroll_scan(
+                fn=step,
+                sequences=sequences,
                 outputs_info=[cell_init, hid_init],
                 go_backwards=self.backwards,
                 non_sequences=non_sequences,
                 n_steps=n_time_steps)
 
         else:
-            (_, hid_out), _ = theano.scan(
-                fn=one_lstm_step,
-                sequences=input_value,
+            (cell_out, hid_out), _ = theano.scan(
+                fn=step,
+                sequences=sequences,
                 outputs_info=[cell_init, hid_init],
                 go_backwards=self.backwards,
                 truncate_gradient=self.n_gradient_steps,
                 non_sequences=non_sequences,
                 strict=True)
 
+        if self.initial_states is not None:
+            # Final states are needed only in case if layer continues
+            # processing of the sequence from the specified states
+            self.final_states = [cell_out[-1], hid_out[-1]]
+
         # When it is requested that we only return the final sequence step,
         # we need to slice it out immediately after scan is applied
         if self.only_return_final:
@@ -832,6 +1068,19 @@ class GRU(BaseRNNLayer):
     n_gradient_steps = IntProperty(default=-1)
     gradient_clipping = NumberProperty(default=0, minval=0)
 
+    state_names = ('hid',)
+    parameter_stacks = (
+        ('weight_in_stacked', 1, (
+            'weight_in_to_updategate', 'weight_in_to_resetgate',
+            'weight_in_to_hidden_update')),
+        ('weight_hid_stacked', 1, (
+            'weight_hid_to_updategate', 'weight_hid_to_resetgate',
+            'weight_hid_to_hidden_update')),
+        # Reset gate's bias is stored with the `bias_forgetgate` name
+        ('bias_stacked', 0, (
+            'bias_updategate', 'bias_forgetgate', 'bias_hidden_update')),
+    )
+
     def initialize(self):
         super(GRU, self).initialize()
 
@@ -881,7 +1130,10 @@ class GRU(BaseRNNLayer):
         self.add_parameter(value=self.hid_init, shape=(1, self.size),
                            name="hid_init", trainable=self.learn_init)
 
-    def output(self, input_value):
+        if self.stack_parameters:
+            self.stack_gate_parameters()
+
+    def output(self, input_value, mask=None):
         # Treat all dimensions after the second as flattened
         # feature dimensions
         if input_value.ndim > 3:
@@ -892,24 +1144,12 @@ class GRU(BaseRNNLayer):
         input_value = input_value.dimshuffle(1, 0, 2)
         seq_len, n_batch, _ = input_value.shape
 
-        # Stack input weight matrices into a (num_inputs, 3 * num_units)
-        # matrix, which speeds up computation
-        weight_in_stacked = T.concatenate([
-            self.weight_in_to_updategate,
-            self.weight_in_to_resetgate,
-            self.weight_in_to_hidden_update], axis=1)
-
-        # Same for hidden weight matrices
-        weight_hid_stacked = T.concatenate([
-            self.weight_hid_to_updategate,
-            self.weight_hid_to_resetgate,
-            self.weight_hid_to_hidden_update], axis=1)
-
-        # Stack biases into a (3 * num_units) vector
-        bias_stacked = T.concatenate([
-            self.bias_updategate,
-            self.bias_resetgate,
-            self.bias_hidden_update], axis=0)
+        # Stacked input weight matrix has (num_inputs, 3 * num_units)
+        # shape, which speeds up computation. Hidden weight matrices
+        # are stacked in the same way and biases are stacked into
+        # a (3 * num_units) vector.
+        weight_in_stacked, weight_hid_stacked, bias_stacked = \
+            self.stacked_parameters()
 
         if self.precompute_input:
             # Because the input is given for all time steps, we can
@@ -975,7 +1215,7 @@ class GRU(BaseRNNLayer):
             hid = (1 - updategate) * hid_previous + updategate * hidden_update
             return hid
 
-        hid_init = T.dot(T.ones((n_batch, 1)), self.hid_init)
+        hid_init, = self.init_states(n_batch)
 
         # The hidden-to-hidden weight matrix is always used in step
         non_sequences = [weight_hid_stacked]
@@ -985,14 +1225,23 @@ class GRU(BaseRNNLayer):
         if not self.precompute_input:
             non_sequences += [weight_in_stacked, bias_stacked]
 
+        step = one_gru_step
+        sequences = [input_value]
+
+        if mask is not None:
+            # Scan iterates over time steps, which means that mask
+            # has to be in the (n_time_steps, n_batch) format
+            step = mask_step(one_gru_step, n_outputs=1)
+            sequences.append(mask.dimshuffle(1, 0))
+
         if self.unroll_scan:
             # Retrieve the dimensionality of the incoming layer
             n_time_steps = self.input_shape[0]
 
             # Explicitly unroll the recurrence instead of using scan
             hid_out, = unroll_scan(
-                fn=one_gru_step,
-                sequences=[input_value],
+                fn=step,
+                sequences=sequences,
                 outputs_info=[hid_init],
                 go_backwards=self.backwards,
                 non_sequences=non_sequences,
@@ -1002,14 +1251,19 @@ class GRU(BaseRNNLayer):
             # Scan op iterates over first dimension of input and
             # repeatedly applies the step function
             hid_out, _ = theano.scan(
-                fn=one_gru_step,
-                sequences=[input_value],
+                fn=step,
+                sequences=sequences,
                 outputs_info=[hid_init],
                 go_backwards=self.backwards,
                 non_sequences=non_sequences,
                 truncate_gradient=self.n_gradient_steps,
                 strict=True)
 
+        if self.initial_states is not None:
+            # Final states are needed only in case if layer continues
+            # processing of the sequence from the specified states
+            self.final_states = [hid_out[-1]]
+
         # When it is requested that we only return the final sequence step,
         # we need to slice it out immediately after scan is applied
         if self.only_return_final:
@@ -0,0 +1,158 @@
+import copy
+from collections import OrderedDict
+
+import numpy as np
+import scipy.sparse
+import theano
+
+from .activations import ActivationLayer
+from .inference import (InferenceGraphBuilder, optimize_for_inference,
+                        create_inference_connection, is_shared_parameter)
+
+
+__all__ = ('sparsify_for_inference',)
+
+
+def weight_sparsity(weight):
+    """
+    Returns fraction of the weight's values that are equal to zero.
+
+    Parameters
+    ----------
+    weight : array-like
+
+    Returns
+    -------
+    float
+    """
+    return 1 - np.count_nonzero(weight) / float(weight.size)
+
+
+def can_sparsify(layer, min_sparsity):
+    """
+    Checks whether layer's weight can be stored as a sparse matrix.
+
+    Parameters
+    ----------
+    layer : layer
+
+    min_sparsity : float
+        Minimum fraction of zeros in the weight.
+
+    Returns
+    -------
+    bool
+    """
+    if not isinstance(layer, ActivationLayer) or layer.size is None:
+        return False
+
+    if not is_shared_parameter(layer.weight):
+        return False
+
+    if len(layer.input_shape) != 1:
+        # Sparse matrices can have only two dimensions
+        return False
+
+    weight = layer.weight.get_value()
+    return weight_sparsity(weight) >= min_sparsity
+
+
+def sparsify_layer(layer):
+    """
+    Creates copy of the layer that stores its weight
+    in the compressed sparse row (CSR) format.
+
+    Parameters
+    ----------
+    layer : ActivationLayer instance
+
+    Returns
+    -------
+    layer
+    """
+    weight = scipy.sparse.csr_matrix(layer.weight.get_value())
+
+    sparse_layer = copy.copy(layer)
+    sparse_layer.parameters = OrderedDict()
+    sparse_layer.updates = []
+
+    sparse_weight = theano.sparse.shared(
+        weight, name='layer:{}/weight'.format(layer.name))
+    sparse_weight.trainable = False
+
+    sparse_layer.parameters['weight'] = sparse_weight
+    sparse_layer.weight = sparse_weight
+
+    if layer.bias is not None:
+        sparse_layer.parameters['bias'] = layer.bias
+
+    return sparse_layer
+
+
+def sparsify_for_inference(connection, min_sparsity=0.5):
+    """
+    Creates copy of the trained network that stores sparse
+    weights of the layers based on activation functions, like
+    ``Linear`` or ``Relu``, in the compressed sparse row (CSR)
+    format and multiplies inputs by them with sparse-dense
+    matrix products. Network will be optimized with the
+    ``optimize_for_inference`` function before the conversion.
+
+    Sparse weights require less memory and prediction for the
+    small batches is faster. Dense matrix multiplication can
+    be faster for the large batches, since it's better optimized.
+    Functions from the ``neupy.storage`` module save sparse weights
+    as dense arrays and convert them back during the loading.
+
+    Parameters
+    ----------
+    connection : ConstructibleNetwork instance or connection
+
+    min_sparsity : float
+        Only weights that have at least specified fraction of
+        zeros will be stored as sparse matrices.
+        Defaults to ``0.5``.
+
+    Raises
+    ------
+    ValueError
+        In case if connection has only one layer or
+        minimum sparsity is not between 0 and 1.
+
+    Returns
+    -------
+    connection
+        Network that produces the same output as the original
+        network with disabled training state.
+
+    Examples
+    --------
+    >>> from neupy import algorithms, layers
+    >>>
+    >>> network = algorithms.Momentum(
+    ...     [
+    ...         layers.Input(784),
+    ...         layers.Relu(1000),
+    ...         layers.Softmax(10),
+    ...     ],
+    ...     target_sparsity=0.9,
+    ...     addons=[algorithms.MagnitudePruning],
+    ... )
+    >>> network.train(x_train, y_train, epochs=20)
+    >>>
+    >>> sparse_network = layers.sparsify_for_inference(network)
+    >>> predict = sparse_network.compile()
+    """
+    if not 0 <= min_sparsity <= 1:
+        raise ValueError("Minimum sparsity should be between 0 and 1, "
+                         "got {}".format(min_sparsity))
+
+    connection = optimize_for_inference(connection)
+    builder = InferenceGraphBuilder(connection)
+
+    for layer in connection:
+        if can_sparsify(layer, min_sparsity):
+            builder.replace(layer, sparsify_layer(layer))
+
+    graph = builder.build([])
+    return create_inference_connection(connection, builder, graph)
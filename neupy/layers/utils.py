@@ -1,8 +1,11 @@
+import theano
+import theano.sparse
 import theano.tensor as T
 
 
 __all__ = ('preformat_layer_shape', 'dimshuffle', 'iter_parameters',
-           'count_parameters', 'create_input_variable', 'extract_connection')
+           'count_parameters', 'create_input_variable', 'extract_connection',
+           'dot')
 
 
 def preformat_layer_shape(shape):
@@ -95,7 +98,33 @@ def count_parameters(connection):
     return n_parameters
 
 
-def create_input_variable(input_shape, name):
+def dot(input_value, weight):
+    """
+    Dot product that supports sparse and dense input values
+    and weights.
+
+    Parameters
+    ----------
+    input_value : Theano variable
+        Dense tensor or sparse matrix.
+
+    weight : Theano variable
+        Dense tensor or sparse matrix.
+
+    Returns
+    -------
+    Theano variable
+    """
+    def is_sparse(value):
+        value_type = getattr(value, 'type', None)
+        return isinstance(value_type, theano.sparse.SparseType)
+
+    if is_sparse(input_value) or is_sparse(weight):
+        return theano.sparse.dot(input_value, weight)
+    return T.dot(input_value, weight)
+
+
+def create_input_variable(input_shape, name, sparse=False):
     """
     Create input variable based on the specified
     input shape.
@@ -105,10 +134,17 @@ def create_input_variable(input_shape, name):
     input_shape : tuple
     name : str
 
+    sparse : bool
+        If ``True``, function creates sparse matrix in the CSR format.
+        Defaults to ``False``.
+
     Returns
     -------
     Theano variable
     """
+    if sparse:
+        return theano.sparse.csr_matrix(name, dtype=theano.config.floatX)
+
     dim_to_variable_type = {
         2: T.matrix,
         3: T.tensor3,
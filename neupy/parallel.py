@@ -0,0 +1,372 @@
+import os
+import math
+import shutil
+import tempfile
+import multiprocessing
+
+import numpy as np
+
+from neupy import storage
+from neupy.algorithms.base import BaseNetwork, ErrorHistoryList
+
+
+__all__ = ('train_networks', 'predict_parallel')
+
+
+# Variables that worker process receives during the initialization.
+# They stay the same for all tasks executed by the worker.
+worker_state = {}
+
+
+class MemmapArray(object):
+    """
+    Reference to the NumPy array stored on disk. Object can be sent
+    to the other process without copying the array and each process
+    opens it as a read-only memory map. All processes share the
+    same page-cached copy of the data.
+
+    Parameters
+    ----------
+    path : str
+        Path to the ``.npy`` file.
+    """
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        return np.load(self.path, mmap_mode='r')
+
+
+def share_data(data, directory):
+    """
+    Store arrays in the specified directory in order to share
+    them between processes without copying.
+
+    Parameters
+    ----------
+    data : array-like, list, tuple or None
+        Array or list of arrays (in case if network has multiple
+        inputs). Objects that are not NumPy arrays, like sparse
+        matrices, would be sent to the worker directly.
+
+    directory : str
+        Directory where arrays will be stored.
+
+    Returns
+    -------
+    object
+        The same structure as the ``data``, but with arrays
+        replaced by ``MemmapArray`` objects.
+    """
+    if isinstance(data, (list, tuple)):
+        return tuple(share_data(element, directory) for element in data)
+
+    if not isinstance(data, np.ndarray):
+        return data
+
+    path = os.path.join(directory, 'array-{}.npy'.format(len(
+        os.listdir(directory))))
+
+    np.save(path, data)
+    return MemmapArray(path)
+
+
+def load_shared_data(data):
+    if isinstance(data, tuple):
+        return tuple(load_shared_data(element) for element in data)
+
+    if isinstance(data, MemmapArray):
+        return data.load()
+
+    return data
+
+
+def init_worker(data, train_kwargs):
+    worker_state.update(
+        data=load_shared_data(data),
+        train_kwargs=train_kwargs,
+    )
+
+
+def train_network(network):
+    """
+    Train network on the data specified during the worker's
+    initialization.
+
+    Parameters
+    ----------
+    network : network instance or function
+        Network or function without arguments that creates it.
+
+    Returns
+    -------
+    tuple
+        Tuple that contains trained network, last epoch,
+        training and validation errors.
+    """
+    input_train, target_train, input_test, target_test = worker_state['data']
+
+    if not isinstance(network, BaseNetwork):
+        network = network()
+
+    arguments = [input_train]
+    train_kwargs = dict(worker_state['train_kwargs'])
+
+    if target_train is not None:
+        arguments.append(target_train)
+
+    if input_test is not None:
+        train_kwargs['input_test'] = input_test
+
+    if target_test is not None:
+        train_kwargs['target_test'] = target_test
+
+    network.train(*arguments, **train_kwargs)
+
+    # Training history has to be sent separately, since
+    # some networks don't store it during the serialization.
+    return (
+        network,
+        network.last_epoch,
+        list(network.errors),
+        list(network.validation_errors),
+    )
+
+
+def train_networks(networks, input_train, target_train=None,
+                   input_test=None, target_test=None, n_workers=None,
+                   **train_kwargs):
+    """
+    Train multiple networks in parallel processes on the same
+    dataset. Training and validation datasets are stored in the
+    temporary directory and each process opens them as read-only
+    memory maps, which means that data won't be copied per each
+    network or process.
+
+    Parameters
+    ----------
+    networks : list
+        List of the networks or functions without arguments that
+        create network. Functions are useful for the cases when
+        network creation is expensive, for instance, in case of
+        the networks that compile Theano functions. In case if
+        networks have to be initialized with different random
+        seed, function can set it up before creating the network.
+
+    input_train : array-like or list of array-like
+
+    target_train : array-like or None
+        Defaults to ``None``.
+
+    input_test : array-like, list of array-like or None
+        Defaults to ``None``.
+
+    target_test : array-like or None
+        Defaults to ``None``.
+
+    n_workers : int or None
+        Number of processes. Value ``None`` means that number
+        of processes will be equal to the number of CPUs.
+        Defaults to ``None``.
+
+    **train_kwargs
+        Additional arguments for the ``train`` method,
+        for instance, ``epochs``.
+
+    Returns
+    -------
+    list
+        List of trained networks in the same order as they were
+        specified in the ``networks`` argument. Each network has
+        training history in the ``errors`` and ``validation_errors``
+        attributes.
+
+    Examples
+    --------
+    >>> from functools import partial
+    >>> from sklearn.model_selection import ParameterGrid
+    >>> from neupy import algorithms, parallel
+    >>>
+    >>> param_grid = ParameterGrid({'step': [0.1, 0.01], 'momentum': [0.9]})
+    >>> networks = [
+    ...     partial(algorithms.Momentum, (10, 20, 1), verbose=False, **params)
+    ...     for params in param_grid
+    ... ]
+    >>>
+    >>> trained_networks = parallel.train_networks(
+    ...     networks, x_train, y_train, x_test, y_test, epochs=100)
+    >>>
+    >>> best_network = min(
+    ...     trained_networks,
+    ...     key=lambda network: network.validation_errors.last())
+    """
+    if n_workers is not None and n_workers < 1:
+        raise ValueError("Number of workers should be greater than 0, "
+                         "got {}".format(n_workers))
+
+    directory = tempfile.mkdtemp(prefix='neupy-')
+
+    try:
+        data = share_data(
+            (input_train, target_train, input_test, target_test), directory)
+
+        # Only data is shared between all tasks. Each network is
+        # sent to the worker together with the task that trains it.
+        pool = multiprocessing.Pool(
+            processes=n_workers,
+            initializer=init_worker,
+            initargs=(data, train_kwargs),
+        )
+
+        try:
+            results = pool.map(train_network, networks, chunksize=1)
+        finally:
+            pool.terminate()
+            pool.join()
+
+    finally:
+        shutil.rmtree(directory)
+
+    trained_networks = []
+    for network, last_epoch, errors, validation_errors in results:
+        network.last_epoch = last_epoch
+        network.errors = network.train_errors = ErrorHistoryList(errors)
+        network.validation_errors = ErrorHistoryList(validation_errors)
+        trained_networks.append(network)
+
+    return trained_networks
+
+
+def init_prediction_worker(filepath, input_data, method):
+    # Arrays learned by the network are memory-mapped from the
+    # file, which means that all workers share the same copy
+    network = storage.load_algorithm(filepath, verbose=False)
+
+    worker_state.update(
+        predict=getattr(network, method),
+        input_data=load_shared_data(input_data),
+    )
+
+
+def predict_chunk(chunk):
+    """
+    Make prediction for the rows from the specified range.
+
+    Parameters
+    ----------
+    chunk : tuple
+        Index of the first and the last (excluded) rows.
+
+    Returns
+    -------
+    array-like
+    """
+    start, end = chunk
+    return worker_state['predict'](worker_state['input_data'][start:end])
+
+
+def predict_parallel(network, input_data, n_workers=None, batch_size=None,
+                     method='predict'):
+    """
+    Make prediction in parallel processes. Input data is split into
+    chunks and each worker process makes prediction for its chunks.
+    Network is stored with the ``save_algorithm`` function and input
+    data is stored in the temporary directory. Workers open both
+    files as memory maps, so that network's arrays and input data
+    won't be copied per each process.
+
+    Parameters
+    ----------
+    network : network instance
+        Trained network that can be stored with the
+        ``storage.save_algorithm`` function, for instance,
+        ``GRNN``, ``PNN``, ``SOFM``, ``LVQ``, ``RBFKMeans``
+        or ``CMAC``.
+
+    input_data : array-like
+        Samples ordered along the first dimension.
+
+    n_workers : int or None
+        Number of processes. Value ``None`` means that number
+        of processes will be equal to the number of CPUs.
+        Defaults to ``None``.
+
+    batch_size : int or None
+        Number of samples that worker process gets per task.
+        Value ``None`` means that input data will be split into
+        four chunks per each worker, which helps to balance load
+        between workers. Defaults to ``None``.
+
+    method : str
+        Name of the network's method that makes prediction,
+        for instance, ``predict_proba``. Defaults to ``predict``.
+
+    Raises
+    ------
+    ValueError
+        In case if network cannot be stored with the
+        ``save_algorithm`` function or arguments are invalid.
+
+    Returns
+    -------
+    array-like
+        Predictions ordered in the same way as input samples.
+
+    Examples
+    --------
+    >>> from neupy import algorithms, parallel
+    >>>
+    >>> pnn = algorithms.PNN(std=0.1, verbose=False)
+    >>> pnn.train(x_train, y_train)
+    >>>
+    >>> y_predicted = parallel.predict_parallel(pnn, x_test, n_workers=64)
+    """
+    if n_workers is not None and n_workers < 1:
+        raise ValueError("Number of workers should be greater than 0, "
+                         "got {}".format(n_workers))
+
+    if batch_size is not None and batch_size < 1:
+        raise ValueError("Batch size should be greater than 0, "
+                         "got {}".format(batch_size))
+
+    if not callable(getattr(network, method, None)):
+        raise ValueError("Network doesn't have the `{}` method"
+                         "".format(method))
+
+    input_data = np.asarray(input_data)
+    n_samples = len(input_data)
+
+    if n_workers is None:
+        n_workers = multiprocessing.cpu_count()
+
+    if batch_size is None:
+        batch_size = int(math.ceil(n_samples / (4. * n_workers)))
+
+    chunks = [(start, min(start + batch_size, n_samples))
+              for start in range(0, n_samples, max(batch_size, 1))]
+
+    if not chunks:
+        return getattr(network, method)(input_data)
+
+    directory = tempfile.mkdtemp(prefix='neupy-')
+
+    try:
+        filepath = os.path.join(directory, 'network.neupy')
+        storage.save_algorithm(network, filepath)
+
+        pool = multiprocessing.Pool(
+            processes=min(n_workers, len(chunks)),
+            initializer=init_prediction_worker,
+            initargs=(filepath, share_data(input_data, directory), method),
+        )
+
+        try:
+            outputs = pool.map(predict_chunk, chunks, chunksize=1)
+        finally:
+            pool.terminate()
+            pool.join()
+
+    finally:
+        shutil.rmtree(directory)
+
+    return np.concatenate(outputs)
@@ -0,0 +1,419 @@
+import sys
+import time
+import threading
+
+import six
+import numpy as np
+from six.moves import queue
+
+
+__all__ = ('Predictor', 'PredictionRequest')
+
+
+# Signals background thread that predictor has been
+# closed and all previous requests have been processed
+STOP_SIGNAL = object()
+
+
+class PredictionRequest(object):
+    """
+    Request that waits until predictor processes its samples.
+
+    Parameters
+    ----------
+    input_data : array-like
+        Samples that need to be processed.
+
+    callback : callable or None
+        Function that will be triggered from the predictor's
+        thread once prediction is ready. Function gets request
+        as an argument. Exceptions raised from the function
+        don't stop predictor. Defaults to ``None``.
+
+    Attributes
+    ----------
+    result : array-like or None
+        Prediction for the samples.
+
+    error : tuple or None
+        Information about the exception, returned from the
+        ``sys.exc_info`` function, in case if prediction failed.
+
+    callback_error : tuple or None
+        Information about the exception, returned from the
+        ``sys.exc_info`` function, in case if callback failed.
+    """
+    def __init__(self, input_data, callback=None):
+        self.input_data = input_data
+        self.callback = callback
+
+        self.result = None
+        self.error = None
+        self.callback_error = None
+        self.finished = threading.Event()
+
+    @property
+    def n_samples(self):
+        return len(self.input_data)
+
+    def finish(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.finished.set()
+
+        if self.callback is not None:
+            # Callback is triggered from the predictor's thread and
+            # it shouldn't prevent other requests from finishing
+            try:
+                self.callback(self)
+            except Exception:
+                self.callback_error = sys.exc_info()
+
+    def wait(self, timeout=None):
+        """
+        Waits until prediction is ready.
+
+        Parameters
+        ----------
+        timeout : float or None
+            Maximum number of seconds to wait. Waits without
+            limit in case if value equal to ``None``.
+            Defaults to ``None``.
+
+        Raises
+        ------
+        RuntimeError
+            In case if prediction hasn't finished
+            within specified time.
+
+        Returns
+        -------
+        array-like
+        """
+        if not self.finished.wait(timeout):
+            raise RuntimeError("Prediction hasn't finished "
+                               "in {} seconds".format(timeout))
+
+        if self.error is not None:
+            six.reraise(*self.error)
+
+        return self.result
+
+
+class Predictor(object):
+    """
+    Thread-safe wrapper around the trained network that combines
+    concurrent prediction requests into the larger batches. Network
+    is used only from the predictor's background thread, which
+    waits at most ``max_latency`` seconds after the first request
+    for other requests, concatenates all collected samples and
+    splits prediction between requests.
+
+    Parameters
+    ----------
+    network : network instance or connection
+        Trained network. Prediction will be made with the network's
+        ``predict`` method. Connection, built from the layers,
+        will be compiled.
+
+    batch_size : int
+        Maximum number of samples in one batch. Requests that
+        have more samples will be processed separately.
+        Defaults to ``128``.
+
+    max_latency : float
+        Maximum number of seconds that first request in the batch
+        waits for other requests. Requests that already wait in the
+        queue are added to the batch even when value equal to zero.
+        Defaults to ``0.002``.
+
+    Attributes
+    ----------
+    n_batches : int
+        Number of batches processed by the network.
+
+    n_requests : int
+        Number of processed requests.
+
+    Methods
+    -------
+    predict(input_data)
+        Blocks until prediction for the samples is ready.
+
+    predict_async(input_data)
+        Returns asyncio future. Available only in Python 3.
+
+    submit(input_data, callback=None)
+        Adds samples to the queue and returns
+        ``PredictionRequest`` instance.
+
+    close()
+        Processes requests from the queue and stops
+        background thread.
+
+    Examples
+    --------
+    >>> from neupy import algorithms, serving
+    >>>
+    >>> network = algorithms.Momentum((784, 100, 10))
+    >>> network.train(x_train, y_train)
+    >>>
+    >>> predictor = serving.Predictor(network, batch_size=256)
+    >>>
+    >>> # Can be called from the different threads
+    >>> prediction = predictor.predict(x_test[:1])
+    >>>
+    >>> # The same request from the asyncio coroutine
+    >>> prediction = await predictor.predict_async(x_test[:1])
+    """
+    def __init__(self, network, batch_size=128, max_latency=0.002):
+        if batch_size < 1:
+            raise ValueError("Batch size should be a positive integer, "
+                             "got {}".format(batch_size))
+
+        if max_latency < 0:
+            raise ValueError("Maximum latency cannot be negative, "
+                             "got {}".format(max_latency))
+
+        if hasattr(network, 'predict'):
+            self.predict_function = network.predict
+        else:
+            self.predict_function = network.compile()
+
+        self.network = network
+        self.batch_size = batch_size
+        self.max_latency = max_latency
+
+        self.n_batches = 0
+        self.n_requests = 0
+
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.thread = None
+        self.is_closed = False
+
+    def collect_batch(self, request):
+        """
+        Collects requests that have the same sample shape until batch
+        is full or latency budget of the first request is over.
+
+        Returns
+        -------
+        tuple
+            List of the requests in the batch and the request that
+            has been received, but cannot be added to the batch.
+            Second value equal to ``None`` when there is no such
+            request.
+        """
+        batch = [request]
+        sample_shape = request.input_data.shape[1:]
+        n_samples = request.n_samples
+        deadline = time.time() + self.max_latency
+
+        while n_samples < self.batch_size:
+            timeout = deadline - time.time()
+
+            try:
+                if timeout > 0:
+                    request = self.queue.get(timeout=timeout)
+                else:
+                    request = self.queue.get_nowait()
+
+            except queue.Empty:
+                return batch, None
+
+            if request is STOP_SIGNAL:
+                return batch, request
+
+            is_full = n_samples + request.n_samples > self.batch_size
+            if is_full or request.input_data.shape[1:] != sample_shape:
+                return batch, request
+
+            batch.append(request)
+            n_samples += request.n_samples
+
+        return batch, None
+
+    def process_batch(self, batch):
+        try:
+            input_data = np.concatenate([r.input_data for r in batch])
+            output = self.predict_function(input_data)
+
+            if len(output) != len(input_data):
+                raise ValueError(
+                    "Network returned {} predictions for {} samples"
+                    "".format(len(output), len(input_data)))
+
+        except Exception:
+            error = sys.exc_info()
+
+            for request in batch:
+                request.finish(error=error)
+
+        else:
+            start = 0
+
+            for request in batch:
+                end = start + request.n_samples
+                request.finish(result=output[start:end])
+                start = end
+
+        self.n_batches += 1
+        self.n_requests += len(batch)
+
+    def run(self):
+        next_request = None
+
+        while True:
+            request = next_request or self.queue.get()
+
+            if request is STOP_SIGNAL:
+                break
+
+            batch, next_request = self.collect_batch(request)
+            self.process_batch(batch)
+
+    def submit(self, input_data, callback=None):
+        """
+        Adds samples to the prediction queue.
+
+        Parameters
+        ----------
+        input_data : array-like
+            Samples ordered along the first dimension.
+
+        callback : callable or None
+            Function that will be triggered from the predictor's
+            thread once prediction is ready. Defaults to ``None``.
+
+        Raises
+        ------
+        ValueError
+            In case if predictor has been closed or input
+            data doesn't have dimension for the samples.
+
+        Returns
+        -------
+        PredictionRequest instance
+        """
+        input_data = np.asarray(input_data)
+
+        if input_data.ndim == 0:
+            raise ValueError("Input data should have at least "
+                             "one dimension for the samples")
+
+        request = PredictionRequest(input_data, callback)
+
+        with self.lock:
+            if self.is_closed:
+                raise ValueError("Predictor has been closed")
+
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run)
+                self.thread.daemon = True
+                self.thread.start()
+
+            self.queue.put(request)
+
+        return request
+
+    def predict(self, input_data, timeout=None):
+        """
+        Makes prediction for the samples. Method blocks until
+        predictor processes batch that includes the samples.
+
+        Parameters
+        ----------
+        input_data : array-like
+            Samples ordered along the first dimension.
+
+        timeout : float or None
+            Maximum number of seconds to wait for the prediction.
+            Defaults to ``None``.
+
+        Returns
+        -------
+        array-like
+        """
+        return self.submit(input_data).wait(timeout)
+
+    def predict_async(self, input_data, loop=None):
+        """
+        Makes prediction for the samples without blocking event loop.
+
+        Parameters
+        ----------
+        input_data : array-like
+            Samples ordered along the first dimension.
+
+        loop : asyncio event loop or None
+            Loop that awaits the prediction. Running event
+            loop will be used in case if value is equal to
+            ``None``. Defaults to ``None``.
+
+        Raises
+        ------
+        RuntimeError
+            In case if loop hasn't been specified and method
+            has been called outside of the running event loop.
+
+        Returns
+        -------
+        asyncio.Future instance
+        """
+        import asyncio
+
+        if loop is None:
+            # Function ``get_running_loop`` is available only
+            # in Python 3.7+. Older versions expose it as private
+            get_running_loop = getattr(
+                asyncio, 'get_running_loop', asyncio._get_running_loop)
+            loop = get_running_loop()
+
+        if loop is None:
+            raise RuntimeError("There is no running event loop. Call "
+                               "method from the coroutine or specify "
+                               "loop explicitly")
+
+        future = loop.create_future()
+
+        def set_future_result(request):
+            if future.cancelled():
+                return
+
+            if request.error is not None:
+                future.set_exception(request.error[1])
+            else:
+                future.set_result(request.result)
+
+        def on_finish(request):
+            try:
+                loop.call_soon_threadsafe(set_future_result, request)
+            except RuntimeError:
+                # Event loop has been closed and nobody
+                # waits for the prediction anymore
+                pass
+
+        self.submit(input_data, callback=on_finish)
+        return future
+
+    def close(self):
+        """
+        Processes requests that have been submitted
+        and stops background thread.
+        """
+        with self.lock:
+            if self.is_closed:
+                return
+
+            self.is_closed = True
+            self.queue.put(STOP_SIGNAL)
+
+        if self.thread is not None:
+            self.thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -1,11 +1,21 @@
+import os
+import re
+import sys
+import bz2
+import gzip
 import json
+import base64
+import struct
 import pkgutil
 import importlib
+import threading
 from time import gmtime, strftime
+from collections import defaultdict
 
 import six
 import theano
 import numpy as np
+import scipy.sparse
 from six.moves import cPickle as pickle
 
 import neupy
@@ -19,6 +29,9 @@ __all__ = (
     'save_pickle', 'load_pickle',
     'save_json', 'load_json',
     'save_hdf5', 'load_hdf5',
+    'save_memmap', 'load_memmap',
+    'save_algorithm', 'load_algorithm',
+    'save_checkpoint', 'load_checkpoint', 'CheckpointWriter',
     'load_dict', 'save_dict')
 
 
@@ -83,14 +96,243 @@ def validate_layer_compatibility(layer, layer_data):
                       layer.output_shape))
 
 
+def iter_parameter_stacks(layer):
+    """
+    Iterates over stacked parameters in the layer.
+
+    Yields
+    ------
+    tuple
+        Tuple that contains stacked parameter, axis along which
+        parameters were stacked and names of the parameters.
+    """
+    for stacked_name, axis, names in getattr(layer, 'parameter_stacks', []):
+        if stacked_name in layer.parameters:
+            yield layer.parameters[stacked_name], axis, list(names)
+
+
+def iter_layer_parameters(layer):
+    """
+    Iterates over layer's parameters. Stacked parameters split
+    into the parameters from which they were stacked and sparse
+    parameters are converted into the dense arrays. Stored data
+    doesn't depend on the way layer stores its parameters.
+
+    Yields
+    ------
+    tuple
+        Tuple that contains parameter's name, value and
+        flag that shows whether parameter is trainable.
+    """
+    stacked_parameters = {}
+    for parameter, axis, names in iter_parameter_stacks(layer):
+        stacked_parameters[parameter] = (axis, names)
+
+    for param_name, parameter in layer.parameters.items():
+        if parameter not in stacked_parameters:
+            value = parameter.get_value()
+
+            if scipy.sparse.issparse(value):
+                value = value.toarray()
+
+            yield param_name, value, parameter.trainable
+            continue
+
+        axis, names = stacked_parameters[parameter]
+        values = np.split(parameter.get_value(), len(names), axis=axis)
+
+        for name, value in zip(names, values):
+            yield name, value, parameter.trainable
+
+
+def restore_empty_shape(value, shape):
+    """
+    Nested lists cannot represent dimensions that follow the empty
+    one, for instance, array with shape ``(0, 5)`` is stored as
+    ``[]``. Function restores parameter's shape for empty values.
+    """
+    if value.size == 0 and int(np.prod(shape)) == 0:
+        return value.reshape(shape)
+    return value
+
+
+def set_parameter_value(layer, param_name, value):
+    """
+    Set value for the layer's parameter. In case if parameter
+    is a part of the stacked parameter, function updates
+    related part of the stacked parameter.
+    """
+    for parameter, axis, names in iter_parameter_stacks(layer):
+        if param_name in names:
+            stacked_value = parameter.get_value()
+            parts = np.split(stacked_value, len(names), axis=axis)
+            part = parts[names.index(param_name)]
+            part[...] = restore_empty_shape(value, part.shape)
+
+            parameter.set_value(stacked_value)
+            return
+
+    parameter = getattr(layer, param_name)
+    current_value = parameter.get_value()
+    value = restore_empty_shape(value, current_value.shape)
+
+    if scipy.sparse.issparse(current_value):
+        # Parameters are stored as dense arrays
+        value = scipy.sparse.csr_matrix(value)
+
+    # Memory-mapped arrays are used directly as parameter's storage,
+    # which means that different processes that load parameters from
+    # the same file will share the same memory.
+    parameter.set_value(value, borrow=isinstance(value, np.memmap))
+
+
+# Precisions that can be used in order to store parameters.
+# Values will be converted back to the ``floatX`` during loading.
+PRECISIONS = ('float64', 'float32', 'float16', 'bfloat16', 'int8')
+
+
+def validate_precision(precision):
+    """
+    Checks whether parameters can be stored with specified precision.
+
+    Raises
+    ------
+    ValueError
+        In case if precision is not supported.
+    """
+    if precision is not None and precision not in PRECISIONS:
+        raise ValueError(
+            "Invalid value for the `precision` argument: {}. Should be "
+            "one of the following values: {}"
+            "".format(precision, ', '.join(PRECISIONS)))
+
+
+def encode_bfloat16(value):
+    """
+    Converts array into the 16-bit format that has the same
+    exponent as the ``float32``, but only 7 bits in the mantissa.
+    Values are rounded to the nearest representable number.
+
+    Returns
+    -------
+    array-like
+        Array with ``uint16`` values that contain higher 16 bits
+        from the ``float32`` representation of the values.
+    """
+    bits = np.asarray(value, dtype=np.float32).view(np.uint32)
+    rounding_bias = np.uint32(0x7FFF) + ((bits >> 16) & 1)
+    encoded = ((bits + rounding_bias) >> 16).astype(np.uint16)
+
+    # Rounding can turn some of the NaN values into infinities
+    encoded[np.isnan(value)] = 0x7FC0
+    return encoded
+
+
+def decode_bfloat16(value):
+    bits = np.asarray(value).astype(np.uint32) << 16
+    return bits.view(np.float32)
+
+
+def quantize_int8(value):
+    """
+    Applies linear quantization with parameters defined
+    from the range of values. Zero can always be
+    represented exactly.
+
+    Returns
+    -------
+    tuple
+        Tuple that contains array with ``int8`` values, scale and
+        zero point. Original values can be approximated as
+        ``(quantized_value - zero_point) * scale``.
+    """
+    min_value = min(np.min(value), 0) if value.size else 0
+    max_value = max(np.max(value), 0) if value.size else 0
+
+    scale = float(max_value - min_value) / 255
+    scale = scale if scale > 0 else 1.
+
+    zero_point = int(np.clip(np.round(-128 - min_value / scale), -128, 127))
+    quantized = np.clip(np.round(value / scale) + zero_point, -128, 127)
+
+    return quantized.astype(np.int8), scale, zero_point
+
+
+def encode_parameter(value, precision=None):
+    """
+    Converts parameter's value into the format that will be stored.
+
+    Parameters
+    ----------
+    value : array-like
+
+    precision : str or None
+        Precision that will be used in order to store the value.
+        The ``None`` value means that value will be stored
+        with ``floatX`` precision. Defaults to ``None``.
+
+    Returns
+    -------
+    array-like or dict
+        Floating point precisions will be represented with
+        arrays. Values stored with other precisions will be
+        represented with dictionary that has key ``precision``
+        and stores encoded array under the key ``value``.
+    """
+    validate_precision(precision)
+
+    if precision is None:
+        return asfloat(value)
+
+    if precision == 'bfloat16':
+        return {'precision': precision, 'value': encode_bfloat16(value)}
+
+    if precision == 'int8':
+        quantized, scale, zero_point = quantize_int8(value)
+        return {
+            'precision': precision,
+            'value': quantized,
+            'scale': scale,
+            'zero_point': zero_point,
+        }
+
+    return np.asarray(value).astype(precision)
+
+
+def decode_parameter(value):
+    """
+    Converts stored value, created with the ``encode_parameter``
+    function, into the array with ``floatX`` values.
+
+    Raises
+    ------
+    InvalidFormat
+        In case if value stored with unknown precision.
+    """
+    if not isinstance(value, dict):
+        return asfloat(value)
+
+    precision = value.get('precision')
+
+    if precision == 'bfloat16':
+        return asfloat(decode_bfloat16(value['value']))
+
+    if precision == 'int8':
+        quantized = np.asarray(value['value'], dtype=np.float64)
+        return asfloat((quantized - value['zero_point']) * value['scale'])
+
+    raise InvalidFormat("Parameter stored with unknown precision: "
+                        "{}".format(precision))
+
+
 def load_layer_parameter(layer, layer_data):
     """
     Set layer parameters to the values specified in the
     stored data
     """
     for param_name, param_data in layer_data['parameters'].items():
-        parameter = getattr(layer, param_name)
-        parameter.set_value(asfloat(param_data['value']))
+        value = decode_parameter(param_data['value'])
+        set_parameter_value(layer, param_name, value)
 
 
 def load_dict_by_names(layers_conn, layers_data, ignore_missed=False):
@@ -293,7 +535,65 @@ def load_dict(connection, data, ignore_missed=False, load_by='names_or_order'):
     connection.initialize()
 
 
-def save_dict(connection):
+def dump_metadata():
+    """
+    Returns information about the environment
+    in which network has been saved.
+
+    Returns
+    -------
+    dict
+    """
+    return {
+        'language': 'python',
+        'library': 'neupy',
+        'version': neupy.__version__,
+        'created': strftime("%a, %d %b %Y %H:%M:%S %Z", gmtime()),
+        'theano_float': theano.config.floatX,
+    }
+
+
+def dump_layer(layer, precision=None):
+    """
+    Returns information about the layer and its parameters
+    in the dictionary format.
+
+    Parameters
+    ----------
+    layer : layer
+
+    precision : str or None
+        Precision that will be used in order to store
+        parameters. Defaults to ``None``.
+
+    Returns
+    -------
+    dict
+    """
+    parameters = {}
+    configs = {}
+
+    for attrname, value, trainable in iter_layer_parameters(layer):
+        parameters[attrname] = {
+            'value': encode_parameter(value, precision),
+            'trainable': trainable,
+        }
+
+    for option_name in layer.options:
+        if option_name not in parameters:
+            configs[option_name] = getattr(layer, option_name)
+
+    return {
+        'class_name': layer.__class__.__name__,
+        'input_shape': layer.input_shape,
+        'output_shape': layer.output_shape,
+        'name': layer.name,
+        'parameters': parameters,
+        'configs': configs,
+    }
+
+
+def save_dict(connection, precision=None):
     """
     Save network into the dictionary.
 
@@ -301,6 +601,30 @@ def save_dict(connection):
     ----------
     connection : network, list of layer or connection
 
+    precision : str or None
+        Precision that will be used in order to store parameters.
+        Parameters will be converted back to the ``floatX``
+        type during the loading.
+
+        - ``None`` - Parameters will be stored with ``floatX``
+          precision.
+
+        - ``float64``, ``float32``, ``float16`` - Parameters will
+          be stored as arrays with specified data type.
+
+        - ``bfloat16`` - Parameters will be stored as 16-bit
+          numbers that have the same exponent as ``float32`` and
+          only 7 bits for the mantissa. Stored as ``uint16`` values.
+
+        - ``int8`` - Each parameter will be quantized linearly
+          into the 256 levels. Scale and zero point will be stored
+          together with quantized values.
+
+        Values stored with ``bfloat16`` and ``int8`` precisions
+        are represented as dictionaries that have keys
+        ``precision`` and ``value``. Quantized values also have
+        keys ``scale`` and ``zero_point``. Defaults to ``None``.
+
     Returns
     -------
     dict
@@ -319,48 +643,82 @@ def save_dict(connection):
     ['layers', 'graph', 'metadata']
     """
     connection = extract_connection(connection)
-    data = {
-        'metadata': {
-            'language': 'python',
-            'library': 'neupy',
-            'version': neupy.__version__,
-            'created': strftime("%a, %d %b %Y %H:%M:%S %Z", gmtime()),
-            'theano_float': theano.config.floatX,
-        },
+    return {
+        'metadata': dump_metadata(),
         # Make it as a list in order to save the right order
         # of paramters, otherwise it can be convert to the dictionary.
         'graph': connection.graph.layer_names_only(),
-        'layers': [],
+        'layers': [dump_layer(layer, precision) for layer in connection],
     }
 
-    for layer in connection:
-        parameters = {}
-        configs = {}
 
-        for attrname, parameter in layer.parameters.items():
-            parameters[attrname] = {
-                'value': asfloat(parameter.get_value()),
-                'trainable': parameter.trainable,
-            }
+# Compression algorithms that can be applied to the pickle files.
+# Each algorithm identified by the bytes in the beginning of the file.
+PICKLE_COMPRESSIONS = {
+    'gzip': (b'\x1f\x8b', gzip.open),
+    'bz2': (b'BZh', bz2.BZ2File),
+}
+
+
+def open_pickle_file(filepath, mode, compression=None):
+    """
+    Opens pickle file. In the read mode, compression will
+    be identified from the file's content.
+
+    Parameters
+    ----------
+    filepath : str
+
+    mode : {{``rb``, ``wb``}}
+
+    compression : {{``None``, ``gzip``, ``bz2``}}
+        Compression that will be used in the write mode.
+        Defaults to ``None``.
+
+    Raises
+    ------
+    ValueError
+        In case if compression is not supported.
+
+    Returns
+    -------
+    file object
+    """
+    if compression is not None and compression not in PICKLE_COMPRESSIONS:
+        raise ValueError(
+            "Invalid value for the `compression` argument: {}. Should be "
+            "one of the following values: {}"
+            "".format(compression, ', '.join(sorted(PICKLE_COMPRESSIONS))))
+
+    if mode == 'rb':
+        with open(filepath, 'rb') as f:
+            prefix = f.read(3)
 
-        for option_name in layer.options:
-            if option_name not in parameters:
-                configs[option_name] = getattr(layer, option_name)
+        for name, (signature, _) in PICKLE_COMPRESSIONS.items():
+            if prefix.startswith(signature):
+                compression = name
 
-        data['layers'].append({
-            'class_name': layer.__class__.__name__,
-            'input_shape': layer.input_shape,
-            'output_shape': layer.output_shape,
-            'name': layer.name,
-            'parameters': parameters,
-            'configs': configs,
-        })
+    if compression is None:
+        return open(filepath, mode)
 
-    return data
+    _, open_compressed_file = PICKLE_COMPRESSIONS[compression]
+    return open_compressed_file(filepath, mode)
+
+
+def write_pickle(data, filepath, python_compatible=True, compression=None):
+    """
+    Writes data, created with the ``save_dict`` function,
+    into the pickle file.
+    """
+    with open_pickle_file(filepath, 'wb', compression) as f:
+        # Protocol 2 is compatible for both python versions
+        protocol = pickle.HIGHEST_PROTOCOL if python_compatible else 2
+        pickle.dump(data, f, protocol)
 
 
 @shared_docs(save_dict)
-def save_pickle(connection, filepath, python_compatible=True):
+def save_pickle(connection, filepath, python_compatible=True,
+                precision=None, compression=None):
     """
     Save layer parameters in pickle file.
 
@@ -378,20 +736,27 @@ def save_pickle(connection, filepath, python_compatible=True):
         protocol (`pickle.HIGHEST_PROTOCOL`).
         Defaults to `True`.
 
+    {save_dict.precision}
+
+    compression : {{``None``, ``gzip``, ``bz2``}}
+        Compression algorithm that will be applied to the file.
+        Data is compressed while it's written into the file.
+        File will be decompressed automatically during the
+        loading. Defaults to ``None``.
+
     Examples
     --------
     >>> from neupy import layers, storage
     >>>
     >>> connection = layers.Input(10) > layers.Softmax(3)
     >>> storage.save_pickle(connection, '/path/to/parameters.pickle')
+    >>>
+    >>> storage.save_pickle(connection, '/path/to/parameters.pickle',
+    ...                     precision='float16', compression='gzip')
     """
     connection = extract_connection(connection)
-    data = save_dict(connection)
-
-    with open(filepath, 'wb+') as f:
-        # Protocol 2 is compatible for both python versions
-        protocol = pickle.HIGHEST_PROTOCOL if python_compatible else 2
-        pickle.dump(data, f, protocol)
+    data = save_dict(connection, precision)
+    write_pickle(data, filepath, python_compatible, compression)
 
 
 @shared_docs(load_dict)
@@ -399,7 +764,8 @@ def load_pickle(connection, filepath, ignore_missed=False,
                 load_by='names_or_order'):
     """
     Load and set parameters for layers from the
-    specified filepath.
+    specified filepath. Compressed files will be
+    decompressed automatically.
 
     Parameters
     ----------
@@ -425,7 +791,7 @@ def load_pickle(connection, filepath, ignore_missed=False,
     """
     connection = extract_connection(connection)
 
-    with open(filepath, 'rb') as f:
+    with open_pickle_file(filepath, 'rb') as f:
         if six.PY3:
             # Specify encoding for python 3 in order to be able to
             # read files that has been created in python 2
@@ -436,28 +802,12 @@ def load_pickle(connection, filepath, ignore_missed=False,
     load_dict(connection, data, ignore_missed, load_by)
 
 
-@shared_docs(save_dict)
-def save_hdf5(connection, filepath):
+def write_hdf5(data, filepath, compression=None):
     """
-    Save network parameters in HDF5 format.
-
-    Parameters
-    ----------
-    {save_dict.connection}
-
-    filepath : str
-        Path to the HDF5 file that stores network parameters.
-
-    Examples
-    --------
-    >>> from neupy import layers, storage
-    >>>
-    >>> connection = layers.Input(10) > layers.Softmax(3)
-    >>> storage.save_hdf5(connection, '/path/to/parameters.hdf5')
+    Writes data, created with the ``save_dict`` function,
+    into the HDF5 file.
     """
     hdf5 = load_hdf5_module()
-    connection = extract_connection(connection)
-    data = save_dict(connection)
 
     with hdf5.File(filepath, mode='w') as f:
         layer_names = []
@@ -472,11 +822,28 @@ def save_hdf5(connection, filepath):
                         attrvalue, default=repr)
 
             for param_name, param in layer['parameters'].items():
+                value = param['value']
+                encoding = {}
+
+                if isinstance(value, dict):
+                    # Encoded array stored as a dataset and the rest
+                    # of the information stored in its attributes
+                    encoding = value.copy()
+                    value = encoding.pop('value')
+
+                options = {}
+                # Scalars cannot be split into chunks
+                if compression is not None and value.ndim > 0:
+                    options = dict(compression=compression, shuffle=True)
+
                 dataset = layer_group.create_dataset(
-                    param_name, data=param['value'])
+                    param_name, data=value, **options)
 
                 dataset.attrs['trainable'] = param['trainable']
 
+                for attrname, attrvalue in encoding.items():
+                    dataset.attrs[attrname] = attrvalue
+
             layer_names.append(layer_name)
 
         f.attrs['metadata'] = json.dumps(data['metadata'])
@@ -484,6 +851,43 @@ def save_hdf5(connection, filepath):
         f.attrs['layer_names'] = json.dumps(layer_names)
 
 
+@shared_docs(save_dict)
+def save_hdf5(connection, filepath, precision=None, compression=None):
+    """
+    Save network parameters in HDF5 format.
+
+    Parameters
+    ----------
+    {save_dict.connection}
+
+    filepath : str
+        Path to the HDF5 file that stores network parameters.
+
+    {save_dict.precision}
+
+    compression : {{``None``, ``gzip``, ``lzf``}}
+        Compression filter that will be applied to the parameters.
+        Parameters will be stored in chunks and each chunk will be
+        compressed separately. Filters are applied transparently
+        during the reading, which means that other applications
+        can read parameters without additional steps.
+        Defaults to ``None``.
+
+    Examples
+    --------
+    >>> from neupy import layers, storage
+    >>>
+    >>> connection = layers.Input(10) > layers.Softmax(3)
+    >>> storage.save_hdf5(connection, '/path/to/parameters.hdf5')
+    >>>
+    >>> storage.save_hdf5(connection, '/path/to/parameters.hdf5',
+    ...                   precision='int8', compression='gzip')
+    """
+    connection = extract_connection(connection)
+    data = save_dict(connection, precision)
+    write_hdf5(data, filepath, compression)
+
+
 @shared_docs(load_dict)
 def load_hdf5(connection, filepath, ignore_missed=False,
               load_by='names_or_order'):
@@ -535,9 +939,17 @@ def load_hdf5(connection, filepath, ignore_missed=False,
 
             layer['parameters'] = {}
             for param_name, parameter in layer_group.items():
+                value = parameter.value
+                encoding = dict(parameter.attrs.items())
+                trainable = encoding.pop('trainable')
+
+                if 'precision' in encoding:
+                    encoding['precision'] = str(encoding['precision'])
+                    value = dict(encoding, value=value)
+
                 layer['parameters'][param_name] = {
-                    'value': parameter.value,
-                    'trainable': parameter.attrs['trainable'],
+                    'value': value,
+                    'trainable': trainable,
                 }
 
             data['layers'].append(layer)
@@ -545,151 +957,1450 @@ def load_hdf5(connection, filepath, ignore_missed=False,
     load_dict(connection, data, ignore_missed, load_by)
 
 
-def convert_numpy_array_to_list_recursively(data):
-    for key, value in data.items():
-        if isinstance(value, dict):
-            convert_numpy_array_to_list_recursively(value)
+# Number of values or bytes that will be converted
+# into JSON per one write operation
+JSON_CHUNK_SIZE = 2 ** 16
+
+
+def json_default(value):
+    """
+    Converts values that cannot be serialized with
+    JSON module into the serializable format.
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
 
-        elif isinstance(value, np.ndarray):
-            data[key] = value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
 
-        elif isinstance(value, list):
-            for entity in value:
-                if isinstance(entity, dict):
-                    convert_numpy_array_to_list_recursively(entity)
+    return repr(value)
 
 
-def dump_with_fastest_json_module(data, f, indent=None):
+def write_json_array(f, array):
     """
-    Data will be dumped using `ujson` module in case if it installed,
-    otherwise Python's built-in `json` module will be used.
+    Writes array into the file as nested JSON lists. Array
+    is converted into the text by small chunks, which means
+    that there is no need to create list with all values.
 
     Parameters
     ----------
-    data : dict
-
     f : file object
-        Opened file that available for writing
-
-    indent : int or None
-        JSON indentation.
+    array : array-like
     """
-    # Without extra data processor we won't be able to dump
-    # numpy array into json without raising an error.
-    # `json` will have issues with numpy array encoding
-    # `ujson` will have issue with numpy float or int encoding
-    convert_numpy_array_to_list_recursively(data)
+    if array.ndim == 0:
+        f.write(json.dumps(array.item()))
+
+    elif array.ndim == 1:
+        f.write('[')
+
+        for start in range(0, array.size, JSON_CHUNK_SIZE):
+            if start > 0:
+                f.write(', ')
 
-    if pkgutil.find_loader('ujson'):
-        ujson = importlib.import_module('ujson')
+            values = array[start:start + JSON_CHUNK_SIZE].tolist()
+            f.write(json.dumps(values)[1:-1])
 
-        if indent is None:
-            # Indentation functionality behaves differently compare
-            # to the one that Pytnon has in built-in json module.
-            #
-            # Note: indent=0 will give different output
-            # for ujson and json
-            indent = 0
+        f.write(']')
 
-        return ujson.dump(data, f, indent=indent)
-    return json.dump(data, f, indent=indent, default=repr)
+    else:
+        f.write('[')
+
+        for index, subarray in enumerate(array):
+            if index > 0:
+                f.write(', ')
+
+            write_json_array(f, subarray)
+
+        f.write(']')
 
 
-def load_with_fastest_json_module(f):
+def write_base64_array(f, array):
     """
-    Data will be loaded using `ujson` module in case if it installed,
-    otherwise Python's built-in `json` module will be used.
+    Writes array into the file as a JSON object that
+    contains array's data encoded with base64.
 
     Parameters
     ----------
     f : file object
-        Opened file that available for reading
+    array : array-like
     """
-    if pkgutil.find_loader('ujson'):
-        ujson = importlib.import_module('ujson')
-        return ujson.load(f)
-    return json.load(f)
+    array = np.asarray(array, order='C')
+    data = array.reshape(-1).view(np.uint8)
 
+    f.write('{"encoding": "base64", ')
+    f.write('"dtype": {}, '.format(json.dumps(array.dtype.str)))
+    f.write('"shape": {}, '.format(json.dumps(array.shape)))
+    f.write('"data": "')
 
-@shared_docs(save_dict)
-def save_json(connection, filepath, indent=None):
-    """
-    Save network parameters in JSON format.
-
-    Parameters
-    ----------
-    {save_dict.connection}
+    # Three bytes will be encoded with four characters
+    step = 3 * JSON_CHUNK_SIZE
 
-    filepath : str
-        Path to the JSON file that stores network parameters.
+    for start in range(0, data.size, step):
+        chunk = data[start:start + step].tobytes()
+        f.write(base64.b64encode(chunk).decode('ascii'))
 
-    indent : int or None
-        Indentation that would be specified for the output JSON.
-        Intentation equal to `2` or `4` makes it easy to read raw
-        text files. The `None` value disables indentation which means
-        that everything will be stored compactly. Defaults to `None`.
+    f.write('"}')
 
-    Notes
-    -----
-    Install `ujson` library in order to speed up saving and
-    loading procedure.
 
-    Examples
-    --------
-    >>> from neupy import layers, storage
-    >>>
-    >>> connection = layers.Input(10) > layers.Softmax(3)
-    >>> storage.save_json(connection, '/path/to/parameters.json')
+def write_json_parameter(f, value, binary=False):
     """
-    connection = extract_connection(connection)
-    data = save_dict(connection)
+    Writes parameter's value into the file. Encoded values
+    will be written as objects.
+    """
+    write_array = write_base64_array if binary else write_json_array
 
-    with open(filepath, 'w') as f:
-        dump_with_fastest_json_module(data, f)
+    if not isinstance(value, dict):
+        return write_array(f, value)
 
+    encoding = value.copy()
+    array = encoding.pop('value')
 
-@shared_docs(load_dict)
-def load_json(connection, filepath, ignore_missed=False,
-              load_by='names_or_order'):
+    f.write('{')
+
+    for key, attrvalue in sorted(encoding.items()):
+        f.write('{}: {}, '.format(json.dumps(key), json.dumps(attrvalue)))
+
+    f.write('"value": ')
+    write_array(f, array)
+    f.write('}')
+
+
+def write_json_layer(f, layer_data, binary=False):
     """
-    Load network parameters from JSON file.
+    Writes information about the layer into the file.
+    Parameters will be written into the file one by one.
 
     Parameters
     ----------
-    {load_dict.connection}
+    f : file object
 
-    filepath : str
-        Path to JSON file that will store network parameters.
+    layer_data : dict
+        Information about the layer created with
+        the ``dump_layer`` function.
 
-    {load_dict.ignore_missed}
+    binary : bool
+        Defines whether parameters will be written in the
+        base64 encoding. Defaults to ``False``.
+    """
+    layer_data = layer_data.copy()
+    parameters = layer_data.pop('parameters')
 
-    {load_dict.load_by}
+    f.write('{')
 
-    Raises
-    ------
-    {load_dict.Raises}
+    for key, value in sorted(layer_data.items()):
+        f.write('{}: {}, '.format(
+            json.dumps(key), json.dumps(value, default=json_default)))
 
-    Notes
-    -----
-    Install `ujson` library in order to speed up saving and
-    loading procedure.
+    f.write('"parameters": {')
 
-    Examples
-    --------
-    >>> from neupy import layers, storage
-    >>>
+    for index, (name, parameter) in enumerate(sorted(parameters.items())):
+        if index > 0:
+            f.write(', ')
+
+        f.write('{}: {{"trainable": {}, "value": '.format(
+            json.dumps(name), json.dumps(parameter['trainable'])))
+
+        write_json_parameter(f, parameter['value'], binary)
+        f.write('}')
+
+    f.write('}}')
+
+
+def is_parameter_value(path):
+    """
+    Checks whether path inside of the JSON document
+    points to the parameter's value. Encoded values
+    store array under the key ``value``.
+    """
+    return (
+        len(path) in (5, 6) and path[0] == 'layers' and
+        path[2] == 'parameters' and path[4:] in (('value',),
+                                                 ('value', 'value'))
+    )
+
+
+def decode_base64_array(value):
+    """
+    Converts JSON object created by the ``write_base64_array``
+    function into the array.
+    """
+    if value.get('encoding') != 'base64':
+        raise InvalidFormat("Parameter stored with unknown encoding: "
+                            "{}".format(value.get('encoding')))
+
+    dtype = np.dtype(str(value['dtype']))
+    array = np.frombuffer(value['data'], dtype=dtype)
+
+    return array.reshape(value['shape'])
+
+
+class JSONStreamReader(object):
+    """
+    Reads JSON document from the file by chunks. Parameter values
+    are converted into the arrays directly from the text without
+    creating Python lists, which makes it possible to load large
+    networks without consuming too much memory.
+
+    Parameters
+    ----------
+    f : file object
+        File opened in the text mode.
+
+    chunk_size : int
+        Number of characters that will be read from the file
+        at once. Defaults to ``2 ** 20``.
+    """
+    whitespaces = ' \t\n\r'
+    literals = {
+        'true': True,
+        'false': False,
+        'null': None,
+        'NaN': float('nan'),
+        'Infinity': float('inf'),
+        '-Infinity': float('-inf'),
+    }
+
+    string_regexp = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+    literal_regexp = re.compile(
+        r'-?(?:Infinity|\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)|true|false|null|NaN')
+    bracket_regexp = re.compile(r'[\[\]]')
+
+    # Number of characters that should be available in the
+    # buffer in order to make sure that literal was read
+    max_literal_size = 64
+
+    def __init__(self, f, chunk_size=2 ** 20):
+        self.file = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.position = 0
+
+    def read_chunk(self):
+        """
+        Removes processed text from the buffer and adds next
+        chunk from the file. Returns ``False`` in case if
+        there is nothing to read.
+        """
+        chunk = self.file.read(self.chunk_size)
+
+        if not chunk:
+            return False
+
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+
+        return True
+
+    def peek(self):
+        """
+        Skips whitespaces and returns next character. Returns
+        empty string in case if document has been read.
+        """
+        while True:
+            while self.position < len(self.buffer):
+                char = self.buffer[self.position]
+
+                if char not in self.whitespaces:
+                    return char
+
+                self.position += 1
+
+            if not self.read_chunk():
+                return ''
+
+    def expect(self, expected_char):
+        char = self.peek()
+
+        if char != expected_char:
+            raise InvalidFormat("Invalid JSON document. Expected {!r}, "
+                                "got {!r}".format(expected_char, char))
+
+        self.position += 1
+
+    def match(self, regexp):
+        """
+        Reads token that matches regular expression.
+        """
+        self.peek()
+
+        while True:
+            match = regexp.match(self.buffer, self.position)
+            # Token can continue in the next chunk. Partially read
+            # number can look like a complete one, for instance,
+            # in case if only part of the exponent has been read.
+            n_remaining = len(self.buffer) - self.position
+            need_more_data = (
+                match is None or
+                match.end() == len(self.buffer) or
+                n_remaining < self.max_literal_size
+            )
+
+            if not need_more_data or not self.read_chunk():
+                break
+
+        if match is None:
+            raise InvalidFormat(
+                "Invalid JSON document. Unexpected value: {!r}"
+                "".format(self.buffer[self.position:self.position + 20]))
+
+        self.position = match.end()
+        return match.group()
+
+    def parse(self):
+        """
+        Parses JSON document.
+
+        Raises
+        ------
+        InvalidFormat
+            In case if document has invalid format.
+
+        Returns
+        -------
+        object
+        """
+        value = self.parse_value(path=())
+
+        if self.peek():
+            raise InvalidFormat("Invalid JSON document. Document has "
+                                "extra data after the last value")
+
+        return value
+
+    def parse_value(self, path):
+        char = self.peek()
+
+        if char == '{':
+            return self.parse_object(path)
+
+        if char == '[' and is_parameter_value(path):
+            return self.parse_numeric_array()
+
+        if char == '[':
+            return self.parse_array(path)
+
+        if char == '"':
+            return json.loads(self.match(self.string_regexp))
+
+        token = self.match(self.literal_regexp)
+
+        if token in self.literals:
+            return self.literals[token]
+
+        if any(char in token for char in '.eE'):
+            return float(token)
+
+        return int(token)
+
+    def parse_object(self, path):
+        self.expect('{')
+        value = {}
+
+        if self.peek() == '}':
+            self.position += 1
+            return value
+
+        while True:
+            if self.peek() != '"':
+                self.expect('"')
+
+            key = json.loads(self.match(self.string_regexp))
+            self.expect(':')
+
+            if key == 'data' and is_parameter_value(path):
+                value[key] = self.parse_base64_data()
+            else:
+                value[key] = self.parse_value(path + (key,))
+
+            if self.peek() == '}':
+                self.position += 1
+                break
+
+            self.expect(',')
+
+        # Values stored with reduced precision will be
+        # decoded during the loading
+        if is_parameter_value(path) and 'precision' not in value:
+            return decode_base64_array(value)
+
+        return value
+
+    def parse_array(self, path):
+        self.expect('[')
+        values = []
+
+        if self.peek() == ']':
+            self.position += 1
+            return values
+
+        while True:
+            values.append(self.parse_value(path + (len(values),)))
+
+            if self.peek() == ']':
+                self.position += 1
+                return values
+
+            self.expect(',')
+
+    def parse_numbers(self, text):
+        """
+        Converts comma separated numbers into the array.
+        """
+        # Conversion also handles special values, like NaN or Infinity
+        try:
+            return np.array(text.split(','), dtype=float)
+
+        except ValueError:
+            raise InvalidFormat("Invalid JSON document. Parameter "
+                                "values should be numbers")
+
+    def parse_numeric_array(self):
+        """
+        Parses nested lists with numbers and converts them into
+        the array. Shape of the array will be defined from
+        the number of nested lists.
+        """
+        # Number of closed lists per each level of nesting
+        n_closed_lists = defaultdict(int)
+        depth, ndim = 0, None
+
+        # Levels of nesting that contain numbers. For the valid
+        # array, there should be only one level.
+        value_levels = set()
+        parts, remainder = [], ''
+
+        while True:
+            end = None
+            previous_end = self.position
+
+            for match in self.bracket_regexp.finditer(
+                    self.buffer, self.position):
+
+                text = self.buffer[previous_end:match.start()]
+                previous_end = match.end()
+
+                if text.strip(self.whitespaces + ','):
+                    value_levels.add(depth)
+
+                if match.group() == '[':
+                    depth += 1
+                    continue
+
+                if ndim is None:
+                    ndim = depth
+
+                n_closed_lists[depth] += 1
+                depth -= 1
+
+                if depth == 0:
+                    end = match.end()
+                    break
+
+            text = self.buffer[self.position:end]
+            text = remainder + text.replace('[', ' ').replace(']', ' ')
+
+            if end is None:
+                if self.buffer[previous_end:].strip(self.whitespaces + ','):
+                    value_levels.add(depth)
+
+                # Last number in the chunk might not be complete
+                text, _, remainder = text.rpartition(',')
+                self.position = len(self.buffer)
+
+                if not self.read_chunk():
+                    raise InvalidFormat("Invalid JSON document. "
+                                        "Unexpected end of the file")
+
+            # Empty lists leave only separators between brackets
+            if text.strip(self.whitespaces + ','):
+                parts.append(self.parse_numbers(text))
+
+            if end is not None:
+                self.position = end
+                break
+
+        values = np.concatenate(parts) if parts else np.array([])
+        shape = [n_closed_lists[level + 1] // n_closed_lists[level]
+                 for level in range(1, ndim)]
+        shape.append(values.size // n_closed_lists[ndim])
+
+        if value_levels - {ndim} or int(np.prod(shape)) != values.size:
+            raise InvalidFormat("Invalid JSON document. Parameter "
+                                "has irregular shape")
+
+        return values.reshape(shape)
+
+    def parse_base64_data(self):
+        self.expect('"')
+        parts, remainder = [], ''
+
+        while True:
+            end = self.buffer.find('"', self.position)
+            text = self.buffer[self.position:end if end >= 0 else None]
+            # Some JSON encoders escape slashes
+            text = remainder + text.replace('\\', '')
+
+            if end < 0:
+                # Every four characters encode three bytes
+                n_characters = len(text) - len(text) % 4
+                text, remainder = text[:n_characters], text[n_characters:]
+                self.position = len(self.buffer)
+
+                if not self.read_chunk():
+                    raise InvalidFormat("Invalid JSON document. "
+                                        "Unexpected end of the file")
+
+            parts.append(base64.b64decode(text.encode('ascii')))
+
+            if end >= 0:
+                self.position = end + 1
+                return b''.join(parts)
+
+
+def write_json(data, filepath, indent=None, binary=False):
+    """
+    Writes data, created with the ``save_dict`` function,
+    into the JSON file. Layers can be specified with iterator.
+    """
+    if indent is None:
+        newline = layer_newline = ''
+    else:
+        newline = '\n' + ' ' * indent
+        layer_newline = '\n' + ' ' * (2 * indent)
+
+    with open(filepath, 'w') as f:
+        f.write('{' + newline)
+        f.write('"metadata": {},'.format(json.dumps(data['metadata'])))
+        f.write((newline or ' ') + '"graph": {},'.format(
+            json.dumps(data['graph'], default=json_default)))
+        f.write((newline or ' ') + '"layers": [')
+
+        for index, layer_data in enumerate(data['layers']):
+            if index > 0:
+                f.write(',' if layer_newline else ', ')
+
+            f.write(layer_newline)
+            write_json_layer(f, layer_data, binary)
+
+        f.write(newline + ']' + newline[:1] + '}')
+
+
+@shared_docs(save_dict)
+def save_json(connection, filepath, indent=None, binary=False,
+              precision=None):
+    """
+    Save network parameters in JSON format. Parameters are
+    written into the file one by one, which means that it's
+    possible to save networks that need much more memory after
+    conversion to the text than it's available.
+
+    Parameters
+    ----------
+    {save_dict.connection}
+
+    filepath : str
+        Path to the JSON file that stores network parameters.
+
+    indent : int or None
+        Indentation that would be specified for the output JSON.
+        Each layer will be stored on a separate line with
+        specified indentation. The `None` value disables
+        indentation which means that everything will be stored
+        compactly. Defaults to `None`.
+
+    binary : bool
+        `False` means that parameters will be stored as nested lists
+        of numbers. `True` means that parameters will be stored as
+        objects that contain array's shape, data type and raw data
+        encoded with base64. Binary format is more compact and
+        stores exact values. Defaults to `False`.
+
+    {save_dict.precision}
+
+    Examples
+    --------
+    >>> from neupy import layers, storage
+    >>>
+    >>> connection = layers.Input(10) > layers.Softmax(3)
+    >>> storage.save_json(connection, '/path/to/parameters.json')
+    """
+    connection = extract_connection(connection)
+    validate_precision(precision)
+
+    data = {
+        'metadata': dump_metadata(),
+        'graph': connection.graph.layer_names_only(),
+        # Each layer will be converted into the dictionary
+        # only when previous layer has been written
+        'layers': (dump_layer(layer, precision) for layer in connection),
+    }
+    write_json(data, filepath, indent, binary)
+
+
+@shared_docs(load_dict)
+def load_json(connection, filepath, ignore_missed=False,
+              load_by='names_or_order'):
+    """
+    Load network parameters from JSON file. File is read
+    by chunks and parameters are converted into arrays without
+    creating Python lists with all of their values.
+
+    Parameters
+    ----------
+    {load_dict.connection}
+
+    filepath : str
+        Path to JSON file that will store network parameters.
+
+    {load_dict.ignore_missed}
+
+    {load_dict.load_by}
+
+    Raises
+    ------
+    InvalidFormat
+        In case if file has invalid format.
+
+    {load_dict.Raises}
+
+    Examples
+    --------
+    >>> from neupy import layers, storage
+    >>>
     >>> connection = layers.Input(10) > layers.Softmax(3)
     >>> storage.load_json(connection, '/path/to/parameters.json')
     """
     connection = extract_connection(connection)
-    data = save_dict(connection)
 
     with open(filepath, 'r') as f:
-        data = load_with_fastest_json_module(f)
+        data = JSONStreamReader(f).parse()
 
     load_dict(connection, data, ignore_missed, load_by)
 
 
+# Every file in the memory-mapped format starts with this sequence
+# of bytes. Header that follows the prefix has size specified as an
+# unsigned 64-bit little-endian integer.
+MEMMAP_PREFIX = b'NEUPYMM1'
+MEMMAP_HEADER_SIZE = struct.Struct('<Q')
+
+# Arrays aligned to the cache lines can be used for
+# computations without copying them into the new memory.
+MEMMAP_ALIGNMENT = 64
+
+
+def align_offset(offset, alignment=MEMMAP_ALIGNMENT):
+    """
+    Returns the smallest value that is greater or equal to
+    the offset and is a multiple of the alignment.
+    """
+    return -(-offset // alignment) * alignment
+
+
+def add_memmap_array(arrays, value):
+    """
+    Adds array to the list of arrays that will be stored
+    in the memory-mapped file and returns its location.
+
+    Parameters
+    ----------
+    arrays : list
+        List of the ``(offset, array)`` pairs.
+
+    value : array-like
+
+    Raises
+    ------
+    ValueError
+        In case if array contains python objects.
+
+    Returns
+    -------
+    dict
+        Location of the array in the file.
+    """
+    # Function ``np.ascontiguousarray`` converts scalars
+    # into the arrays with one dimension
+    value = np.asarray(value, order='C')
+    offset = 0
+
+    if value.dtype.hasobject:
+        raise ValueError("Arrays with python objects cannot be "
+                         "stored in the memory-mapped file")
+
+    if arrays:
+        last_offset, last_value = arrays[-1]
+        offset = align_offset(last_offset + last_value.nbytes)
+
+    arrays.append((offset, value))
+
+    return {
+        'offset': offset,
+        'shape': value.shape,
+        'dtype': value.dtype.str,
+    }
+
+
+def write_memmap_file(filepath, header, arrays, prefix=MEMMAP_PREFIX):
+    """
+    Writes JSON header and arrays, registered with the
+    ``add_memmap_array`` function, into the file.
+    """
+    header = json.dumps(header, default=repr).encode('utf-8')
+    data_start = align_offset(
+        len(prefix) + MEMMAP_HEADER_SIZE.size + len(header))
+    data_size = 0
+
+    if arrays:
+        last_offset, last_value = arrays[-1]
+        data_size = last_offset + last_value.nbytes
+
+    with open(filepath, 'wb') as f:
+        f.write(prefix)
+        f.write(MEMMAP_HEADER_SIZE.pack(len(header)))
+        f.write(header)
+
+        for offset, value in arrays:
+            f.seek(data_start + offset)
+            value.tofile(f)
+
+        # Makes sure that file has enough bytes for
+        # the empty arrays stored at the end of the file
+        f.truncate(data_start + data_size)
+
+
+def read_memmap_file(filepath, prefix=MEMMAP_PREFIX,
+                     function_name='save_memmap'):
+    """
+    Reads header from the memory-mapped file.
+
+    Returns
+    -------
+    tuple
+        Header and function that returns array
+        from the file using its location.
+    """
+    with open(filepath, 'rb') as f:
+        if f.read(len(prefix)) != prefix:
+            raise InvalidFormat("File {} wasn't created with the {} "
+                                "function".format(filepath, function_name))
+
+        header_size, = MEMMAP_HEADER_SIZE.unpack(
+            f.read(MEMMAP_HEADER_SIZE.size))
+        header = json.loads(f.read(header_size).decode('utf-8'))
+
+    data_start = align_offset(
+        len(prefix) + MEMMAP_HEADER_SIZE.size + header_size)
+
+    # File will be mapped only once and each array will be a
+    # view of the mapped file. Copy-on-write mode guarantees that
+    # changes in the arrays won't modify file.
+    buffer = np.memmap(filepath, dtype=np.uint8, mode='c')
+
+    def get_array(location):
+        dtype = np.dtype(location['dtype'])
+        shape = tuple(location['shape'])
+
+        start = data_start + location['offset']
+        end = start + int(np.prod(shape)) * dtype.itemsize
+
+        return buffer[start:end].view(dtype).reshape(shape)
+
+    return header, get_array
+
+
+def write_memmap(data, filepath):
+    """
+    Writes data, created with the ``save_dict`` function,
+    into the file that can be loaded with memory-mapping.
+    """
+    arrays = []
+    layers = []
+
+    for layer in data['layers']:
+        parameters = {}
+
+        for param_name, param in layer['parameters'].items():
+            # Header stores location of the array instead of its
+            # values. Original data shouldn't be modified.
+            param = parameters[param_name] = param.copy()
+
+            if isinstance(param['value'], dict):
+                # Location of the encoded array will be stored
+                # together with information about the encoding
+                encoded_value = param['value'].copy()
+                param['value'] = encoded_value
+                param = encoded_value
+
+            param['value'] = add_memmap_array(arrays, param['value'])
+
+        layers.append(dict(layer, parameters=parameters))
+
+    write_memmap_file(filepath, dict(data, layers=layers), arrays)
+
+
+@shared_docs(save_dict)
+def save_memmap(connection, filepath, precision=None):
+    """
+    Save network parameters in the format that can be
+    loaded with memory-mapping.
+
+    File starts with the JSON header that has the same
+    structure as the output from the ``save_dict`` function,
+    but instead of the parameter values header stores
+    location of the raw arrays in the file. Arrays follow the
+    header and each array is aligned to the 64 bytes.
+
+    Parameters
+    ----------
+    {save_dict.connection}
+
+    filepath : str
+        Path to the file that stores network parameters.
+
+    {save_dict.precision}
+
+    Notes
+    -----
+    Networks that loaded parameters from the file read values
+    directly from it. File shouldn't be overwritten while some
+    of the processes use it.
+
+    Examples
+    --------
+    >>> from neupy import layers, storage
+    >>>
+    >>> connection = layers.Input(10) > layers.Softmax(3)
+    >>> storage.save_memmap(connection, '/path/to/parameters.neupy')
+    """
+    connection = extract_connection(connection)
+    data = save_dict(connection, precision)
+    write_memmap(data, filepath)
+
+
+@shared_docs(load_dict)
+def load_memmap(connection, filepath, ignore_missed=False,
+                load_by='names_or_order'):
+    """
+    Load network parameters from the file created by
+    the ``save_memmap`` function. Parameters won't be copied
+    into the memory. Instead, file will be mapped into memory
+    and operating system will load its content only when
+    parameters will be used. Processes that load parameters
+    from the same file share the same physical memory.
+
+    Changes in the parameters, for instance during the
+    training, won't be saved in the file.
+
+    Parameters
+    ----------
+    {load_dict.connection}
+
+    filepath : str
+        Path to the file that stores network parameters.
+
+    {load_dict.ignore_missed}
+
+    {load_dict.load_by}
+
+    Raises
+    ------
+    InvalidFormat
+        In case if file has unknown format.
+
+    {load_dict.Raises}
+
+    Notes
+    -----
+    Parameters are used without copying only in case if they
+    have been stored with the same ``floatX`` type as the one
+    that Theano currently uses. Parameters stored with different
+    precision will be converted and copied into the memory.
+
+    Examples
+    --------
+    >>> from neupy import layers, storage
+    >>>
+    >>> connection = layers.Input(10) > layers.Softmax(3)
+    >>> storage.load_memmap(connection, '/path/to/parameters.neupy')
+    """
+    connection = extract_connection(connection)
+    data, get_array = read_memmap_file(filepath)
+
+    for layer in data['layers']:
+        for param in layer['parameters'].values():
+            if 'precision' in param['value']:
+                param = param['value']
+
+            param['value'] = get_array(param['value'])
+
+    load_dict(connection, data, ignore_missed, load_by)
+
+
+# Files with the algorithms use the same layout as the files
+# created with the save_memmap function, but different prefix.
+ALGORITHM_PREFIX = b'NEUPYAL1'
+
+
+def is_json_serializable(value):
+    """
+    Checks whether value can be stored in the JSON file
+    without loosing information about it.
+    """
+    if value is None or isinstance(value, (bool, float, six.string_types)):
+        return True
+
+    if isinstance(value, six.integer_types):
+        return True
+
+    if isinstance(value, (list, tuple)):
+        return all(is_json_serializable(v) for v in value)
+
+    if isinstance(value, dict):
+        return all(isinstance(k, six.string_types) and is_json_serializable(v)
+                   for k, v in value.items())
+
+    return False
+
+
+def convert_numpy_values(value):
+    """
+    Converts numpy scalars and arrays, that can be
+    stored in the nested lists and dictionaries, into
+    the python's data types.
+    """
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+
+    if isinstance(value, (list, tuple)):
+        return type(value)(convert_numpy_values(v) for v in value)
+
+    if isinstance(value, dict):
+        return {k: convert_numpy_values(v) for k, v in value.items()}
+
+    return value
+
+
+def save_algorithm(network, filepath):
+    """
+    Save algorithm, like ``GRNN``, ``PNN``, ``SOFM`` or ``LVQ``,
+    that doesn't use layers. Arrays that network learned during
+    the training, for instance, samples stored by the ``GRNN``
+    or prototypes learned by the ``LVQ``, are stored in the
+    binary format that can be loaded with memory-mapping.
+
+    File starts with the JSON manifest that stores name of the
+    network's class, its options and location of the arrays in
+    the file. Arrays follow the manifest and each array is
+    aligned to the 64 bytes.
+
+    Parameters
+    ----------
+    network : network instance
+        Network that implements ``get_training_state``
+        method, for instance, ``GRNN``, ``PNN``, ``SOFM``,
+        ``LVQ``, ``GrowingNeuralGas``, ``CMAC`` or
+        ``DiscreteHopfieldNetwork``.
+
+    filepath : str
+        Path to the file that stores the network.
+
+    Raises
+    ------
+    ValueError
+        In case if network has layers or its training
+        state cannot be stored in the file.
+
+    Notes
+    -----
+    Options that cannot be stored in the JSON format, like
+    functions or initializers, won't be saved. They can be
+    specified during the loading.
+
+    Examples
+    --------
+    >>> from neupy import algorithms, storage
+    >>>
+    >>> grnn = algorithms.GRNN(std=0.1)
+    >>> grnn.train(x_train, y_train)
+    >>>
+    >>> storage.save_algorithm(grnn, '/path/to/grnn.neupy')
+    """
+    network_class = network.__class__
+
+    if hasattr(network, 'connection'):
+        raise ValueError(
+            "Network {} has layers. Use save_checkpoint or save functions "
+            "instead".format(network_class.__name__))
+
+    state = network.get_training_state()
+
+    # State of the global random number generator shouldn't
+    # be modified when network has been loaded from the file
+    state.pop('random_state', None)
+
+    config = {}
+    for name, value in network.get_params().items():
+        # Arrays, like initial weights, are stored in the training
+        # state and they shouldn't be duplicated in the manifest
+        if isinstance(value, np.ndarray):
+            continue
+
+        value = convert_numpy_values(value)
+
+        if is_json_serializable(value):
+            config[name] = value
+
+    arrays = []
+    locations = {}
+
+    for name in list(state):
+        if isinstance(state[name], np.ndarray):
+            locations[name] = add_memmap_array(arrays, state.pop(name))
+
+    state = convert_numpy_values(state)
+
+    if not is_json_serializable(state):
+        raise ValueError("Training state of the {} network cannot be "
+                         "stored in the file".format(network_class.__name__))
+
+    header = {
+        'metadata': dump_metadata(),
+        'module': network_class.__module__,
+        'class_name': network_class.__name__,
+        'config': config,
+        'state': state,
+        'arrays': locations,
+    }
+    write_memmap_file(filepath, header, arrays, prefix=ALGORITHM_PREFIX)
+
+
+def load_algorithm(filepath, **options):
+    """
+    Load network from the file created by the ``save_algorithm``
+    function. Arrays won't be copied into the memory. Instead,
+    file will be mapped into memory and operating system will
+    load its content only when arrays will be used. Processes
+    that load network from the same file share the same physical
+    memory.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the file that stores the network.
+
+    **options
+        Network's options. They replace options stored in the
+        file. Options that haven't been saved in the file, like
+        functions or initializers, can be specified here.
+
+    Raises
+    ------
+    InvalidFormat
+        In case if file has unknown format.
+
+    Returns
+    -------
+    network instance
+
+    Examples
+    --------
+    >>> from neupy import storage
+    >>>
+    >>> grnn = storage.load_algorithm('/path/to/grnn.neupy')
+    >>> grnn.predict(x_test)
+    """
+    data, get_array = read_memmap_file(
+        filepath, prefix=ALGORITHM_PREFIX, function_name='save_algorithm')
+
+    module = importlib.import_module(data['module'])
+    network_class = getattr(module, data['class_name'])
+
+    config = dict(data['config'], **options)
+    network = network_class(**config)
+
+    state = data['state']
+    for name, location in data['arrays'].items():
+        state[name] = get_array(location)
+
+    network.set_training_state(state)
+    return network
+
+
+# Function replaces file atomically. Python 2 doesn't have
+# replace function, but rename does the same on the POSIX systems.
+replace_file = getattr(os, 'replace', os.rename)
+
+
+def dump_checkpoint(network):
+    """
+    Returns network's training state together with
+    information that helps to validate it during the loading.
+
+    Returns
+    -------
+    dict
+    """
+    return {
+        'metadata': dump_metadata(),
+        'class_name': network.__class__.__name__,
+        'training_state': network.get_training_state(),
+    }
+
+
+def save_checkpoint(network, filepath, compression=None):
+    """
+    Save network's training state in the file. In addition to the
+    parameters, checkpoint contains optimizer's state (for instance,
+    moments for the ``Adam`` algorithm or step sizes for the
+    ``RPROP`` algorithm), last trained epoch, error history and
+    states of the random number generators.
+
+    Data is written into the temporary file first and then temporary
+    file replaces the specified one. Checkpoint won't be corrupted
+    in case if process has been terminated while file was written.
+
+    Parameters
+    ----------
+    network : BaseNetwork instance
+        Network that needs to be saved. Network should
+        implement the ``get_training_state`` method.
+
+    filepath : str
+        Path to the file that stores checkpoint.
+
+    compression : {{``None``, ``gzip``, ``bz2``}}
+        Compression algorithm that will be applied to the file.
+        Defaults to ``None``.
+
+    Examples
+    --------
+    >>> from neupy import algorithms, storage
+    >>>
+    >>> network = algorithms.Adam((10, 20, 1))
+    >>> network.train(x_train, y_train, epochs=10)
+    >>> storage.save_checkpoint(network, '/path/to/checkpoint.pickle')
+    """
+    temporary_filepath = filepath + '.tmp'
+
+    write_pickle(dump_checkpoint(network), temporary_filepath,
+                 compression=compression)
+    replace_file(temporary_filepath, filepath)
+
+
+def load_checkpoint(network, filepath):
+    """
+    Restores network's training state from the checkpoint created
+    by the ``save_checkpoint`` function. Network should be created
+    with the same architecture and training algorithm as the one
+    that has been saved. After the loading, training will continue
+    from the epoch that follows the last saved epoch.
+
+    Parameters
+    ----------
+    network : BaseNetwork instance
+
+    filepath : str
+        Path to the file that stores checkpoint.
+
+    Raises
+    ------
+    InvalidFormat
+        In case if file doesn't contain checkpoint.
+
+    ParameterLoaderError
+        In case if checkpoint has been created for
+        different training algorithm.
+
+    Examples
+    --------
+    >>> import os
+    >>> from neupy import algorithms, storage
+    >>>
+    >>> network = algorithms.Adam(
+    ...     (10, 20, 1),
+    ...     checkpoint_file='/path/to/checkpoint.pickle',
+    ... )
+    >>>
+    >>> if os.path.exists('/path/to/checkpoint.pickle'):
+    ...     storage.load_checkpoint(network, '/path/to/checkpoint.pickle')
+    ...
+    >>> network.train(x_train, y_train, epochs=100 - network.last_epoch)
+    """
+    with open_pickle_file(filepath, 'rb') as f:
+        if six.PY3:
+            checkpoint = pickle.load(f, encoding='latin1')  # skip coverage
+        else:
+            checkpoint = pickle.load(f)  # skip coverage
+
+    if not isinstance(checkpoint, dict) or \
+            'training_state' not in checkpoint:
+        raise InvalidFormat("File {} doesn't contain network's "
+                            "training state".format(filepath))
+
+    class_name = network.__class__.__name__
+
+    if checkpoint['class_name'] != class_name:
+        raise ParameterLoaderError(
+            "Checkpoint has been created for the {} algorithm and "
+            "cannot be loaded into the {} algorithm"
+            "".format(checkpoint['class_name'], class_name))
+
+    try:
+        network.set_training_state(checkpoint['training_state'])
+
+    except ValueError as exception:
+        raise ParameterLoaderError(str(exception))
+
+
+class CheckpointWriter(object):
+    """
+    Saves network in the background thread. Parameters are
+    copied from the network when the ``save`` method is called
+    and training can continue while parameters are encoded
+    and written into the file.
+
+    Writer keeps at most one snapshot that waits to be written.
+    In case if disk is slower than training, pending snapshot will
+    be replaced with the newer one, which means that memory usage
+    stays bounded and training never waits for the disk.
+
+    Each file is written into the temporary file first and then
+    temporary file replaces the specified one. Files that have been
+    created by the writer are always complete.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the file. Path can have the ``{epoch}``
+        placeholder that will be replaced with the last trained
+        epoch, for instance, ``/path/to/network-{epoch}.hdf5``.
+
+    format : str
+        Storage format. Can be equal to ``pickle``, ``hdf5``,
+        ``json``, ``memmap`` or ``checkpoint``. The ``checkpoint``
+        format stores network's training state, the same way as
+        the ``save_checkpoint`` function. Other formats store
+        only parameters. Defaults to ``pickle``.
+
+    keep_last : int or None
+        Number of the last saved files that will be kept.
+        Older files created by the writer will be removed.
+        The ``None`` value means that all files will be kept.
+        Defaults to ``None``.
+
+    precision : str or None
+        Precision that will be used in order to store parameters.
+        Option can't be used with the ``checkpoint`` format.
+        Defaults to ``None``.
+
+    **options
+        Additional options for the specified format. For instance,
+        ``compression`` for the ``pickle``, ``hdf5`` and
+        ``checkpoint`` formats, ``indent`` and ``binary`` for the
+        ``json`` format.
+
+    Attributes
+    ----------
+    saved_files : list
+        Files that have been written and haven't been removed.
+
+    n_skipped : int
+        Number of snapshots that haven't been saved, because
+        newer snapshots replaced them.
+
+    Methods
+    -------
+    save(network)
+        Copies network's parameters and schedules writing.
+        Writer instance can be called in the same way, which
+        makes it possible to use it as ``epoch_end_signal``.
+
+    wait()
+        Waits until all scheduled snapshots have been written.
+
+    close()
+        Waits for the scheduled snapshots and stops
+        the background thread.
+
+    Examples
+    --------
+    >>> from neupy import algorithms, storage
+    >>>
+    >>> writer = storage.CheckpointWriter(
+    ...     '/path/to/network-{epoch}.hdf5',
+    ...     format='hdf5',
+    ...     keep_last=3,
+    ... )
+    >>> network = algorithms.Adam((784, 500, 10), epoch_end_signal=writer)
+    >>> network.train(x_train, y_train, epochs=100)
+    >>> writer.close()
+    """
+    writers = {
+        'pickle': write_pickle,
+        'hdf5': write_hdf5,
+        'json': write_json,
+        'memmap': write_memmap,
+        'checkpoint': write_pickle,
+    }
+
+    def __init__(self, filepath, format='pickle', keep_last=None,
+                 precision=None, **options):
+        if format not in self.writers:
+            raise ValueError(
+                "Invalid value for the `format` argument: {}. Should be "
+                "one of the following values: {}"
+                "".format(format, ', '.join(sorted(self.writers))))
+
+        if keep_last is not None and keep_last < 1:
+            raise ValueError("Number of kept files should be positive, "
+                             "got {}".format(keep_last))
+
+        if format == 'checkpoint' and precision is not None:
+            raise ValueError("Training state cannot be stored with "
+                             "reduced precision")
+
+        validate_precision(precision)
+
+        self.filepath = filepath
+        self.format = format
+        self.keep_last = keep_last
+        self.precision = precision
+        self.options = options
+
+        self.saved_files = []
+        self.n_skipped = 0
+
+        self.condition = threading.Condition()
+        self.thread = None
+        self.pending = None
+        self.is_writing = False
+        self.is_closed = False
+        self.error = None
+
+    def snapshot(self, network):
+        """
+        Copies all values that will be saved.
+        """
+        if self.format == 'checkpoint':
+            return dump_checkpoint(network)
+
+        # Function copies parameter values, but they will
+        # be encoded in the background thread
+        return save_dict(network)
+
+    def encode(self, data):
+        if self.format == 'checkpoint' or self.precision is None:
+            return data
+
+        for layer in data['layers']:
+            for param in layer['parameters'].values():
+                param['value'] = encode_parameter(
+                    param['value'], self.precision)
+
+        return data
+
+    def write(self, filepath, snapshot):
+        temporary_filepath = filepath + '.tmp'
+
+        write = self.writers[self.format]
+        write(self.encode(snapshot), temporary_filepath, **self.options)
+        replace_file(temporary_filepath, filepath)
+
+        if filepath in self.saved_files:
+            self.saved_files.remove(filepath)
+
+        self.saved_files.append(filepath)
+
+        while self.keep_last and len(self.saved_files) > self.keep_last:
+            old_filepath = self.saved_files.pop(0)
+
+            if os.path.exists(old_filepath):
+                os.remove(old_filepath)
+
+    def run(self):
+        while True:
+            with self.condition:
+                while self.pending is None and not self.is_closed:
+                    self.condition.wait()
+
+                if self.pending is None:
+                    return
+
+                filepath, snapshot = self.pending
+                self.pending = None
+                self.is_writing = True
+
+            try:
+                self.write(filepath, snapshot)
+
+            except Exception:
+                self.error = sys.exc_info()
+
+            finally:
+                with self.condition:
+                    self.is_writing = False
+                    self.condition.notify_all()
+
+    def raise_error(self):
+        """
+        Raises exception that has been triggered in
+        the background thread.
+        """
+        if self.error is not None:
+            error, self.error = self.error, None
+            six.reraise(*error)
+
+    def save(self, network):
+        self.raise_error()
+
+        if self.is_closed:
+            raise ValueError("Writer has been closed")
+
+        filepath = self.filepath.format(epoch=network.last_epoch)
+        snapshot = self.snapshot(network)
+
+        with self.condition:
+            if self.pending is not None:
+                self.n_skipped += 1
+
+            self.pending = (filepath, snapshot)
+            self.condition.notify_all()
+
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run)
+            # Thread shouldn't prevent interpreter from exiting
+            self.thread.daemon = True
+            self.thread.start()
+
+    def wait(self):
+        with self.condition:
+            while self.pending is not None or self.is_writing:
+                self.condition.wait()
+
+        self.raise_error()
+
+    def close(self):
+        with self.condition:
+            self.is_closed = True
+            self.condition.notify_all()
+
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+        self.raise_error()
+
+    def __call__(self, network):
+        self.save(network)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
 # Convenient aliases
 save = save_pickle
 load = load_pickle
@@ -0,0 +1,212 @@
+import theano
+import theano.tensor as T
+import numpy as np
+
+from neupy.utils import asfloat
+from neupy.layers.recurrent import BaseRNNLayer
+from neupy.layers.connections.base import create_input_variables
+
+
+__all__ = ('StatefulPredictor',)
+
+
+class StatefulPredictor(object):
+    """
+    Step by step inference for the networks with recurrent layers.
+    Predictor keeps hidden states of the recurrent layers per each
+    stream and continues processing from them every time new time
+    steps arrive. Prediction for the new events doesn't require
+    processing of the whole history.
+
+    Parameters
+    ----------
+    network : ConstructibleNetwork instance or connection
+        Network that has at least one recurrent layer. Recurrent
+        layers have to process sequence in the forward direction
+        without unrolling.
+
+    Attributes
+    ----------
+    states : dict
+        Recurrent states per each stream. Each value is a list of
+        1D arrays ordered in the same way as layers in the
+        ``recurrent_layers`` attribute and states in the
+        ``state_names`` attribute of each layer.
+
+    recurrent_layers : list
+        Recurrent layers from the network.
+
+    Methods
+    -------
+    predict(input_data, stream_ids)
+        Process new time steps and return prediction.
+
+    reset(stream_ids=None)
+        Remove states for the specified streams.
+
+    Examples
+    --------
+    >>> from neupy import algorithms, layers, streaming
+    >>>
+    >>> network = algorithms.RMSProp([
+    ...     layers.Input(40),
+    ...     layers.Embedding(20, 10),
+    ...     layers.LSTM(20),
+    ...     layers.Sigmoid(1),
+    ... ])
+    >>> network.train(x_train, y_train)
+    >>>
+    >>> predictor = streaming.StatefulPredictor(network)
+    >>>
+    >>> # Each stream gets one new event with shape (n_streams, 1)
+    >>> predictor.predict([[5], [12]], stream_ids=['user-1', 'user-2'])
+    >>> predictor.predict([[7]], stream_ids=['user-1'])
+    >>>
+    >>> predictor.reset(['user-1'])
+    """
+    def __init__(self, network):
+        connection = getattr(network, 'connection', network)
+
+        self.connection = connection
+        self.recurrent_layers = [
+            layer for layer in connection if isinstance(layer, BaseRNNLayer)]
+
+        if not self.recurrent_layers:
+            raise ValueError("Network doesn't have recurrent layers")
+
+        for layer in self.recurrent_layers:
+            if layer.backwards or layer.unroll_scan:
+                raise ValueError(
+                    "Layer `{}` cannot process sequence step by step, "
+                    "because it processes sequence backwards or has "
+                    "fixed number of unrolled steps".format(layer.name))
+
+        self.states = {}
+        self.predict_step = self.compile()
+
+    def compile(self):
+        """
+        Compile function that accepts inputs and initial states
+        and returns prediction and final states.
+
+        Returns
+        -------
+        Theano function
+        """
+        connection = self.connection
+        network_inputs = create_input_variables(connection.input_layers)
+        initial_states = []
+
+        for layer in self.recurrent_layers:
+            layer.initial_states = [
+                T.matrix('layer:{}/var:{}-state'.format(layer.name, name))
+                for name in layer.state_names]
+            initial_states.extend(layer.initial_states)
+
+        try:
+            with connection.disable_training_state():
+                prediction = connection.output(*network_inputs)
+
+            final_states = []
+            for layer in self.recurrent_layers:
+                final_states.extend(layer.final_states)
+
+        finally:
+            for layer in self.recurrent_layers:
+                layer.initial_states = None
+                layer.final_states = None
+
+        return theano.function(
+            inputs=network_inputs + initial_states,
+            outputs=[prediction] + final_states,
+            name='network/func:predict-step',
+        )
+
+    def default_states(self):
+        """
+        Returns initial states for the new stream.
+
+        Returns
+        -------
+        list of array-like
+        """
+        states = []
+
+        for layer in self.recurrent_layers:
+            for name in layer.state_names:
+                parameter = layer.parameters[name + '_init']
+                states.append(parameter.get_value()[0])
+
+        return states
+
+    def predict(self, input_data, stream_ids):
+        """
+        Process new time steps for the specified streams and
+        update their states.
+
+        Parameters
+        ----------
+        input_data : array-like or list of array-like
+            New time steps with shape ``(n_streams, n_time_steps, ...)``.
+            Each sample belongs to the stream from the ``stream_ids``
+            list with the same index. Number of time steps can be
+            different from the one that network has been trained with.
+
+        stream_ids : list
+            Hashable identifiers of the streams. Streams that don't
+            have states start from the initial states of
+            the recurrent layers.
+
+        Returns
+        -------
+        array-like
+            Network's prediction.
+        """
+        if not isinstance(input_data, (list, tuple)):
+            input_data = [input_data]
+
+        input_data = [asfloat(np.asarray(data)) for data in input_data]
+        stream_ids = list(stream_ids)
+
+        if len(set(stream_ids)) != len(stream_ids):
+            raise ValueError("Stream identifiers should be unique")
+
+        if len(stream_ids) != len(input_data[0]):
+            raise ValueError(
+                "Number of streams should be equal to the number of "
+                "samples, got {} streams and {} samples"
+                "".format(len(stream_ids), len(input_data[0])))
+
+        default_states = self.default_states()
+        stream_states = [
+            self.states.get(stream_id, default_states)
+            for stream_id in stream_ids]
+
+        initial_states = [
+            asfloat(np.stack(states)) for states in zip(*stream_states)]
+
+        outputs = self.predict_step(*(input_data + initial_states))
+        prediction, final_states = outputs[0], outputs[1:]
+
+        for index, stream_id in enumerate(stream_ids):
+            self.states[stream_id] = [state[index] for state in final_states]
+
+        return prediction
+
+    def reset(self, stream_ids=None):
+        """
+        Remove states for the specified streams. Next time these
+        streams will start from the initial states.
+
+        Parameters
+        ----------
+        stream_ids : list or None
+            Identifiers of the streams. ``None`` removes
+            states for all streams. Defaults to ``None``.
+        """
+        if stream_ids is None:
+            self.states.clear()
+            return
+
+        for stream_id in stream_ids:
+            self.states.pop(stream_id, None)
@@ -1,4 +1,6 @@
+import numpy as np
 from sklearn import datasets, model_selection, metrics
+
 from neupy import algorithms, init
 from neupy.layers import Relu, Sigmoid, Input
 
@@ -71,3 +73,45 @@ class DANTestCase(BaseTestCase):
         self.assertIn('DynamicallyAveragedNetwork', dan_repr)
         self.assertIn('Momentum', dan_repr)
         self.assertIn('GradientDescent', dan_repr)
+
+    def test_dan_fused_prediction(self):
+        data, target = datasets.make_classification(300, n_features=4,
+                                                    n_classes=2)
+        dan = algorithms.DynamicallyAveragedNetwork([
+            algorithms.Momentum((4, 10, 1), step=0.1),
+            algorithms.GradientDescent((4, 5, 1), step=0.1),
+        ], batch_size=50)
+        dan.train(data, target, epochs=10)
+
+        self.assertIsNone(dan.fused_predict)
+        predicted = dan.predict_networks(data)
+        self.assertIsNotNone(dan.fused_predict)
+
+        expected = np.concatenate(
+            [network.predict(data) for network in dan.networks], axis=1)
+        np.testing.assert_array_almost_equal(expected, predicted)
+
+    def test_dan_parallel_training(self):
+        data, target = datasets.make_classification(300, n_features=4,
+                                                    n_classes=2)
+        networks = [
+            algorithms.Momentum((4, 10, 1), step=0.1),
+            algorithms.GradientDescent((4, 5, 1), step=0.1),
+        ]
+        dan = algorithms.DynamicallyAveragedNetwork(networks, n_workers=2)
+
+        weight = networks[0].layers[1].weight
+        initial_weight = weight.get_value().copy()
+
+        dan.train(data, target, epochs=10)
+
+        # Parameters trained in the other process
+        self.assertFalse(np.allclose(initial_weight, weight.get_value()))
+
+        for network, original_network in zip(dan.networks, networks):
+            self.assertIs(network, original_network)
+            self.assertEqual(network.last_epoch, 10)
+            self.assertEqual(len(network.errors), 10)
+
+        result = dan.predict(data)
+        self.assertEqual(result.shape, (300,))
@@ -1,11 +1,16 @@
+import os
+import signal
 from itertools import product
 
 import numpy as np
 
-from neupy import algorithms
+from neupy import algorithms, layers
+from neupy.utils import asfloat
 from neupy.algorithms.gd.base import (BatchSizeProperty, iter_batches,
                                       average_batch_errors, count_samples,
-                                      cannot_divide_into_batches)
+                                      cannot_divide_into_batches,
+                                      LengthBucketSampler)
+from neupy.algorithms.gd.parallel import DataParallelWorkers
 
 from data import simple_classification
 from base import BaseTestCase
@@ -84,3 +89,189 @@ class MinibatchGDTestCase(BaseTestCase):
 
         self.assertEqual(count_samples(x), 10)
         self.assertEqual(count_samples([x, x]), 10)
+
+    def test_accumulate_steps_invalid_values(self):
+        for net_class, value in product(self.network_classes, [0, -1, 1.5]):
+            with self.assertRaises((TypeError, ValueError)):
+                net_class((10, 20, 1), accumulate_steps=value)
+
+    def test_accumulate_gradients_equal_to_large_batch(self):
+        x_train, _, y_train, _ = simple_classification()
+
+        for network_class in self.network_classes:
+            self.setUp()
+            large_batch_net = network_class((10, 20, 1), batch_size=30)
+            large_batch_net.train(x_train, y_train, epochs=5)
+
+            self.setUp()
+            accumulated_net = network_class(
+                (10, 20, 1), batch_size=10, accumulate_steps=3)
+            accumulated_net.train(x_train, y_train, epochs=5)
+
+            np.testing.assert_array_almost_equal(
+                large_batch_net.predict(x_train),
+                accumulated_net.predict(x_train),
+            )
+
+    def test_accumulate_gradients_partial_batches(self):
+        x_train, _, y_train, _ = simple_classification()
+
+        self.setUp()
+        full_batch_net = algorithms.Adam((10, 20, 1), batch_size='full')
+        full_batch_net.train(x_train, y_train, epochs=5)
+
+        self.setUp()
+        accumulated_net = algorithms.Adam(
+            (10, 20, 1), batch_size=7, accumulate_steps=1000)
+        accumulated_net.train(x_train, y_train, epochs=5)
+
+        np.testing.assert_array_almost_equal(
+            full_batch_net.predict(x_train),
+            accumulated_net.predict(x_train),
+        )
+        np.testing.assert_array_almost_equal(
+            full_batch_net.errors, accumulated_net.errors)
+
+        accumulated_gradients = accumulated_net.variables.accumulated_gradients
+        for accumulated_gradient in accumulated_gradients:
+            self.assertEqual(np.abs(accumulated_gradient.get_value()).sum(), 0)
+
+    def test_data_parallel_training(self):
+        x_train, _, y_train, _ = simple_classification()
+
+        for network_class in self.network_classes:
+            self.setUp()
+            network = network_class((10, 20, 1), batch_size=10)
+            network.train(x_train, y_train, epochs=5)
+
+            self.setUp()
+            parallel_network = network_class(
+                (10, 20, 1), batch_size=10, n_workers=3)
+            parallel_network.train(x_train, y_train, epochs=5)
+
+            self.assertIsNone(parallel_network.workers)
+            np.testing.assert_array_almost_equal(
+                network.errors, parallel_network.errors)
+            np.testing.assert_array_almost_equal(
+                network.predict(x_train),
+                parallel_network.predict(x_train),
+            )
+
+    def test_data_parallel_terminated_worker(self):
+        x_train, _, y_train, _ = simple_classification()
+        network = algorithms.Momentum((10, 20, 1), batch_size=10,
+                                      n_workers=2)
+
+        workers = DataParallelWorkers(network, n_workers=2)
+        workers.start()
+
+        try:
+            # Worker can be killed without raising exception,
+            # for instance, by the OOM killer
+            process = workers.processes[1]
+            os.kill(process.pid, signal.SIGKILL)
+            process.join()
+
+            with self.assertRaisesRegexp(RuntimeError, 'exit code'):
+                workers.accumulate(asfloat(x_train[:10]),
+                                   asfloat(y_train[:10].reshape((-1, 1))))
+
+        finally:
+            workers.stop()
+
+    def test_data_parallel_training_with_layer_updates(self):
+        x_train, _, y_train, _ = simple_classification()
+        connection = [
+            layers.Input(10),
+            layers.Relu(20),
+            layers.BatchNorm(),
+            layers.Sigmoid(1),
+        ]
+
+        network = algorithms.Adam(connection, batch_size=20, n_workers=2)
+        network.train(x_train, y_train, epochs=2)
+
+        batch_norm = network.layers[2]
+        running_mean = batch_norm.running_mean.get_value()
+        self.assertTrue(np.all(running_mean != 0))
+
+    def test_length_bucket_sampler(self):
+        mask = np.array([
+            [1, 1, 1, 0, 0],
+            [1, 0, 0, 0, 0],
+            [1, 1, 1, 1, 1],
+            [1, 1, 0, 0, 0],
+        ])
+        x_train = np.arange(20).reshape((4, 5))
+        y_train = np.arange(4)
+
+        sampler = LengthBucketSampler(shuffle=False)
+        batches = list(sampler.iter_batches((x_train, mask), y_train, 2))
+        self.assertEqual(len(batches), 2)
+
+        x_batch, mask_batch, y_batch = batches[0]
+        np.testing.assert_array_equal(y_batch, [1, 3])
+        np.testing.assert_array_equal(x_batch, [[5, 6], [15, 16]])
+        np.testing.assert_array_equal(mask_batch, [[1, 0], [1, 1]])
+
+        x_batch, mask_batch, y_batch = batches[1]
+        np.testing.assert_array_equal(y_batch, [0, 2])
+        self.assertEqual(x_batch.shape, (2, 5))
+
+        sampler = LengthBucketSampler(trim_padding=False)
+        batches = list(sampler.iter_batches((x_train, mask), y_train, None))
+        self.assertEqual(len(batches), 1)
+
+        x_batch, mask_batch, y_batch = batches[0]
+        self.assertEqual(x_batch.shape, (4, 5))
+        np.testing.assert_array_equal(sorted(y_batch), [0, 1, 2, 3])
+
+    def test_length_bucket_sampler_training(self):
+        x_train, _, y_train, _ = simple_classification()
+        mask = np.ones((len(x_train), 10))
+
+        inputs = [layers.Input(10), layers.Input(10)]
+        network = algorithms.Momentum(
+            inputs > layers.Concatenate() > layers.Sigmoid(1),
+            batch_size=10,
+            batch_sampler=LengthBucketSampler(shuffle=False),
+        )
+        network.train([x_train, mask], y_train, epochs=5)
+
+        self.assertLess(network.errors.last(), network.errors[0])
+
+        with self.assertRaises(TypeError):
+            algorithms.Momentum((10, 20, 1), batch_sampler=True)
+
+    def test_length_bucket_sampler_full_batch(self):
+        x_train, _, y_train, _ = simple_classification()
+        mask = np.ones((len(x_train), 10))
+
+        inputs = [layers.Input(10), layers.Input(10)]
+        network = algorithms.MinibatchGradientDescent(
+            inputs > layers.Concatenate() > layers.Sigmoid(1),
+            batch_size=None,
+            batch_sampler=LengthBucketSampler(),
+        )
+        network.train([x_train, mask], y_train, epochs=1)
+
+        # Error is computed before the only update
+        self.assertGreater(network.errors.last(),
+                           network.prediction_error([x_train, mask], y_train))
+
+    def test_length_bucket_sampler_unroll_scan(self):
+        def create_network(sampler):
+            return algorithms.Momentum(
+                [
+                    layers.Input(10),
+                    layers.Embedding(20, 5),
+                    layers.LSTM(5, unroll_scan=True),
+                    layers.Sigmoid(1),
+                ],
+                batch_sampler=sampler,
+            )
+
+        create_network(LengthBucketSampler(trim_padding=False))
+
+        with self.assertRaises(ValueError):
+            create_network(LengthBucketSampler())
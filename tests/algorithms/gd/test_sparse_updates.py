@@ -0,0 +1,101 @@
+import numpy as np
+import theano.tensor as T
+
+from neupy import algorithms, layers
+from neupy.algorithms.gd.sparse import find_row_subtensors
+
+from base import BaseTestCase
+
+
+class SparseUpdatesTestCase(BaseTestCase):
+    def create_network(self, network_class, **options):
+        return network_class(
+            [
+                layers.Input(3),
+                layers.Embedding(100, 4),
+                layers.Reshape(),
+                layers.Sigmoid(1),
+            ],
+            verbose=False,
+            **options
+        )
+
+    def test_sparse_updates_change_only_used_rows(self):
+        x_train = np.random.randint(0, 50, size=(10, 3))
+        y_train = (x_train.sum(axis=1, keepdims=True) > 75).astype(int)
+        used_rows = np.unique(x_train)
+
+        network_classes = [
+            algorithms.GradientDescent,
+            algorithms.Momentum,
+            algorithms.Adagrad,
+            algorithms.RMSProp,
+            algorithms.Adam,
+        ]
+
+        for network_class in network_classes:
+            weight_deltas = []
+
+            for sparse_updates in (False, True):
+                self.setUp()
+                network = self.create_network(
+                    network_class, sparse_updates=sparse_updates)
+
+                weight = network.layers[1].weight
+                weight_before = weight.get_value()
+                network.train(x_train, y_train, epochs=1)
+
+                weight_deltas.append(weight.get_value() - weight_before)
+
+            dense_delta, sparse_delta = weight_deltas
+
+            # In case of the one update, there is no difference
+            # between lazy and dense updates
+            np.testing.assert_array_almost_equal(
+                dense_delta[used_rows], sparse_delta[used_rows])
+            np.testing.assert_array_equal(
+                np.delete(sparse_delta, used_rows, axis=0), 0)
+
+    def test_sparse_updates_are_lazy(self):
+        x_train = np.random.randint(0, 50, size=(10, 3))
+        y_train = (x_train.sum(axis=1, keepdims=True) > 75).astype(int)
+        first_rows = np.unique(x_train)
+
+        for sparse_updates in (False, True):
+            network = self.create_network(
+                algorithms.Momentum, sparse_updates=sparse_updates)
+
+            network.train(x_train, y_train, epochs=1)
+            weight_before = network.layers[1].weight.get_value()
+
+            # Second mini-batch doesn't use rows from the first one
+            network.train(x_train + 50, y_train, epochs=1)
+            weight_delta = network.layers[1].weight.get_value() - weight_before
+
+            first_rows_changed = np.any(weight_delta[first_rows] != 0)
+            self.assertEqual(first_rows_changed, not sparse_updates)
+
+    def test_sparse_updates_training(self):
+        x_train = np.random.randint(0, 20, size=(100, 3))
+        y_train = (x_train.sum(axis=1, keepdims=True) > 30).astype(int)
+
+        network = self.create_network(
+            algorithms.Adam, sparse_updates=True,
+            batch_size=10, step=0.05, error='binary_crossentropy')
+        network.train(x_train, y_train, epochs=20)
+
+        self.assertLess(network.errors.last(), network.errors[0])
+
+    def test_find_row_subtensors(self):
+        network = self.create_network(algorithms.GradientDescent)
+        error_func = network.variables.error_func
+
+        embedding_weight = network.layers[1].weight
+        dense_weight = network.layers[3].weight
+
+        subtensors = find_row_subtensors(error_func, embedding_weight)
+        self.assertEqual(len(subtensors), 1)
+
+        self.assertIsNone(find_row_subtensors(error_func, dense_weight))
+        self.assertIsNone(find_row_subtensors(
+            error_func + T.sum(embedding_weight), embedding_weight))
@@ -0,0 +1,88 @@
+import numpy as np
+
+from neupy import algorithms, layers
+from neupy.algorithms.regularization.pruning import magnitude_mask
+
+from base import BaseTestCase
+from data import simple_classification
+
+
+class MagnitudePruningTestCase(BaseTestCase):
+    def create_network(self, **options):
+        return algorithms.Momentum(
+            [
+                layers.Input(10),
+                layers.Relu(20, name='relu'),
+                layers.Sigmoid(1, name='sigmoid'),
+            ],
+            step=0.1,
+            verbose=False,
+            addons=[algorithms.MagnitudePruning],
+            **options
+        )
+
+    def test_magnitude_mask(self):
+        weight = np.array([[0.5, -0.1], [-0.3, 0.2]])
+
+        np.testing.assert_array_equal(
+            magnitude_mask(weight, 0.5), [[1, 0], [1, 0]])
+        np.testing.assert_array_equal(
+            magnitude_mask(weight, 0.7), [[1, 0], [0, 0]])
+        np.testing.assert_array_equal(
+            magnitude_mask(weight, 0), np.ones((2, 2)))
+        np.testing.assert_array_equal(
+            magnitude_mask(weight, 1), np.zeros((2, 2)))
+
+    def test_pruning_schedule(self):
+        network = self.create_network(
+            target_sparsity=0.8, pruning_start=3, pruning_end=5)
+
+        sparsities = [network.sparsity(epoch) for epoch in range(1, 8)]
+        np.testing.assert_array_almost_equal(
+            sparsities, [0, 0, 0, 0.7, 0.8, 0.8, 0.8])
+
+        with self.assertRaises(ValueError):
+            self.create_network(pruning_start=5, pruning_end=4)
+
+    def test_magnitude_pruning(self):
+        sparsities = []
+
+        def on_epoch_end(network):
+            for layer in network.layers[1:]:
+                weight = layer.weight.get_value()
+                sparsities.append(np.mean(weight == 0))
+
+        network = self.create_network(
+            target_sparsity=0.75, pruning_start=2, pruning_end=4,
+            epoch_end_signal=on_epoch_end)
+
+        # Biases are not pruned
+        self.assertEqual(len(network.pruning_masks), 2)
+
+        x_train, _, y_train, _ = simple_classification()
+        network.train(x_train, y_train, epochs=6)
+
+        relu_sparsities = sparsities[::2]
+        np.testing.assert_array_almost_equal(
+            relu_sparsities, [0, 0, 0.655, 0.75, 0.75, 0.75])
+
+        # Pruned weights stay equal to zero after updates
+        masks = list(network.pruning_masks.values())
+        relu_weight = network.layers[1].weight.get_value()
+        np.testing.assert_array_equal(relu_weight == 0,
+                                      masks[0].get_value() == 0)
+
+    def test_pruning_masks_training_state(self):
+        x_train, _, y_train, _ = simple_classification()
+
+        network = self.create_network(pruning_start=1, pruning_end=2)
+        network.train(x_train, y_train, epochs=3)
+        state = network.get_training_state()
+
+        other_network = self.create_network(pruning_start=1, pruning_end=2)
+        other_network.set_training_state(state)
+
+        for mask, other_mask in zip(network.pruning_masks.values(),
+                                    other_network.pruning_masks.values()):
+            np.testing.assert_array_equal(
+                mask.get_value(), other_mask.get_value())
@@ -0,0 +1,152 @@
+import os
+import shutil
+import tempfile
+from functools import partial
+
+import numpy as np
+
+from neupy import algorithms, parallel, environment
+
+from data import simple_classification
+from base import BaseTestCase
+
+
+def create_momentum_network(seed, **options):
+    environment.reproducible(seed)
+    return algorithms.Momentum((10, 5, 1), batch_size=10, **options)
+
+
+class ParallelTrainingTestCase(BaseTestCase):
+    def test_train_networks(self):
+        x_train, x_test, y_train, y_test = simple_classification()
+        steps = [0.1, 0.01]
+        networks = [
+            partial(create_momentum_network, seed=0, step=step)
+            for step in steps
+        ]
+
+        trained_networks = parallel.train_networks(
+            networks, x_train, y_train, x_test, y_test,
+            n_workers=2, epochs=3)
+
+        self.assertEqual(len(trained_networks), 2)
+
+        for step, trained_network in zip(steps, trained_networks):
+            network = create_momentum_network(seed=0, step=step)
+            network.train(x_train, y_train, x_test, y_test, epochs=3)
+
+            self.assertEqual(trained_network.last_epoch, 3)
+            self.assertEqual(trained_network.step, step)
+            np.testing.assert_array_almost_equal(
+                network.errors, trained_network.errors)
+            np.testing.assert_array_almost_equal(
+                network.validation_errors, trained_network.validation_errors)
+            np.testing.assert_array_almost_equal(
+                network.predict(x_test), trained_network.predict(x_test))
+
+    def test_train_unsupervised_networks(self):
+        data = np.random.random((20, 2))
+        networks = [
+            algorithms.SOFM(n_inputs=2, n_outputs=4, verbose=False),
+            algorithms.SOFM(n_inputs=2, n_outputs=6, verbose=False),
+        ]
+
+        trained_networks = parallel.train_networks(networks, data, epochs=5)
+
+        self.assertEqual(trained_networks[0].weight.shape, (2, 4))
+        self.assertEqual(trained_networks[1].weight.shape, (2, 6))
+        self.assertEqual(len(trained_networks[1].errors), 5)
+
+    def test_train_network_task(self):
+        x_train, _, y_train, _ = simple_classification()
+
+        # Worker gets only data during the initialization
+        # and each task gets its own network
+        parallel.init_worker((x_train, y_train, None, None), {'epochs': 2})
+        self.addCleanup(parallel.worker_state.clear)
+        self.assertNotIn('networks', parallel.worker_state)
+
+        network, last_epoch, errors, _ = parallel.train_network(
+            partial(create_momentum_network, seed=0))
+
+        self.assertIsInstance(network, algorithms.Momentum)
+        self.assertEqual(last_epoch, 2)
+        self.assertEqual(len(errors), 2)
+
+    def test_share_data(self):
+        directory = tempfile.mkdtemp()
+        x = np.random.random((10, 2))
+
+        try:
+            shared_data = parallel.share_data((x, [x, x], None), directory)
+            loaded_data = parallel.load_shared_data(shared_data)
+            self.assertEqual(len(os.listdir(directory)), 3)
+        finally:
+            shutil.rmtree(directory)
+
+        self.assertIsNone(loaded_data[2])
+        self.assertIsInstance(loaded_data[0], np.memmap)
+        np.testing.assert_array_equal(x, loaded_data[0])
+        np.testing.assert_array_equal(x, loaded_data[1][1])
+
+    def test_invalid_number_of_workers(self):
+        with self.assertRaises(ValueError):
+            parallel.train_networks([], np.random.random((10, 2)),
+                                    n_workers=0)
+
+
+class ParallelPredictionTestCase(BaseTestCase):
+    def test_predict_parallel(self):
+        x_train = np.random.random((50, 3))
+        y_train = np.random.random((50, 1))
+        x_test = np.random.random((23, 3))
+
+        grnn = algorithms.GRNN(std=0.5, verbose=False)
+        grnn.train(x_train, y_train)
+
+        np.testing.assert_array_almost_equal(
+            grnn.predict(x_test),
+            parallel.predict_parallel(grnn, x_test, n_workers=2))
+
+        # Each worker gets multiple chunks
+        np.testing.assert_array_almost_equal(
+            grnn.predict(x_test),
+            parallel.predict_parallel(
+                grnn, x_test, n_workers=2, batch_size=5))
+
+    def test_predict_parallel_methods(self):
+        x_train = np.random.random((50, 3))
+        y_train = np.random.randint(0, 3, 50)
+        x_test = np.random.random((11, 3))
+
+        pnn = algorithms.PNN(std=0.5, verbose=False)
+        pnn.train(x_train, y_train)
+
+        np.testing.assert_array_almost_equal(
+            pnn.predict_proba(x_test),
+            parallel.predict_parallel(
+                pnn, x_test, n_workers=2, method='predict_proba'))
+
+        rbfk = algorithms.RBFKMeans(n_clusters=3, verbose=False)
+        rbfk.train(x_train, epochs=5)
+
+        np.testing.assert_array_equal(
+            rbfk.predict(x_test),
+            parallel.predict_parallel(rbfk, x_test, n_workers=2))
+
+    def test_predict_parallel_exceptions(self):
+        x = np.random.random((10, 2))
+        grnn = algorithms.GRNN(verbose=False)
+        grnn.train(x, x[:, :1])
+
+        with self.assertRaises(ValueError):
+            parallel.predict_parallel(grnn, x, n_workers=0)
+
+        with self.assertRaises(ValueError):
+            parallel.predict_parallel(grnn, x, batch_size=0)
+
+        with self.assertRaises(ValueError):
+            parallel.predict_parallel(grnn, x, method='predict_proba')
+
+        with self.assertRaises(ValueError):
+            parallel.predict_parallel(algorithms.GradientDescent((2, 1)), x)
@@ -0,0 +1,201 @@
+import sys
+import threading
+
+import numpy as np
+
+from neupy import algorithms, layers, serving
+from neupy.utils import asfloat
+
+from base import BaseTestCase
+
+
+class BlockedNetwork(object):
+    """
+    Network that waits until test allows it to make
+    prediction and records size of each batch.
+    """
+    def __init__(self):
+        self.batch_sizes = []
+        self.is_called = threading.Event()
+        self.can_predict = threading.Event()
+
+    def predict(self, input_data):
+        self.is_called.set()
+        self.can_predict.wait()
+        self.batch_sizes.append(len(input_data))
+
+        if np.any(input_data < 0):
+            raise ValueError("Negative values")
+
+        return input_data.sum(axis=1, keepdims=True)
+
+
+class PredictorTestCase(BaseTestCase):
+    def test_predictor_concurrent_requests(self):
+        network = algorithms.GradientDescent(
+            [
+                layers.Input(10),
+                layers.Relu(20),
+                layers.Softmax(3),
+            ],
+            verbose=False,
+        )
+        input_data = asfloat(np.random.random((200, 10)))
+        predictions = [None] * 20
+
+        def make_prediction(index):
+            samples = input_data[10 * index:10 * (index + 1)]
+            predictions[index] = predictor.predict(samples)
+
+        with serving.Predictor(network, batch_size=50) as predictor:
+            threads = [threading.Thread(target=make_prediction, args=(i,))
+                       for i in range(20)]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(predictor.n_requests, 20)
+        np.testing.assert_array_almost_equal(
+            np.concatenate(predictions), network.predict(input_data))
+
+    def test_predictor_batches(self):
+        network = BlockedNetwork()
+        predictor = serving.Predictor(network, batch_size=4, max_latency=0)
+
+        # First request blocks background thread and other
+        # requests will be collected in the queue
+        requests = [predictor.submit(np.ones((1, 2)))]
+        network.is_called.wait()
+
+        requests.extend(predictor.submit(np.ones((n, 2))) for n in [2, 1, 3])
+        # Requests with different shape can't be in the same batch
+        requests.append(predictor.submit(np.ones((1, 3))))
+        requests.append(predictor.submit(np.ones((6, 3))))
+
+        network.can_predict.set()
+        predictor.close()
+
+        self.assertEqual(network.batch_sizes, [1, 3, 3, 1, 6])
+        self.assertEqual(predictor.n_batches, 5)
+
+        np.testing.assert_array_equal(requests[1].wait(), [[2], [2]])
+        np.testing.assert_array_equal(requests[5].wait(), 3 * np.ones((6, 1)))
+
+    def test_predictor_errors(self):
+        network = BlockedNetwork()
+        predictor = serving.Predictor(network, max_latency=0)
+
+        requests = [predictor.submit(np.ones((1, 2)))]
+        network.is_called.wait()
+
+        requests.append(predictor.submit(np.ones((1, 2))))
+        requests.append(predictor.submit(-np.ones((1, 2))))
+
+        with self.assertRaises(RuntimeError):
+            requests[0].wait(timeout=0.01)
+
+        network.can_predict.set()
+
+        np.testing.assert_array_equal(requests[0].wait(), [[2]])
+
+        # Exception affects only requests from the same batch
+        for request in requests[1:]:
+            with self.assertRaises(ValueError):
+                request.wait()
+
+        predictor.close()
+
+        with self.assertRaises(ValueError):
+            predictor.predict(np.ones((1, 2)))
+
+        with self.assertRaises(ValueError):
+            serving.Predictor(network, batch_size=0)
+
+        with self.assertRaises(ValueError):
+            serving.Predictor(network, max_latency=-1)
+
+    def test_predictor_callback_errors(self):
+        network = BlockedNetwork()
+        predictor = serving.Predictor(network, max_latency=0)
+
+        def failed_callback(request):
+            raise ValueError("Callback failed")
+
+        requests = [predictor.submit(np.ones((1, 2)))]
+        network.is_called.wait()
+
+        # Both requests will be processed in the same batch
+        requests.append(predictor.submit(np.ones((1, 2)), failed_callback))
+        requests.append(predictor.submit(np.ones((2, 2))))
+        network.can_predict.set()
+
+        np.testing.assert_array_equal(requests[2].wait(timeout=5),
+                                      [[2], [2]])
+        self.assertIs(requests[1].callback_error[0], ValueError)
+        self.assertIsNone(requests[2].callback_error)
+
+        np.testing.assert_array_equal(
+            predictor.predict(np.ones((1, 3)), timeout=5), [[3]])
+        predictor.close()
+
+    def test_predictor_with_connection(self):
+        connection = layers.Input(3) > layers.Sigmoid(1)
+        input_data = asfloat(np.random.random((5, 3)))
+
+        with serving.Predictor(connection) as predictor:
+            np.testing.assert_array_almost_equal(
+                predictor.predict(input_data),
+                connection.compile()(input_data))
+
+    def test_predictor_asyncio(self):
+        if sys.version_info < (3, 5):
+            self.skipTest("Test requires asyncio module")
+
+        import asyncio
+
+        network = BlockedNetwork()
+        network.can_predict.set()
+        loop = asyncio.new_event_loop()
+
+        with serving.Predictor(network) as predictor:
+            futures = [predictor.predict_async(np.ones((1, 2)), loop=loop),
+                       predictor.predict_async(-np.ones((1, 3)), loop=loop)]
+
+            results = loop.run_until_complete(
+                asyncio.gather(*futures, return_exceptions=True))
+
+        loop.close()
+
+        np.testing.assert_array_equal(results[0], [[2]])
+        self.assertIsInstance(results[1], ValueError)
+
+    def test_predictor_asyncio_running_loop(self):
+        if sys.version_info < (3, 5):
+            self.skipTest("Test requires asyncio module")
+
+        import asyncio
+
+        network = BlockedNetwork()
+        network.can_predict.set()
+        loop = asyncio.new_event_loop()
+
+        with serving.Predictor(network) as predictor:
+            with self.assertRaises(RuntimeError):
+                predictor.predict_async(np.ones((1, 2)))
+
+            futures = []
+
+            def predict():
+                # Called inside of the running loop
+                future = predictor.predict_async(np.ones((1, 2)))
+                future.add_done_callback(lambda future: loop.stop())
+                futures.append(future)
+
+            loop.call_soon(predict)
+            loop.run_forever()
+
+        loop.close()
+        np.testing.assert_array_equal(futures[0].result(), [[2]])
@@ -0,0 +1,84 @@
+import numpy as np
+
+from neupy import algorithms, layers, streaming
+from neupy.utils import asfloat
+
+from base import BaseTestCase
+
+
+class StatefulPredictorTestCase(BaseTestCase):
+    def create_network(self):
+        return algorithms.RMSProp(
+            [
+                layers.Input(6),
+                layers.Embedding(10, 3),
+                layers.LSTM(4, only_return_final=False, learn_init=True),
+                layers.GRU(5),
+                layers.Sigmoid(1),
+            ],
+            verbose=False,
+        )
+
+    def test_stateful_predictor_step_by_step(self):
+        network = self.create_network()
+        input_data = np.random.randint(0, 10, size=(2, 6))
+        expected_prediction = network.predict(input_data)
+
+        predictor = streaming.StatefulPredictor(network)
+
+        for step in range(6):
+            prediction = predictor.predict(
+                input_data[:, step:step + 1], stream_ids=['a', 'b'])
+
+        np.testing.assert_array_almost_equal(
+            prediction, expected_prediction)
+
+        # The same result for the streams that get
+        # multiple time steps at a time
+        predictor.reset()
+        predictor.predict(input_data[:1, :4], stream_ids=['a'])
+        predictor.predict(input_data[1:, :1], stream_ids=['b'])
+        prediction = predictor.predict(
+            np.stack([input_data[0, 4:], input_data[1, 1:3]]),
+            stream_ids=['a', 'b'])
+
+        np.testing.assert_array_almost_equal(
+            prediction[0], expected_prediction[0])
+
+        lstm_cell_state, lstm_hid_state, gru_hid_state = predictor.states['a']
+        self.assertEqual(lstm_cell_state.shape, (4,))
+        self.assertEqual(gru_hid_state.shape, (5,))
+
+    def test_stateful_predictor_reset(self):
+        network = self.create_network()
+        input_data = asfloat(np.random.randint(0, 10, size=(2, 3)))
+
+        predictor = streaming.StatefulPredictor(network.connection)
+        first_prediction = predictor.predict(input_data, stream_ids=[1, 2])
+        second_prediction = predictor.predict(input_data, stream_ids=[1, 2])
+        self.assertFalse(np.allclose(first_prediction, second_prediction))
+
+        predictor.reset([1])
+        self.assertEqual(list(predictor.states.keys()), [2])
+
+        prediction = predictor.predict(input_data[:1], stream_ids=[1])
+        np.testing.assert_array_almost_equal(
+            prediction, first_prediction[:1])
+
+    def test_stateful_predictor_exceptions(self):
+        network = self.create_network()
+        predictor = streaming.StatefulPredictor(network)
+        input_data = np.ones((2, 3))
+
+        with self.assertRaisesRegexp(ValueError, "unique"):
+            predictor.predict(input_data, stream_ids=[1, 1])
+
+        with self.assertRaisesRegexp(ValueError, "Number of streams"):
+            predictor.predict(input_data, stream_ids=[1])
+
+        with self.assertRaisesRegexp(ValueError, "recurrent layers"):
+            streaming.StatefulPredictor(layers.Input(2) > layers.Relu(1))
+
+        with self.assertRaisesRegexp(ValueError, "step by step"):
+            streaming.StatefulPredictor(
+                layers.Input((6, 3)) > layers.GRU(3, backwards=True))
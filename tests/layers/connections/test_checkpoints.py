@@ -0,0 +1,122 @@
+import numpy as np
+import theano
+import theano.tensor as T
+
+from neupy import layers, algorithms, environment
+from neupy.utils import asfloat
+from neupy.layers.connections import split_into_segments, checkpointed_output
+
+from base import BaseTestCase
+
+
+class GradientCheckpointsTestCase(BaseTestCase):
+    def test_split_into_segments(self):
+        relu = layers.Relu(5)
+        connection = layers.join(
+            layers.Input(10),
+            layers.Relu(5, name='relu-first'),
+            relu,
+            layers.Relu(5),
+            layers.Sigmoid(1),
+        )
+        all_layers = list(connection)
+
+        segments = split_into_segments(all_layers, checkpoints=2)
+        self.assertEqual([len(s) for s in segments], [2, 2, 1])
+
+        segments = split_into_segments(
+            all_layers, checkpoints=['relu-first', relu])
+        self.assertEqual([len(s) for s in segments], [2, 1, 2])
+
+        with self.assertRaises(ValueError):
+            split_into_segments(all_layers, checkpoints=0)
+
+        with self.assertRaises(ValueError):
+            split_into_segments(all_layers, checkpoints=['unknown'])
+
+        with self.assertRaises(ValueError):
+            split_into_segments(all_layers, checkpoints=[layers.Relu(2)])
+
+    def test_checkpointed_gradients(self):
+        connection = layers.join(
+            layers.Input(10),
+            layers.Relu(8),
+            [[
+                layers.Tanh(6),
+                layers.Sigmoid(4),
+            ], [
+                layers.Linear(4),
+            ]],
+            layers.Elementwise(),
+            layers.Relu(),
+            layers.Sigmoid(2),
+        )
+
+        x = T.matrix()
+        cost = connection.output(x).sum()
+        checkpointed_cost = checkpointed_output(
+            connection, [x], checkpoints=3).sum()
+
+        parameters = [p for layer in connection
+                      for p in layer.parameters.values()]
+
+        compute = theano.function([x], T.grad(cost, parameters))
+        compute_checkpointed = theano.function(
+            [x], T.grad(checkpointed_cost, parameters))
+
+        x_test = asfloat(np.random.random((5, 10)))
+
+        for gradient, checkpointed_gradient in zip(
+                compute(x_test), compute_checkpointed(x_test)):
+            np.testing.assert_array_almost_equal(
+                gradient, checkpointed_gradient)
+
+    def test_training_with_checkpoints(self):
+        def create_network(checkpoints):
+            environment.reproducible(seed=0)
+            layers.BaseLayer.global_identifiers_map = {}
+
+            return algorithms.Momentum(
+                [
+                    layers.Input((1, 8, 8)),
+
+                    layers.Convolution((3, 3, 3), padding=1),
+                    layers.BatchNorm(),
+                    layers.Relu(),
+
+                    [[
+                        layers.Convolution((3, 3, 3), padding=1),
+                        layers.Relu(),
+                    ], []],
+                    layers.Elementwise(),
+
+                    layers.Dropout(0.3),
+                    layers.Reshape(),
+                    layers.Softmax(3),
+                ],
+                error='categorical_crossentropy',
+                checkpoints=checkpoints,
+                batch_size=10,
+                verbose=False,
+            )
+
+        x_train = asfloat(np.random.random((30, 1, 8, 8)))
+        y_train = np.eye(3)[np.random.randint(0, 3, 30)]
+
+        networks = [
+            create_network(checkpoints=None),
+            create_network(checkpoints=3),
+            create_network(checkpoints=['relu-1', 'elementwise-1']),
+        ]
+
+        for network in networks:
+            environment.reproducible(seed=1)
+            network.train(x_train, y_train, epochs=3)
+
+        expected_network = networks[0]
+
+        for network in networks[1:]:
+            np.testing.assert_array_almost_equal(
+                expected_network.errors, network.errors)
+            np.testing.assert_array_almost_equal(
+                expected_network.predict(x_train), network.predict(x_train))
@@ -83,3 +83,93 @@ class ConnectionCompilationTestCase(BaseTestCase):
 
         np.testing.assert_array_almost_equal(
             actual_output_2, expected_output_2)
+
+    def test_layer_outputs(self):
+        network = layers.join(
+            layers.Input(10),
+            layers.Relu(5, name='relu'),
+            layers.Dropout(0.5),
+            [[
+                layers.Sigmoid(3, name='sigmoid'),
+            ], [
+                layers.Tanh(2, name='tanh'),
+            ]],
+            layers.Concatenate(name='output'),
+        )
+        x = asfloat(np.random.random((11, 10)))
+
+        predict = network.end('relu', 'sigmoid').compile()
+        relu_output, sigmoid_output = predict(x)
+
+        outputs = network.layer_outputs(x, ['relu', 'sigmoid', 'output'])
+        self.assertEqual(list(outputs.keys()), ['relu', 'sigmoid', 'output'])
+
+        np.testing.assert_array_almost_equal(outputs['relu'], relu_output)
+        np.testing.assert_array_almost_equal(
+            outputs['sigmoid'], sigmoid_output)
+        np.testing.assert_array_almost_equal(
+            outputs['output'], network.compile()(x))
+
+        batched_outputs = network.layer_outputs(
+            x, ['relu', 'sigmoid', 'output'], batch_size=4)
+
+        for layer_name, output in outputs.items():
+            np.testing.assert_array_almost_equal(
+                output, batched_outputs[layer_name])
+
+    def test_layer_outputs_function_cache(self):
+        relu = layers.Relu(5, name='relu')
+        network = layers.Input(10) > relu > layers.Sigmoid(1)
+
+        compute = network.compile_layer_outputs(['relu'])
+        self.assertIs(compute, network.compile_layer_outputs([relu]))
+        self.assertIsNot(compute, network.compile_layer_outputs(
+            ['relu'], training_state=True))
+        self.assertEqual(len(network.compiled_functions), 2)
+
+        # Training state should be restored after compilation
+        self.assertTrue(relu.training_state)
+
+        with self.assertRaises(NameError):
+            network.compile_layer_outputs(['unknown'])
+
+        with self.assertRaises(ValueError):
+            network.compile_layer_outputs([layers.Relu(2)])
+
+        # Layers added to the connection change its graph
+        network > layers.Sigmoid(2)
+        self.assertEqual(network.compiled_functions, {})
+
+        network.compile_layer_outputs(['relu'])
+        self.assertEqual(network.end('relu').compiled_functions, {})
+        self.assertEqual(len(network.compiled_functions), 1)
+
+    def test_layer_outputs_training_state(self):
+        dropout = layers.Dropout(0.5)
+        network = layers.Input(10) > dropout > layers.Sigmoid(1)
+
+        with network.disable_training_state():
+            network.compile_layer_outputs([dropout], training_state=True)
+            self.assertFalse(dropout.training_state)
+
+            with network.disable_training_state(training_state=True):
+                self.assertTrue(dropout.training_state)
+
+            self.assertFalse(dropout.training_state)
+
+        self.assertTrue(dropout.training_state)
+
+    def test_layer_outputs_multiple_inputs(self):
+        network = layers.join(
+            [[
+                layers.Input(10),
+            ], [
+                layers.Input(10),
+            ]],
+            layers.Elementwise(name='sum'),
+            layers.Linear(5, weight=init.Constant(0.1), bias=None),
+        )
+        x = asfloat(np.ones((7, 10)))
+
+        outputs = network.layer_outputs([0.7 * x, 0.3 * x], ['sum'])
+        np.testing.assert_array_almost_equal(outputs['sum'], x)
@@ -1,6 +1,7 @@
 import numpy as np
+import scipy.sparse as sp
 
-from neupy import layers, algorithms
+from neupy import layers, algorithms, storage
 
 from base import BaseTestCase
 
@@ -101,3 +102,45 @@ class InputLayerTestCase(BaseTestCase):
     def test_input_layer_exceptions(self):
         with self.assertRaises(ValueError):
             layers.Input(0)
+
+    def test_sparse_input_layer_exceptions(self):
+        with self.assertRaises(ValueError):
+            layers.Input((10, 3), sparse=True)
+
+    def test_sparse_input_layer(self):
+        np.random.seed(0)
+
+        x_dense = np.random.binomial(1, 0.05, size=(100, 30))
+        y_train = (x_dense[:, :3].sum(axis=1) > 0).reshape((-1, 1))
+        x_sparse = sp.csr_matrix(x_dense)
+
+        dense_network = algorithms.Momentum(
+            [
+                layers.Input(30),
+                layers.Relu(5),
+                layers.Sigmoid(1),
+            ],
+            batch_size=16,
+            shuffle_data=False,
+            verbose=False,
+        )
+        sparse_network = algorithms.Momentum(
+            [
+                layers.Input(30, sparse=True),
+                layers.Relu(5),
+                layers.Sigmoid(1),
+            ],
+            batch_size=16,
+            shuffle_data=False,
+            verbose=False,
+        )
+        storage.load_dict(sparse_network, storage.save_dict(dense_network))
+
+        dense_network.train(x_dense, y_train, epochs=5)
+        sparse_network.train(x_sparse, y_train, epochs=5)
+
+        np.testing.assert_array_almost_equal(
+            dense_network.errors, sparse_network.errors)
+        np.testing.assert_array_almost_equal(
+            dense_network.predict(x_dense),
+            sparse_network.predict(x_sparse))
@@ -1,6 +1,8 @@
 import numpy as np
+import theano
+import theano.tensor as T
 
-from neupy import layers
+from neupy import layers, algorithms, architectures
 from neupy.utils import asfloat
 from neupy.exceptions import LayerConnectionError
 
@@ -133,3 +135,81 @@ class GatedAverageTestCase(BaseTestCase):
         actual_output = predict(random_input)
 
         self.assertEqual(actual_output.shape, (8, 3, 4, 4))
+
+    def test_gated_average_top_k_exceptions(self):
+        gated_avg_layer = layers.GatedAverage(top_k=3)
+        with self.assertRaisesRegexp(LayerConnectionError, "Cannot select"):
+            layers.join([
+                layers.Input(10) > layers.Softmax(2),
+                layers.Input(20) > layers.Relu(8),
+                layers.Input(20) > layers.Relu(8),
+            ], gated_avg_layer)
+
+        with self.assertRaises(ValueError):
+            layers.GatedAverage(top_k=0)
+
+    def test_gated_average_top_k_output(self):
+        input_layer = layers.Input(10)
+        gating_layer = layers.Softmax(4)
+        experts = [layers.Relu(8) for _ in range(4)]
+        gated_avg_layer = layers.GatedAverage(top_k=2)
+
+        network = layers.join(
+            [input_layer > gating_layer] +
+            [input_layer > expert for expert in experts],
+            gated_avg_layer,
+        )
+
+        x = asfloat(np.random.random((20, 10)))
+        predict = network.compile()
+        actual_output = predict(x)
+
+        gating_predict = layers.join(input_layer, gating_layer).compile()
+        gates = gating_predict(x)
+        expert_outputs = [
+            layers.join(input_layer, expert).compile()(x)
+            for expert in experts
+        ]
+
+        top_k_indices = np.argsort(gates, axis=1)[:, -2:]
+        expected_output = np.zeros((20, 8))
+        expected_load = np.zeros(4)
+
+        for i, indices in enumerate(top_k_indices):
+            weights = gates[i, indices] / gates[i, indices].sum()
+
+            for index, weight in zip(indices, weights):
+                expected_output[i] += weight * expert_outputs[index][i]
+                expected_load[index] += 1. / 20
+
+        np.testing.assert_array_almost_equal(expected_output, actual_output)
+
+        # Load is updated only when layer's updates have been applied
+        input_value = T.matrix()
+        network.output(input_value)
+        update_load = theano.function(
+            [input_value], updates=gated_avg_layer.updates)
+        update_load(x)
+
+        np.testing.assert_array_almost_equal(
+            expected_load, gated_avg_layer.expert_load.get_value())
+
+    def test_gated_average_top_k_training(self):
+        network = architectures.mixture_of_experts([
+            layers.Input(10) > layers.Relu(8) > layers.Sigmoid(1)
+            for _ in range(4)
+        ], top_k=2)
+        gated_avg_layer = network.output_layers[0]
+
+        x_train = asfloat(np.random.random((30, 10)))
+        y_train = asfloat(np.random.random((30, 1)))
+
+        gdnet = algorithms.Momentum(network, step=0.1, batch_size='all')
+        gdnet.train(x_train, y_train, epochs=5)
+
+        self.assertLess(gdnet.errors.last(), gdnet.errors[0])
+        expert_load = gated_avg_layer.expert_load.get_value()
+        expert_importance = gated_avg_layer.expert_importance.get_value()
+
+        self.assertAlmostEqual(expert_load.sum(), 2)
+        self.assertAlmostEqual(expert_importance.sum(), 1, places=5)
@@ -1,13 +1,15 @@
 import textwrap
 
 import numpy as np
+import theano
 import theano.tensor as T
 
 from neupy import layers
 from neupy.utils import asfloat
 from neupy.exceptions import LayerConnectionError
-from neupy.layers.connections.graph import LayerGraph, is_cyclic
-from neupy.layers.connections.base import topological_sort
+from neupy.layers.connections.graph import (LayerGraph, is_cyclic,
+                                            is_reachable, topological_sort,
+                                            sort_reachable_vertices)
 
 from base import BaseTestCase
 
@@ -71,6 +73,10 @@ class LayerGraphTestCase(BaseTestCase):
         with self.assertRaises(LayerConnectionError):
             graph.connect_layers(l3, l1)
 
+        # Invalid connection shouldn't be added to the graph
+        self.assertEqual(graph.forward_graph[l3], [])
+        self.assertEqual(graph.backward_graph[l1], [])
+
     def test_is_cyclic_graph(self):
         graph1 = {1: [2], 2: [3], 3: [1]}
         self.assertTrue(is_cyclic(graph1), msg=graph1)
@@ -78,6 +84,24 @@ class LayerGraphTestCase(BaseTestCase):
         graph2 = {1: [2], 2: [3], 3: [4]}
         self.assertFalse(is_cyclic(graph2), msg=graph2)
 
+    def test_is_reachable(self):
+        graph = {1: [2, 3], 2: [4], 3: [4], 4: [], 5: [1]}
+
+        self.assertTrue(is_reachable(graph, 1, 4))
+        self.assertTrue(is_reachable(graph, 5, 4))
+        self.assertTrue(is_reachable(graph, 2, 2))
+
+        self.assertFalse(is_reachable(graph, 4, 1))
+        self.assertFalse(is_reachable(graph, 2, 3))
+
+    def test_sort_reachable_vertices(self):
+        graph = {1: [2, 3], 2: [4], 3: [4], 4: [], 5: [1]}
+
+        self.assertEqual(sort_reachable_vertices(graph, [1]), [1, 3, 2, 4])
+        self.assertEqual(sort_reachable_vertices(graph, [2, 3]), [3, 2, 4])
+        self.assertEqual(sort_reachable_vertices(graph, [4, 5]),
+                         [5, 1, 3, 2, 4])
+
     def test_graph_connection_error(self):
         l1 = layers.Input(10)
         l2 = layers.Input(20)
@@ -256,6 +280,45 @@ class LayerGraphTestCase(BaseTestCase):
         with self.assertRaises(ValueError):
             graph.propagate_forward({layer_2: T.matrix()})
 
+    def test_graph_propagate_forward_through_deep_graph(self):
+        # Number of layers is bigger than the recursion limit
+        connection = layers.join(
+            layers.Input(1),
+            *[layers.Linear(1) for _ in range(1500)]
+        )
+
+        x = T.matrix()
+        self.assertEqual(connection.output(x).ndim, 2)
+
+    def test_graph_propagate_forward_from_hidden_layer(self):
+        input_layer = layers.Input(10)
+        hidden_layer = layers.Sigmoid(5)
+        output_layer = layers.Sigmoid(2)
+
+        connection = input_layer > hidden_layer > output_layer
+        hidden_output = T.matrix()
+
+        output = connection.output({hidden_layer: hidden_output})
+        parameters = list(hidden_layer.parameters.values())
+        parameters += list(output_layer.parameters.values())
+
+        # Input layer shouldn't be used
+        self.assertEqual(theano.gof.graph.inputs([output]),
+                         [hidden_output] + parameters)
+
+    def test_graph_shape_propagation_through_residual_blocks(self):
+        blocks = []
+        for _ in range(30):
+            blocks.extend([[[layers.Relu(5)], []], layers.Elementwise()])
+
+        # Number of paths between first and last layers
+        # grows exponentially with number of blocks
+        connection = layers.join(layers.Relu(5), *blocks)
+        self.assertEqual(connection.output_shape, None)
+
+        connection = layers.Input(5) > connection
+        self.assertEqual(connection.output_shape, (5,))
+
     def test_graph_connect_layer_missed_input_shapes(self):
         # input_layer_1 -> concatenate
         #                    /
@@ -346,3 +409,41 @@ class LayerGraphTestCase(BaseTestCase):
         ]
 
         self.assertListEqual(actual_graph, expected_graph)
+
+    def test_graph_cache_invalidation(self):
+        l1 = layers.Input(1)
+        l2 = layers.Sigmoid(2)
+        l3 = layers.Sigmoid(3)
+
+        graph = LayerGraph()
+        graph.connect_layers(l1, l2)
+
+        self.assertEqual(graph.layers, [l1, l2])
+        self.assertEqual(graph.input_layers, [l1])
+        self.assertEqual(graph.output_layers, [l2])
+
+        graph.connect_layers(l2, l3)
+
+        self.assertEqual(graph.layers, [l1, l2, l3])
+        self.assertEqual(graph.input_layers, [l1])
+        self.assertEqual(graph.output_layers, [l3])
+
+        # Modifications of the returned lists shouldn't
+        # affect graph's cache
+        graph.output_layers.append(l1)
+        self.assertEqual(graph.output_layers, [l3])
+
+    def test_graph_find_renamed_layer(self):
+        l1 = layers.Input(1, name='input')
+        l2 = layers.Sigmoid(2, name='sigmoid')
+
+        graph = LayerGraph()
+        graph.connect_layers(l1, l2)
+
+        self.assertIs(graph.find_layer_by_name('sigmoid'), l2)
+
+        l2.name = 'output'
+        self.assertIs(graph.find_layer_by_name('output'), l2)
+
+        with self.assertRaises(NameError):
+            graph.find_layer_by_name('sigmoid')
@@ -0,0 +1,132 @@
+import numpy as np
+
+from neupy import layers, algorithms
+from neupy.utils import asfloat
+
+from base import BaseTestCase
+
+
+def randomize_batch_norm(connection):
+    for layer in connection:
+        if isinstance(layer, layers.BatchNorm):
+            shape = layer.gamma.get_value().shape
+
+            layer.gamma.set_value(asfloat(np.random.random(shape) + 0.5))
+            layer.beta.set_value(asfloat(np.random.random(shape)))
+            layer.running_mean.set_value(asfloat(np.random.random(shape)))
+            layer.running_inv_std.set_value(
+                asfloat(np.random.random(shape) + 0.5))
+
+
+class OptimizeForInferenceTestCase(BaseTestCase):
+    def assertSameOutput(self, connection, optimized_connection, x):
+        predict = connection.compile()
+        optimized_predict = optimized_connection.compile()
+
+        np.testing.assert_array_almost_equal(
+            predict(x), optimized_predict(x))
+
+    def test_fold_batch_norm_into_convolution(self):
+        connection = layers.join(
+            layers.Input((3, 10, 10)),
+
+            layers.Convolution((4, 3, 3), bias=None),
+            layers.BatchNorm(),
+            layers.Relu(),
+
+            layers.Convolution((5, 3, 3)),
+            layers.BatchNorm(),
+            layers.Dropout(0.5),
+
+            layers.Reshape(),
+            layers.Softmax(2),
+        )
+        randomize_batch_norm(connection)
+        optimized = layers.optimize_for_inference(connection)
+
+        self.assertEqual(len(connection), 9)
+        self.assertEqual(len(optimized), 6)
+
+        layer_types = [layer.__class__ for layer in optimized]
+        self.assertNotIn(layers.BatchNorm, layer_types)
+        self.assertNotIn(layers.Dropout, layer_types)
+
+        x = asfloat(np.random.random((7, 3, 10, 10)))
+        self.assertSameOutput(connection, optimized, x)
+
+    def test_fold_batch_norm_into_linear_layer(self):
+        network = algorithms.GradientDescent([
+            layers.Input(10),
+            layers.Linear(8),
+            layers.BatchNorm(),
+            layers.Sigmoid(1),
+        ])
+        randomize_batch_norm(network.connection)
+
+        linear = network.connection.layers[1]
+        weight_before = linear.weight.get_value()
+
+        optimized = layers.optimize_for_inference(network)
+        optimized_linear = optimized.layers[1]
+
+        self.assertEqual(len(optimized), 3)
+        self.assertIsNot(optimized_linear, linear)
+        self.assertEqual(optimized_linear.name, linear.name)
+
+        # Original network shouldn't be modified
+        np.testing.assert_array_equal(weight_before, linear.weight.get_value())
+        self.assertEqual(len(network.connection), 4)
+
+        x = asfloat(np.random.random((20, 10)))
+        np.testing.assert_array_almost_equal(
+            network.predict(x), optimized.compile()(x))
+
+    def test_batch_norm_that_cannot_be_folded(self):
+        connection = layers.join(
+            layers.Input(10),
+            layers.Relu(8),
+            layers.BatchNorm(),
+            [[
+                layers.Linear(4),
+            ], [
+                layers.Linear(4),
+                layers.BatchNorm(),
+            ]],
+            layers.Concatenate(),
+        )
+        randomize_batch_norm(connection)
+        optimized = layers.optimize_for_inference(connection)
+
+        # First batch normalization layer follows non-linear layer
+        self.assertEqual(len(connection) - 1, len(optimized))
+
+        x = asfloat(np.random.random((20, 10)))
+        self.assertSameOutput(connection, optimized, x)
+
+    def test_remove_stochastic_layers(self):
+        input_layer = layers.Input(10)
+        connection = layers.join(
+            input_layer,
+            layers.Relu(5),
+            [[
+                layers.GaussianNoise(std=1),
+                layers.Sigmoid(3),
+            ], [
+                layers.Tanh(3),
+            ]],
+            layers.Concatenate(),
+            layers.Dropout(0.5),
+        )
+        optimized = layers.optimize_for_inference(connection)
+
+        self.assertEqual(len(optimized), 5)
+        self.assertEqual(optimized.output_shape, (6,))
+        self.assertIsInstance(optimized.output_layers[0], layers.Concatenate)
+        self.assertEqual(optimized.input_layers, [input_layer])
+
+        x = asfloat(np.random.random((20, 10)))
+        self.assertSameOutput(connection, optimized, x)
+
+    def test_optimize_for_inference_exceptions(self):
+        with self.assertRaises(ValueError):
+            layers.optimize_for_inference(layers.Input(10))
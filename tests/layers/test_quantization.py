@@ -0,0 +1,112 @@
+import numpy as np
+
+from neupy import layers, algorithms
+from neupy.utils import asfloat
+from neupy.layers.quantization import (quantize_weight,
+                                       input_quantization_range)
+
+from base import BaseTestCase
+
+
+class QuantizationTestCase(BaseTestCase):
+    def test_quantize_weight(self):
+        weight = np.array([
+            [-1.0, 0.5, 0.0],
+            [2.54, 0.0, 0.0],
+        ])
+
+        quantized_weight, scale = quantize_weight(weight)
+        self.assertEqual(quantized_weight.dtype, np.int8)
+        self.assertEqual(scale.shape, (1, 1))
+        np.testing.assert_array_equal(
+            quantized_weight, [[-50, 25, 0], [127, 0, 0]])
+
+        quantized_weight, scale = quantize_weight(weight.T, axis=0)
+        self.assertEqual(scale.shape, (3, 1))
+        np.testing.assert_array_almost_equal(
+            scale.ravel(), [0.02, 0.5 / 127, 1])
+        np.testing.assert_array_equal(
+            quantized_weight, [[-50, 127], [127, 0], [0, 0]])
+
+    def test_input_quantization_range(self):
+        scale, zero_point = input_quantization_range(np.array([0.5, 2.55]))
+        self.assertAlmostEqual(scale, 0.01)
+        self.assertEqual(zero_point, 0)
+
+        scale, zero_point = input_quantization_range(np.array([-1., 1.55]))
+        self.assertAlmostEqual(scale, 0.01)
+        self.assertEqual(zero_point, 100)
+
+        self.assertEqual(input_quantization_range(np.zeros(5)), (1, 0))
+
+    def test_quantize_convolutional_network(self):
+        connection = layers.join(
+            layers.Input((3, 10, 10)),
+
+            layers.Convolution((4, 3, 3), name='conv'),
+            layers.BatchNorm(),
+            layers.Relu(),
+
+            layers.Reshape(),
+            layers.Dropout(0.5),
+            layers.Softmax(2, name='output'),
+        )
+        x = asfloat(np.random.random((20, 3, 10, 10)))
+        quantized = layers.quantize_for_inference(
+            connection, x, batch_size=7)
+
+        layer_types = [layer.__class__ for layer in quantized]
+        self.assertEqual(layer_types, [
+            layers.Input, layers.QuantizedLayer, layers.Relu,
+            layers.Reshape, layers.QuantizedLayer])
+
+        conv = quantized.layer('conv')
+        self.assertEqual(conv.output_shape, (4, 8, 8))
+        self.assertEqual(conv.quantized_weight.get_value().dtype, np.int8)
+        # Convolution has one scale per each output channel
+        self.assertEqual(conv.weight_scale.get_value().shape, (4, 1, 1, 1))
+
+        output = quantized.layer('output')
+        self.assertEqual(output.weight_scale.get_value().shape, (1, 1))
+
+        np.testing.assert_array_almost_equal(
+            connection.compile()(x), quantized.compile()(x), decimal=2)
+
+        errors = layers.quantization_errors(connection, quantized, x)
+        self.assertEqual(list(errors.keys()), ['conv', 'output'])
+
+        for error in errors.values():
+            self.assertGreater(error, 0)
+            self.assertLess(error, 0.05)
+
+    def test_quantize_network_with_multiple_inputs(self):
+        network = algorithms.GradientDescent([
+            [[
+                layers.Input(5),
+                layers.Relu(4, name='relu'),
+            ], [
+                layers.Input(3),
+            ]],
+            layers.Concatenate(),
+            layers.Sigmoid(2),
+        ], verbose=False)
+
+        x1 = asfloat(np.random.random((10, 5)))
+        x2 = asfloat(np.random.random((10, 3)))
+
+        quantized = layers.quantize_for_inference(network, [x1, x2])
+        n_quantized = sum(isinstance(layer, layers.QuantizedLayer)
+                          for layer in quantized)
+
+        self.assertEqual(n_quantized, 2)
+        np.testing.assert_array_almost_equal(
+            network.connection.compile()(x1, x2),
+            quantized.compile()(x1, x2), decimal=2)
+
+        # Layers from the original network shouldn't be changed
+        relu = network.connection.layer('relu')
+        quantized_relu = quantized.layer('relu')
+
+        self.assertIsNot(relu, quantized_relu)
+        self.assertEqual(relu.weight.get_value().shape, (5, 4))
+        self.assertEqual(quantized_relu.layer.output_shape, (4,))
@@ -1,9 +1,12 @@
 import numpy as np
+import theano
+import theano.tensor as T
 from sklearn.model_selection import train_test_split
 
 from neupy.exceptions import LayerConnectionError
 from neupy.datasets import reber
-from neupy import layers, algorithms, init
+from neupy import layers, algorithms, init, storage
+from neupy.utils import asfloat
 
 from base import BaseTestCase
 
@@ -386,3 +389,175 @@ class GRUTestCase(BaseTestCase):
 
         with self.assertRaises(TypeError):
             layers.GRU(1, activation_functions=lambda x: x)
+
+
+class MaskedRNNTestCase(BaseTestCase):
+    def check_masked_output(self, layer_class, **options):
+        rnn_layer = layer_class(4, **options)
+        layers.join([layers.Input((6, 3)), layers.Input(6)], rnn_layer)
+
+        input_value = asfloat(np.random.random((2, 6, 3)))
+        mask = asfloat(np.ones((2, 6)))
+        mask[0, 4:] = 0
+
+        x, m = T.tensor3(), T.matrix()
+        predict = theano.function([x, m], rnn_layer.output(x, m))
+        predict_without_mask = theano.function([x], rnn_layer.output(x))
+
+        np.testing.assert_array_almost_equal(
+            predict(input_value, mask)[0],
+            predict_without_mask(input_value[:1, :4])[0],
+        )
+        np.testing.assert_array_almost_equal(
+            predict(input_value, mask)[1],
+            predict_without_mask(input_value[1:])[0],
+        )
+
+    def test_masked_lstm_output(self):
+        self.check_masked_output(layers.LSTM)
+        self.check_masked_output(layers.LSTM, peepholes=True)
+        self.check_masked_output(layers.LSTM, precompute_input=False)
+
+    def test_masked_gru_output(self):
+        self.check_masked_output(layers.GRU)
+        self.check_masked_output(layers.GRU, precompute_input=False)
+
+    def test_masked_rnn_shapes(self):
+        lstm_layer = layers.LSTM(4, only_return_final=False)
+        layers.join([layers.Input((6, 3)), layers.Input(6)], lstm_layer)
+
+        self.assertEqual(lstm_layer.input_shape, (6, 3))
+        self.assertEqual(lstm_layer.output_shape, (6, 4))
+
+    def test_masked_rnn_connection_exceptions(self):
+        with self.assertRaisesRegexp(LayerConnectionError, "Mask"):
+            [layers.Input((6, 3)), layers.Input(5)] > layers.GRU(4)
+
+        with self.assertRaisesRegexp(LayerConnectionError, "at most two"):
+            inputs = [layers.Input((6, 3)), layers.Input(6), layers.Input(6)]
+            inputs > layers.LSTM(4)
+
+    def test_masked_lstm_training(self):
+        data, labels = reber.make_reber_classification(
+            n_samples=100, return_indeces=True)
+
+        n_time_steps = max(map(len, data))
+        x_train = np.zeros((len(data), n_time_steps))
+        mask = np.zeros((len(data), n_time_steps))
+
+        for i, sample in enumerate(data):
+            # Right padding with a mask
+            x_train[i, :len(sample)] = np.array(sample) + 1
+            mask[i, :len(sample)] = 1
+
+        sequence = layers.Input(n_time_steps) > layers.Embedding(
+            len(reber.avaliable_letters) + 1, 10)
+
+        network = algorithms.RMSProp(
+            [sequence, layers.Input(n_time_steps)] > layers.LSTM(20) >
+            layers.Sigmoid(1),
+
+            step=0.05,
+            verbose=False,
+            batch_size=16,
+            error='binary_crossentropy',
+            batch_sampler=algorithms.LengthBucketSampler(),
+        )
+        network.train([x_train, mask], labels, epochs=20)
+
+        y_predicted = network.predict([x_train, mask]).round()
+        accuracy = (y_predicted.T == labels).mean()
+        self.assertGreaterEqual(accuracy, 0.9)
+
+
+class StackedRNNParametersTestCase(BaseTestCase):
+    def check_stacked_parameters(self, layer_class, n_gates, **options):
+        layer = layer_class(4, **options)
+        stacked_layer = layer_class(4, stack_parameters=True, **options)
+
+        layers.join(layers.Input((6, 3)), layer)
+        layers.join(layers.Input((6, 3)), stacked_layer)
+
+        self.assertEqual(
+            stacked_layer.parameters['weight_in_stacked'].get_value().shape,
+            (3, n_gates * 4))
+        self.assertEqual(
+            stacked_layer.parameters['bias_stacked'].get_value().shape,
+            (n_gates * 4,))
+
+        # Stored parameters don't depend on the stacking
+        storage.load_dict(stacked_layer, storage.save_dict(layer))
+        saved_parameters = storage.save_dict(stacked_layer)['layers'][0]
+        self.assertEqual(
+            sorted(saved_parameters['parameters']),
+            sorted(storage.save_dict(layer)['layers'][0]['parameters']))
+
+        x = T.tensor3()
+        input_value = asfloat(np.random.random((2, 6, 3)))
+
+        np.testing.assert_array_almost_equal(
+            theano.function([x], layer.output(x))(input_value),
+            theano.function([x], stacked_layer.output(x))(input_value),
+        )
+
+        new_layer = layer_class(4, **options)
+        layers.join(layers.Input((6, 3)), new_layer)
+        storage.load_dict(new_layer, storage.save_dict(stacked_layer))
+
+        np.testing.assert_array_almost_equal(
+            theano.function([x], layer.output(x))(input_value),
+            theano.function([x], new_layer.output(x))(input_value),
+        )
+
+        return stacked_layer
+
+    def test_lstm_stacked_parameters(self):
+        lstm_layer = self.check_stacked_parameters(
+            layers.LSTM, n_gates=4, peepholes=True,
+            biases=dict(bias_forgetgate=init.Constant(1)))
+
+        np.testing.assert_array_equal(
+            lstm_layer.bias_forgetgate.eval(), np.ones(4))
+        np.testing.assert_array_equal(lstm_layer.bias_ingate.eval(), 0)
+
+        self.assertNotIn('weight_in_to_ingate', lstm_layer.parameters)
+        self.assertIn('weight_cell_to_ingate', lstm_layer.parameters)
+
+    def test_gru_stacked_parameters(self):
+        gru_layer = self.check_stacked_parameters(
+            layers.GRU, n_gates=3, precompute_input=False,
+            biases=dict(bias_resetgate=init.Constant(1)))
+
+        np.testing.assert_array_equal(
+            gru_layer.bias_resetgate.eval(), np.ones(4))
+
+    def test_stacked_parameters_training(self):
+        x_train = np.random.randint(1, 10, size=(20, 5))
+        y_train = (x_train.sum(axis=1, keepdims=True) > 25).astype(int)
+
+        network = algorithms.RMSProp(
+            [
+                layers.Input(5),
+                layers.Embedding(10, 3),
+                layers.LSTM(4, stack_parameters=True),
+                layers.Sigmoid(1),
+            ],
+            verbose=False,
+            error='binary_crossentropy',
+        )
+        weight_before = network.layers[2].weight_in_to_cell.eval()
+        network.train(x_train, y_train, epochs=5)
+
+        self.assertLess(network.errors.last(), network.errors[0])
+        self.assertFalse(np.allclose(
+            weight_before, network.layers[2].weight_in_to_cell.eval()))
+
+    def test_stacked_parameters_exceptions(self):
+        with self.assertRaisesRegexp(ValueError, "cannot be stacked"):
+            layers.join(
+                layers.Input((6, 3)),
+                layers.GRU(4, stack_parameters=True, weights=dict(
+                    weight_in_to_updategate=theano.shared(
+                        asfloat(np.ones((3, 4)))),
+                )),
+            )
@@ -0,0 +1,107 @@
+import tempfile
+
+import numpy as np
+import theano.tensor as T
+
+from neupy import layers, storage
+from neupy.utils import asfloat
+
+from base import BaseTestCase
+
+
+def prune_weight(layer, sparsity):
+    weight = layer.weight.get_value()
+    threshold = np.percentile(np.abs(weight), 100 * sparsity)
+    weight[np.abs(weight) < threshold] = 0
+    layer.weight.set_value(weight)
+
+
+class SparsifyForInferenceTestCase(BaseTestCase):
+    def test_sparsify_for_inference(self):
+        connection = layers.join(
+            layers.Input((3, 10, 10)),
+            layers.Convolution((4, 3, 3), name='conv'),
+            layers.Reshape(),
+            layers.Relu(20, name='relu'),
+            layers.Dropout(0.5),
+            layers.Tanh(10, name='tanh'),
+            layers.Softmax(2, name='output'),
+        )
+
+        prune_weight(connection.layer('conv'), 0.9)
+        prune_weight(connection.layer('relu'), 0.9)
+        prune_weight(connection.layer('tanh'), 0.4)
+
+        sparse_connection = layers.sparsify_for_inference(connection)
+        is_sparse = [not isinstance(layer.weight.type, T.TensorType)
+                     for layer in sparse_connection
+                     if hasattr(layer, 'weight')]
+
+        # Convolution and layers with dense weights stay the same
+        self.assertEqual(is_sparse, [False, True, False, False])
+        self.assertEqual(len(sparse_connection), 6)
+
+        relu = sparse_connection.layer('relu')
+        self.assertIsNot(relu, connection.layer('relu'))
+        self.assertEqual(relu.weight.get_value().format, 'csr')
+        self.assertEqual(relu.weight.get_value().nnz, 512)
+
+        x = asfloat(np.random.random((7, 3, 10, 10)))
+        np.testing.assert_array_almost_equal(
+            connection.compile()(x), sparse_connection.compile()(x))
+
+        sparse_connection = layers.sparsify_for_inference(
+            connection, min_sparsity=0.4)
+        self.assertNotIsInstance(
+            sparse_connection.layer('tanh').weight.type, T.TensorType)
+
+        with self.assertRaises(ValueError):
+            layers.sparsify_for_inference(connection, min_sparsity=1.5)
+
+    def test_sparse_connection_storage(self):
+        def create_sparse_connection():
+            connection = layers.join(
+                layers.Input(20),
+                layers.Relu(30, name='relu'),
+                layers.Linear(5, name='linear'),
+            )
+            prune_weight(connection.layer('relu'), 0.9)
+            prune_weight(connection.layer('linear'), 0.9)
+            return layers.sparsify_for_inference(connection)
+
+        sparse_connection_1 = create_sparse_connection()
+        predict_1 = sparse_connection_1.compile()
+
+        x = asfloat(np.random.random((7, 20)))
+        save_load_functions = [
+            (storage.save_pickle, storage.load_pickle),
+            (storage.save_json, storage.load_json),
+            (storage.save_hdf5, storage.load_hdf5),
+            (storage.save_memmap, storage.load_memmap),
+        ]
+
+        for save, load in save_load_functions:
+            sparse_connection_2 = create_sparse_connection()
+
+            with tempfile.NamedTemporaryFile() as temp:
+                save(sparse_connection_1, temp.name)
+                load(sparse_connection_2, temp.name)
+
+            relu = sparse_connection_2.layer('relu')
+            self.assertEqual(relu.weight.get_value().format, 'csr')
+            np.testing.assert_array_almost_equal(
+                predict_1(x), sparse_connection_2.compile()(x))
+
+        # Dense network can load parameters of the sparse network
+        dense_connection = layers.join(
+            layers.Input(20),
+            layers.Relu(30, name='relu'),
+            layers.Linear(5, name='linear'),
+        )
+
+        with tempfile.NamedTemporaryFile() as temp:
+            storage.save_hdf5(sparse_connection_1, temp.name)
+            storage.load_hdf5(dense_connection, temp.name)
+
+        np.testing.assert_array_almost_equal(
+            predict_1(x), dense_connection.compile()(x))
@@ -0,0 +1,171 @@
+import os
+import tempfile
+
+import numpy as np
+
+from neupy import algorithms, storage
+from neupy.storage import InvalidFormat
+from neupy.exceptions import WeightInitializationError
+
+from base import BaseTestCase
+
+
+class AlgorithmStorageTestCase(BaseTestCase):
+    def setUp(self):
+        super(AlgorithmStorageTestCase, self).setUp()
+
+        self.filepath = os.path.join(tempfile.mkdtemp(), 'network.neupy')
+        self.x_train = np.random.random((30, 4))
+        self.y_train = np.random.random((30, 1))
+        self.classes = np.random.randint(0, 3, 30)
+
+    def save_and_load(self, network, **options):
+        storage.save_algorithm(network, self.filepath)
+        return storage.load_algorithm(self.filepath, **options)
+
+    def test_grnn_storage(self):
+        grnn = algorithms.GRNN(std=0.2, verbose=False)
+        grnn.train(self.x_train, self.y_train)
+
+        loaded_grnn = self.save_and_load(grnn)
+
+        self.assertIsInstance(loaded_grnn, algorithms.GRNN)
+        self.assertEqual(loaded_grnn.std, 0.2)
+        # Arrays are not copied into the memory
+        self.assertIsInstance(loaded_grnn.input_train, np.memmap)
+
+        np.testing.assert_array_almost_equal(
+            grnn.predict(self.x_train), loaded_grnn.predict(self.x_train))
+
+    def test_pnn_storage(self):
+        pnn = algorithms.PNN(std=0.5, batch_size=10, verbose=False)
+        pnn.train(self.x_train, self.classes)
+
+        loaded_pnn = self.save_and_load(pnn)
+
+        self.assertEqual(loaded_pnn.batch_size, 10)
+        np.testing.assert_array_almost_equal(
+            pnn.predict_proba(self.x_train),
+            loaded_pnn.predict_proba(self.x_train))
+
+        untrained_pnn = self.save_and_load(algorithms.PNN(verbose=False))
+        self.assertIsNone(untrained_pnn.classes)
+
+    def test_sofm_storage(self):
+        sofm = algorithms.SOFM(
+            n_inputs=4, features_grid=(3, 2), weight='sample_from_data',
+            distance='cos', verbose=False)
+
+        with self.assertRaises(WeightInitializationError):
+            self.save_and_load(sofm)
+
+        sofm.train(self.x_train, epochs=3)
+        loaded_sofm = self.save_and_load(sofm)
+
+        self.assertEqual(loaded_sofm.last_epoch, 3)
+        self.assertEqual(loaded_sofm.distance.name, 'cosine')
+        np.testing.assert_array_equal(
+            sofm.predict(self.x_train), loaded_sofm.predict(self.x_train))
+
+        # Training continues from the last epoch
+        sofm.train(self.x_train, epochs=1)
+        loaded_sofm.train(self.x_train, epochs=1)
+
+        self.assertEqual(loaded_sofm.last_epoch, 4)
+        np.testing.assert_array_almost_equal(
+            sofm.weight, loaded_sofm.weight)
+
+    def test_lvq_storage(self):
+        lvq = algorithms.LVQ21(
+            n_inputs=4, n_subclasses=5, n_classes=3, verbose=False)
+        lvq.train(self.x_train, self.classes, epochs=3)
+
+        loaded_lvq = self.save_and_load(lvq)
+
+        self.assertEqual(lvq.n_updates, loaded_lvq.n_updates)
+        self.assertEqual(lvq.prototypes_per_class,
+                         loaded_lvq.prototypes_per_class)
+        np.testing.assert_array_equal(
+            lvq.predict(self.x_train), loaded_lvq.predict(self.x_train))
+
+    def test_growing_neural_gas_storage(self):
+        gng = algorithms.GrowingNeuralGas(
+            n_inputs=4, n_iter_before_neuron_added=10, verbose=False)
+        gng.train(self.x_train, epochs=3)
+
+        loaded_gng = self.save_and_load(gng)
+        graph, loaded_graph = gng.graph, loaded_gng.graph
+
+        self.assertEqual(gng.n_updates, loaded_gng.n_updates)
+        self.assertEqual(graph.n_nodes, loaded_graph.n_nodes)
+
+        for node, loaded_node in zip(graph.nodes, loaded_graph.nodes):
+            np.testing.assert_array_equal(node.weight, loaded_node.weight)
+            self.assertAlmostEqual(node.error, loaded_node.error)
+
+        def edges_with_weights(graph):
+            return sorted(
+                (sorted([node_1.weight.tolist(), node_2.weight.tolist()]),
+                 age) for (node_1, node_2), age in graph.edges.items())
+
+        self.assertEqual(edges_with_weights(graph),
+                         edges_with_weights(loaded_graph))
+
+        loaded_gng.train(self.x_train, epochs=1)
+        self.assertEqual(loaded_gng.last_epoch, 4)
+
+    def test_cmac_storage(self):
+        cmac = algorithms.CMAC(
+            quantization=20, associative_unit_size=4, verbose=False)
+        target = np.concatenate([self.y_train, -self.y_train], axis=1)
+        cmac.train(self.x_train, target, epochs=5)
+
+        loaded_cmac = self.save_and_load(cmac)
+
+        self.assertEqual(len(cmac.weight), len(loaded_cmac.weight))
+        np.testing.assert_array_almost_equal(
+            cmac.predict(self.x_train), loaded_cmac.predict(self.x_train))
+
+        cmac.train(self.x_train, target, epochs=1)
+        loaded_cmac.train(self.x_train, target, epochs=1)
+
+        np.testing.assert_array_almost_equal(
+            cmac.predict(self.x_train), loaded_cmac.predict(self.x_train))
+
+    def test_hopfield_storage(self):
+        data = np.random.randint(0, 2, (2, 50))
+        hopfield = algorithms.DiscreteHopfieldNetwork(mode='async')
+        hopfield.train(data)
+
+        loaded_hopfield = self.save_and_load(hopfield, n_times=200)
+
+        self.assertEqual(loaded_hopfield.mode, 'async')
+        self.assertEqual(loaded_hopfield.n_times, 200)
+        self.assertEqual(loaded_hopfield.n_memorized_samples, 2)
+
+        np.testing.assert_array_equal(
+            hopfield.weight, loaded_hopfield.weight)
+
+        # Changes in the network shouldn't modify file
+        loaded_hopfield.train(np.random.randint(0, 2, (1, 50)))
+        reloaded_hopfield = storage.load_algorithm(self.filepath)
+
+        np.testing.assert_array_equal(
+            hopfield.weight, reloaded_hopfield.weight)
+
+    def test_algorithm_storage_exceptions(self):
+        grnn = algorithms.GRNN(verbose=False, epoch_end_signal=lambda n: n)
+        grnn.train(self.x_train, self.y_train)
+
+        loaded_grnn = self.save_and_load(grnn)
+        # Functions are not stored in the file
+        self.assertIsNone(loaded_grnn.epoch_end_signal)
+
+        storage.save_memmap(algorithms.GradientDescent((2, 1)), self.filepath)
+
+        with self.assertRaises(InvalidFormat):
+            storage.load_algorithm(self.filepath)
+
+        with self.assertRaises(ValueError):
+            storage.save_algorithm(
+                algorithms.GradientDescent((2, 1)), self.filepath)
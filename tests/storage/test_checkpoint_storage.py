@@ -0,0 +1,316 @@
+import os
+import pickle
+import threading
+import tempfile
+
+import numpy as np
+
+from neupy import algorithms, layers, storage, environment
+from neupy.utils import asfloat
+from neupy.storage import InvalidFormat, ParameterLoaderError
+from neupy.algorithms.base import BaseNetwork
+
+from base import BaseTestCase
+
+
+def create_network(algorithm, **options):
+    environment.reproducible(seed=0)
+    layers.BaseLayer.global_identifiers_map = {}
+
+    return algorithm(
+        [
+            layers.Input(5),
+            layers.Relu(8),
+            layers.Dropout(0.3),
+            layers.BatchNorm(),
+            layers.Sigmoid(1),
+        ],
+        verbose=False,
+        **options
+    )
+
+
+class CheckpointStorageTestCase(BaseTestCase):
+    def setUp(self):
+        super(CheckpointStorageTestCase, self).setUp()
+
+        self.directory = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.directory, 'checkpoint.pickle')
+
+        self.x_train = asfloat(np.random.random((40, 5)))
+        self.y_train = asfloat(np.random.random((40, 1)))
+
+    def check_resumed_training(self, algorithm, **options):
+        network = create_network(algorithm, **options)
+        environment.reproducible(seed=1)
+        network.train(self.x_train, self.y_train, epochs=6)
+
+        # Training stops after 4th epoch, but checkpoint
+        # has been saved only after the 3rd epoch
+        interrupted_network = create_network(
+            algorithm, checkpoint_file=self.filepath,
+            checkpoint_epoch=3, **options)
+
+        environment.reproducible(seed=1)
+        interrupted_network.train(self.x_train, self.y_train, epochs=4)
+
+        resumed_network = create_network(algorithm, **options)
+        # Random state will be restored from the checkpoint
+        np.random.seed(100)
+        storage.load_checkpoint(resumed_network, self.filepath)
+
+        self.assertEqual(resumed_network.last_epoch, 3)
+        self.assertEqual(len(resumed_network.errors), 3)
+
+        resumed_network.train(self.x_train, self.y_train, epochs=3)
+
+        self.assertEqual(resumed_network.last_epoch, 6)
+        np.testing.assert_array_almost_equal(
+            network.errors, resumed_network.errors)
+        np.testing.assert_array_almost_equal(
+            network.predict(self.x_train),
+            resumed_network.predict(self.x_train))
+
+    def test_resume_adam_training(self):
+        self.check_resumed_training(algorithms.Adam, batch_size=10)
+
+    def test_resume_momentum_training(self):
+        self.check_resumed_training(
+            algorithms.Momentum, batch_size=10, nesterov=True)
+
+    def test_resume_rprop_training(self):
+        self.check_resumed_training(algorithms.IRPROPPlus)
+
+    def test_training_state(self):
+        network = create_network(algorithms.Adam)
+        network.train(self.x_train, self.y_train, epochs=2)
+
+        state = network.get_training_state()
+        variables = state['variables']
+
+        self.assertEqual(state['last_epoch'], 2)
+        self.assertEqual(len(state['errors']), 2)
+        self.assertIn('layer:relu-1/weight', variables)
+        self.assertIn('layer:relu-1/weight/prev-first-moment', variables)
+        self.assertIn('layer:batch-norm-1/running-mean', variables)
+        self.assertIn('algo:network/scalar:epoch', variables)
+        # State of the random stream that generates dropout masks
+        self.assertIsInstance(variables['unnamed'], np.random.RandomState)
+
+    def test_resume_sofm_training(self):
+        def create_sofm(**options):
+            return algorithms.SOFM(
+                n_inputs=5, features_grid=(3, 2), weight='sample_from_data',
+                verbose=False, **options)
+
+        sofm = create_sofm(checkpoint_file=self.filepath, checkpoint_epoch=2)
+        sofm.train(self.x_train, epochs=2)
+
+        resumed_sofm = create_sofm()
+        storage.load_checkpoint(resumed_sofm, self.filepath)
+
+        self.assertEqual(resumed_sofm.last_epoch, 2)
+        np.testing.assert_array_equal(sofm.weight, resumed_sofm.weight)
+
+        sofm.train(self.x_train, epochs=1)
+        resumed_sofm.train(self.x_train, epochs=1)
+
+        self.assertEqual(resumed_sofm.last_epoch, 3)
+        np.testing.assert_array_almost_equal(
+            sofm.weight, resumed_sofm.weight)
+
+    def test_resume_oja_training(self):
+        data = np.random.random((20, 4))
+
+        oja = algorithms.Oja(
+            minimized_data_size=2, step=0.01, verbose=False,
+            checkpoint_file=self.filepath, checkpoint_epoch=3)
+        oja.train(data, epochs=3, epsilon=None)
+
+        resumed_oja = algorithms.Oja(
+            minimized_data_size=2, step=0.01, verbose=False)
+        storage.load_checkpoint(resumed_oja, self.filepath)
+
+        self.assertEqual(resumed_oja.last_epoch, 3)
+        np.testing.assert_array_equal(oja.weight, resumed_oja.weight)
+
+        oja.train(data, epochs=1, epsilon=None)
+        resumed_oja.train(data, epochs=1, epsilon=None)
+
+        np.testing.assert_array_almost_equal(
+            oja.predict(data), resumed_oja.predict(data))
+
+    def test_art1_training_state(self):
+        data = np.array([[0, 1, 0], [1, 0, 0], [1, 1, 0]])
+
+        artnet = algorithms.ART1(step=2, rho=0.7, verbose=False)
+        artnet.train(data)
+        storage.save_checkpoint(artnet, self.filepath)
+
+        loaded_artnet = algorithms.ART1(step=2, rho=0.7, verbose=False)
+        storage.load_checkpoint(loaded_artnet, self.filepath)
+
+        np.testing.assert_array_equal(
+            artnet.weight_12, loaded_artnet.weight_12)
+        np.testing.assert_array_equal(
+            artnet.predict(data), loaded_artnet.predict(data))
+
+        # ART1 doesn't train in epochs
+        with self.assertRaises(ValueError):
+            algorithms.ART1(checkpoint_file=self.filepath)
+
+    def test_checkpoint_without_training_state(self):
+        class NetworkWithoutState(BaseNetwork):
+            pass
+
+        with self.assertRaises(ValueError):
+            NetworkWithoutState(checkpoint_file=self.filepath)
+
+    def test_checkpoint_compression(self):
+        network = create_network(algorithms.Adam)
+        network.train(self.x_train, self.y_train, epochs=2)
+
+        storage.save_checkpoint(network, self.filepath, compression='gzip')
+        self.assertEqual(os.listdir(self.directory), ['checkpoint.pickle'])
+
+        resumed_network = create_network(algorithms.Adam)
+        storage.load_checkpoint(resumed_network, self.filepath)
+
+        np.testing.assert_array_almost_equal(
+            network.predict(self.x_train),
+            resumed_network.predict(self.x_train))
+
+    def test_load_checkpoint_exceptions(self):
+        network = create_network(algorithms.Adam)
+        storage.save_checkpoint(network, self.filepath)
+
+        with self.assertRaises(ParameterLoaderError):
+            storage.load_checkpoint(
+                create_network(algorithms.Momentum), self.filepath)
+
+        different_network = algorithms.Adam(
+            [layers.Input(5), layers.Sigmoid(1)], verbose=False)
+
+        with self.assertRaises(ParameterLoaderError):
+            storage.load_checkpoint(different_network, self.filepath)
+
+        with open(self.filepath, 'wb') as f:
+            pickle.dump({'layers': []}, f)
+
+        with self.assertRaises(InvalidFormat):
+            storage.load_checkpoint(network, self.filepath)
+
+
+class SlowCheckpointWriter(storage.CheckpointWriter):
+    def __init__(self, *args, **kwargs):
+        super(SlowCheckpointWriter, self).__init__(*args, **kwargs)
+        self.can_write = threading.Event()
+
+    def write(self, filepath, snapshot):
+        self.can_write.wait()
+        super(SlowCheckpointWriter, self).write(filepath, snapshot)
+
+
+class CheckpointWriterTestCase(BaseTestCase):
+    def setUp(self):
+        super(CheckpointWriterTestCase, self).setUp()
+        self.directory = tempfile.mkdtemp()
+
+    def test_checkpoint_writer(self):
+        filepath = os.path.join(self.directory, 'network-{epoch}.hdf5')
+        network = create_network(algorithms.GradientDescent)
+        x_train = asfloat(np.random.random((10, 5)))
+
+        with storage.CheckpointWriter(filepath, format='hdf5',
+                                      keep_last=2) as writer:
+            for epoch in range(1, 5):
+                network.last_epoch = epoch
+                writer.save(network)
+                writer.wait()
+
+        self.assertEqual(sorted(os.listdir(self.directory)),
+                         ['network-3.hdf5', 'network-4.hdf5'])
+        self.assertEqual(writer.saved_files, [
+            os.path.join(self.directory, 'network-3.hdf5'),
+            os.path.join(self.directory, 'network-4.hdf5'),
+        ])
+
+        loaded_network = create_network(algorithms.GradientDescent)
+        storage.load_hdf5(loaded_network, writer.saved_files[-1])
+
+        np.testing.assert_array_almost_equal(
+            network.predict(x_train), loaded_network.predict(x_train))
+
+    def test_checkpoint_writer_snapshots(self):
+        filepath = os.path.join(self.directory, 'network.pickle')
+        writer = SlowCheckpointWriter(filepath, precision='float32')
+        connection = layers.Input(2) > layers.Linear(1, weight=0, bias=0)
+        linear = connection.output_layers[0]
+
+        for value in (1, 2, 3):
+            linear.weight.set_value(asfloat(np.array([[value], [value]])))
+            connection.last_epoch = value
+            # Method shouldn't wait until previous snapshot is written
+            writer.save(connection)
+
+        # Value has been changed after the last snapshot
+        linear.weight.set_value(asfloat(np.array([[4], [4]])))
+        writer.can_write.set()
+        writer.close()
+
+        # Second snapshot has been replaced with the third one
+        self.assertEqual(writer.n_skipped, 1)
+        self.assertEqual(os.listdir(self.directory), ['network.pickle'])
+
+        with open(filepath, 'rb') as f:
+            data = pickle.load(f)
+
+        weight = data['layers'][1]['parameters']['weight']['value']
+        self.assertEqual(weight.dtype, np.float32)
+        np.testing.assert_array_equal(weight, [[3], [3]])
+
+    def test_checkpoint_writer_training_state(self):
+        filepath = os.path.join(self.directory, 'checkpoint')
+        x_train = asfloat(np.random.random((20, 5)))
+        y_train = asfloat(np.random.random((20, 1)))
+
+        writer = storage.CheckpointWriter(
+            filepath, format='checkpoint', compression='gzip')
+        network = create_network(algorithms.Adam, epoch_end_signal=writer)
+        network.train(x_train, y_train, epochs=3)
+        writer.close()
+
+        resumed_network = create_network(algorithms.Adam)
+        storage.load_checkpoint(resumed_network, filepath)
+
+        self.assertEqual(resumed_network.last_epoch, 3)
+        np.testing.assert_array_almost_equal(
+            network.predict(x_train), resumed_network.predict(x_train))
+
+    def test_checkpoint_writer_exceptions(self):
+        with self.assertRaises(ValueError):
+            storage.CheckpointWriter('network', format='zip')
+
+        with self.assertRaises(ValueError):
+            storage.CheckpointWriter('network', keep_last=0)
+
+        with self.assertRaises(ValueError):
+            storage.CheckpointWriter('network', precision='int4')
+
+        with self.assertRaises(ValueError):
+            storage.CheckpointWriter(
+                'network', format='checkpoint', precision='int8')
+
+        network = create_network(algorithms.GradientDescent)
+        filepath = os.path.join(self.directory, 'unknown', 'network')
+        writer = storage.CheckpointWriter(filepath)
+        writer.save(network)
+
+        # Exception from the background thread
+        with self.assertRaises(IOError):
+            writer.wait()
+
+        writer.close()
+
+        with self.assertRaises(ValueError):
+            writer.save(network)
@@ -38,7 +38,7 @@ class DictStorageTestCase(BaseTestCase):
 
         expected_layers = [{
             'class_name': 'Input',
-            'configs': {'name': 'input-2', 'size': 1},
+            'configs': {'name': 'input-2', 'size': 1, 'sparse': False},
             'input_shape': (1,),
             'name': 'input-2',
             'output_shape': (1,)
@@ -61,7 +61,7 @@ class DictStorageTestCase(BaseTestCase):
             'output_shape': (4,)
         }, {
             'class_name': 'Input',
-            'configs': {'name': 'input-1', 'size': 2},
+            'configs': {'name': 'input-1', 'size': 2, 'sparse': False},
             'input_shape': (2,),
             'name': 'input-1',
             'output_shape': (2,)
@@ -1,35 +1,19 @@
+import json
+import base64
 import tempfile
-from textwrap import dedent
 
 import numpy as np
 from mock import patch
+from six import StringIO
 
 from neupy import storage, layers
 from neupy.utils import asfloat
-from neupy.storage import dump_with_fastest_json_module
+from neupy.storage import InvalidFormat
 
 from base import BaseTestCase
 
 
 class JSONStorageTestCase(BaseTestCase):
-    def test_ujson_custom_indentation_during_dump(self):
-        # Changing the mode, because in Python 3 in would
-        # be opened as binary file
-        with tempfile.NamedTemporaryFile(mode='w+') as temp:
-            dump_with_fastest_json_module(
-                {'test': 'json'}, temp.file, indent=2)
-
-            temp.file.seek(0)
-
-            actual_output = temp.read()
-            expected_output = dedent("""
-            {
-              "test":"json"
-            }
-            """).strip()  # remove final '\n' symbol
-
-            self.assertEqual(actual_output, expected_output)
-
     def test_json_storage(self):
         connection_1 = layers.join(
             layers.Input(10),
@@ -104,3 +88,150 @@ class JSONStorageTestCase(BaseTestCase):
 
                 np.testing.assert_array_almost_equal(
                     random_output_1, random_output_2_2)
+
+    def test_json_storage_binary_and_indent(self):
+        connection_1 = layers.join(
+            layers.Input((1, 6, 6)),
+            layers.Convolution((2, 3, 3)),
+            layers.BatchNorm(),
+            layers.Reshape(),
+            layers.Softmax(3),
+        )
+        connection_2 = layers.join(
+            layers.Input((1, 6, 6)),
+            layers.Convolution((2, 3, 3)),
+            layers.BatchNorm(),
+            layers.Reshape(),
+            layers.Softmax(3),
+        )
+
+        # Scalar parameters should keep their shape
+        for value, connection in enumerate([connection_1, connection_2]):
+            connection.output_layers[0].add_parameter(
+                value=asfloat(value + 1.5), name='scale', shape=())
+
+        expected_data = storage.save_dict(connection_1)
+
+        for options in [dict(binary=True), dict(indent=2)]:
+            with tempfile.NamedTemporaryFile(mode='w+') as temp:
+                storage.save_json(connection_1, temp.name, **options)
+
+                # Output should be a valid JSON
+                data = json.load(temp.file)
+                self.assertEqual(
+                    data['graph'],
+                    [list(value) for value in expected_data['graph']])
+
+                storage.load_json(connection_2, temp.name)
+
+            for layer_1, layer_2 in zip(connection_1, connection_2):
+                for name, parameter in layer_1.parameters.items():
+                    value = layer_2.parameters[name].get_value()
+                    self.assertEqual(value.shape, parameter.get_value().shape)
+                    np.testing.assert_array_equal(parameter.get_value(), value)
+
+    def test_json_stream_reader(self):
+        data = {
+            'layers': [{
+                'name': 'layer-1',
+                'parameters': {
+                    'weight': {'value': [[1, 2.5, -3e-2], [4, 5, 6]]},
+                    'bias': {'value': [1, -1, 3]},
+                    'alpha': {'value': 1.5},
+                },
+                'configs': {'size': [3, None], 'flag': True, 'text': 'a"b'},
+            }],
+            'metadata': {'version': 1},
+        }
+        text = json.dumps(data, indent=3)
+
+        for chunk_size in (1, 7, 2 ** 20):
+            reader = storage.JSONStreamReader(
+                StringIO(text), chunk_size=chunk_size)
+            actual_data = reader.parse()
+
+            layer = actual_data['layers'][0]
+            parameters = layer.pop('parameters')
+
+            self.assertEqual(layer, {
+                'name': 'layer-1',
+                'configs': {'size': [3, None], 'flag': True, 'text': 'a"b'},
+            })
+            self.assertEqual(actual_data['metadata'], {'version': 1})
+
+            np.testing.assert_array_equal(
+                parameters['weight']['value'],
+                np.array([[1, 2.5, -3e-2], [4, 5, 6]]))
+            np.testing.assert_array_equal(
+                parameters['bias']['value'], np.array([1, -1, 3]))
+            self.assertEqual(parameters['alpha']['value'], 1.5)
+
+    def test_json_empty_parameters(self):
+        shapes = [(0,), (0, 5), (3, 0), (2, 0, 1)]
+
+        def create_connection():
+            layer = layers.Relu(2, name='relu')
+            connection = layers.Input(3) > layer
+
+            for index, shape in enumerate(shapes):
+                layer.add_parameter(value=asfloat(np.zeros(shape)),
+                                    name='empty_{}'.format(index),
+                                    shape=shape)
+
+            return connection
+
+        connection_1 = create_connection()
+
+        with tempfile.NamedTemporaryFile(mode='w+') as temp:
+            storage.save_json(connection_1, temp.name)
+            text = temp.read()
+
+        for chunk_size in (1, 3, 7):
+            reader = storage.JSONStreamReader(
+                StringIO(text), chunk_size=chunk_size)
+            data = reader.parse()
+
+            parameters = data['layers'][1]['parameters']
+            self.assertEqual(parameters['empty_2']['value'].shape, (3, 0))
+
+            connection_2 = create_connection()
+            storage.load_dict(connection_2, data)
+
+            relu = connection_2.layer('relu')
+
+            for index, shape in enumerate(shapes):
+                parameter = getattr(relu, 'empty_{}'.format(index))
+                self.assertEqual(parameter.get_value().shape, shape)
+
+    def test_json_stream_reader_base64_value(self):
+        value = np.arange(6, dtype='float32').reshape((2, 3))
+        text = json.dumps({'layers': [{'parameters': {'weight': {
+            'value': {
+                'encoding': 'base64',
+                'dtype': value.dtype.str,
+                'shape': value.shape,
+                'data': base64.b64encode(value.tobytes()).decode('ascii'),
+            }
+        }}}]})
+
+        data = storage.JSONStreamReader(StringIO(text), chunk_size=5).parse()
+        actual_value = data['layers'][0]['parameters']['weight']['value']
+
+        np.testing.assert_array_equal(actual_value, value)
+        self.assertEqual(actual_value.dtype, value.dtype)
+
+    def test_json_stream_reader_exceptions(self):
+        invalid_documents = [
+            '{"a": 1',
+            '{"a": 1} 2',
+            '{"a" 1}',
+            '{"layers": [{"parameters": {"w": {"value": [1, [2]]}}}]}',
+            '{"layers": [{"parameters": {"w": {"value": [[1], 2]}}}]}',
+            '{"layers": [{"parameters": {"w": {"value": [[1, 2], [3]]}}}]}',
+            '{"layers": [{"parameters": {"w": {"value": [1, "a"]}}}]}',
+            '{"layers": [{"parameters": {"w": {"value": {"data": ""}}}}]}',
+        ]
+
+        for document in invalid_documents:
+            with self.assertRaises(InvalidFormat):
+                storage.JSONStreamReader(StringIO(document)).parse()
@@ -0,0 +1,102 @@
+import tempfile
+
+import numpy as np
+
+from neupy import storage, layers
+from neupy.utils import asfloat
+from neupy.storage import InvalidFormat, MEMMAP_ALIGNMENT
+
+from base import BaseTestCase
+
+
+class MemmapStorageTestCase(BaseTestCase):
+    def test_simple_storage_memmap(self):
+        connection_1 = layers.join(
+            layers.Input(10),
+            [
+                layers.Sigmoid(5),
+                layers.Relu(5),
+            ],
+            layers.Elementwise(),
+            layers.BatchNorm(),
+        )
+        predict_1 = connection_1.compile()
+
+        connection_2 = layers.join(
+            layers.Input(10),
+            [
+                layers.Sigmoid(5),
+                layers.Relu(5),
+            ],
+            layers.Elementwise(),
+            layers.BatchNorm(),
+        )
+        predict_2 = connection_2.compile()
+
+        random_input = asfloat(np.random.random((13, 10)))
+        random_output_1 = predict_1(random_input)
+        random_output_2_1 = predict_2(random_input)
+
+        # Outputs has to be different
+        self.assertFalse(np.any(random_output_1 == random_output_2_1))
+
+        with tempfile.NamedTemporaryFile() as temp:
+            storage.save_memmap(connection_1, temp.name)
+            storage.load_memmap(connection_2, temp.name)
+            random_output_2_2 = predict_2(random_input)
+
+            np.testing.assert_array_almost_equal(
+                random_output_1, random_output_2_2)
+
+    def test_memmap_storage_zero_copy(self):
+        relu = layers.Relu(5)
+        connection = layers.Input(10) > relu
+
+        with tempfile.NamedTemporaryFile() as temp:
+            storage.save_memmap(connection, temp.name)
+            expected_weight = relu.weight.get_value()
+
+            relu.weight.set_value(asfloat(np.zeros((10, 5))))
+            storage.load_memmap(connection, temp.name)
+
+            weight = relu.weight.get_value(borrow=True)
+
+            self.assertIsInstance(weight, np.memmap)
+            self.assertEqual(weight.ctypes.data % MEMMAP_ALIGNMENT, 0)
+            np.testing.assert_array_equal(weight, expected_weight)
+
+            # Changes in the parameters shouldn't modify file
+            weight[:] = 0
+
+            other_relu = layers.Relu(5)
+            other_connection = layers.Input(10) > other_relu
+
+            storage.load_memmap(other_connection, temp.name)
+            np.testing.assert_array_equal(
+                other_relu.weight.get_value(), expected_weight)
+
+    def test_memmap_storage_scalar_parameter(self):
+        def create_connection(value):
+            relu = layers.Relu(5, name='relu')
+            relu.add_parameter(value=asfloat(value), name='scale', shape=())
+            return layers.Input(10) > relu
+
+        connection_1 = create_connection(1.5)
+        connection_2 = create_connection(0)
+
+        with tempfile.NamedTemporaryFile() as temp:
+            storage.save_memmap(connection_1, temp.name)
+            storage.load_memmap(connection_2, temp.name)
+
+        scale = connection_2.layer('relu').scale.get_value()
+        self.assertEqual(scale.shape, ())
+        self.assertEqual(scale, 1.5)
+
+    def test_memmap_storage_invalid_format(self):
+        connection = layers.Input(10) > layers.Relu(5)
+
+        with tempfile.NamedTemporaryFile() as temp:
+            storage.save_pickle(connection, temp.name)
+
+            with self.assertRaises(InvalidFormat):
+                storage.load_memmap(connection, temp.name)
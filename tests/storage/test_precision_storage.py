@@ -0,0 +1,175 @@
+import os
+import gzip
+import tempfile
+
+import numpy as np
+
+from neupy import storage, layers
+from neupy.utils import asfloat
+from neupy.storage import (encode_parameter, decode_parameter,
+                           InvalidFormat, PRECISIONS)
+
+from base import BaseTestCase
+
+
+def create_connection():
+    return layers.join(
+        layers.Input(10),
+        layers.Relu(200),
+        layers.BatchNorm(),
+        layers.Softmax(3),
+    )
+
+
+class ParameterPrecisionTestCase(BaseTestCase):
+    def test_float_precisions(self):
+        value = np.random.random((10, 20))
+
+        for precision in ('float64', 'float32', 'float16'):
+            encoded = encode_parameter(value, precision)
+            self.assertEqual(encoded.dtype, np.dtype(precision))
+
+            decoded = decode_parameter(encoded)
+            self.assertEqual(decoded.dtype, asfloat(value).dtype)
+            np.testing.assert_allclose(decoded, value, rtol=1e-3)
+
+        np.testing.assert_array_equal(
+            encode_parameter(value), asfloat(value))
+
+    def test_bfloat16_precision(self):
+        value = np.array([0, 1, -2.5, 1 / 3., 1e-20, 3e38,
+                          np.inf, -np.inf, np.nan])
+
+        encoded = encode_parameter(value, 'bfloat16')
+        self.assertEqual(encoded['precision'], 'bfloat16')
+        self.assertEqual(encoded['value'].dtype, np.uint16)
+
+        decoded = decode_parameter(encoded)
+        self.assertTrue(np.isnan(decoded[-1]))
+        np.testing.assert_allclose(decoded[:-1], value[:-1], rtol=1e-2)
+        # Values that can be represented exactly
+        np.testing.assert_array_equal(decoded[:3], value[:3])
+
+        # Numbers should be rounded to the nearest value. There
+        # are 7 bits for the mantissa, which means that value
+        # 1 + 2 ** -8 is exactly between 1 and 1 + 2 ** -7
+        value = np.array([1 + 2 ** -8 + 2 ** -10, 1 + 2 ** -8])
+        decoded = decode_parameter(encode_parameter(value, 'bfloat16'))
+        np.testing.assert_array_equal(decoded, [1 + 2 ** -7, 1])
+
+    def test_int8_precision(self):
+        value = np.random.random((10, 20)) - 0.2
+        encoded = encode_parameter(value, 'int8')
+
+        self.assertEqual(encoded['precision'], 'int8')
+        self.assertEqual(encoded['value'].dtype, np.int8)
+        self.assertEqual(encoded['value'].min(), -128)
+        self.assertEqual(encoded['value'].max(), 127)
+
+        decoded = decode_parameter(encoded)
+        np.testing.assert_allclose(
+            decoded, value, atol=encoded['scale'] / 2 + 1e-7)
+
+        # Zero should be represented exactly
+        value = np.array([0, 1, 2, 3.])
+        np.testing.assert_array_almost_equal(
+            decode_parameter(encode_parameter(value, 'int8')), value,
+            decimal=1)
+        self.assertEqual(
+            decode_parameter(encode_parameter(value, 'int8'))[0], 0)
+
+        for value in (np.zeros((3, 3)), np.ones(4), -np.ones(4),
+                      np.array(5.), np.array([])):
+            decoded = decode_parameter(encode_parameter(value, 'int8'))
+            np.testing.assert_array_almost_equal(decoded, value)
+
+    def test_precision_exceptions(self):
+        with self.assertRaises(ValueError):
+            encode_parameter(np.ones(3), 'float8')
+
+        with self.assertRaises(InvalidFormat):
+            decode_parameter({'precision': 'int4', 'value': np.ones(3)})
+
+        with self.assertRaises(ValueError):
+            storage.save_dict(create_connection(), precision='int4')
+
+        with tempfile.NamedTemporaryFile() as temp:
+            with self.assertRaises(ValueError):
+                storage.save_json(
+                    create_connection(), temp.name, precision='int4')
+
+            with self.assertRaises(ValueError):
+                storage.save_pickle(
+                    create_connection(), temp.name, compression='zip')
+
+
+class StorageWithPrecisionTestCase(BaseTestCase):
+    def check_storage(self, save, load, **options):
+        connection_1 = create_connection()
+        connection_2 = create_connection()
+
+        for layer in connection_1:
+            for parameter in layer.parameters.values():
+                shape = parameter.get_value().shape
+                parameter.set_value(asfloat(np.random.random(shape) + 0.5))
+
+        x = asfloat(np.random.random((15, 10)))
+        predict_1 = connection_1.compile()
+        predict_2 = connection_2.compile()
+
+        sizes = {}
+
+        for precision in (None,) + PRECISIONS:
+            with tempfile.NamedTemporaryFile() as temp:
+                save(connection_1, temp.name, precision=precision, **options)
+                load(connection_2, temp.name)
+
+                sizes[precision] = os.path.getsize(temp.name)
+                np.testing.assert_allclose(
+                    predict_1(x), predict_2(x), atol=0.05)
+
+        return sizes
+
+    def test_pickle_storage_with_precision(self):
+        sizes = self.check_storage(storage.save_pickle, storage.load_pickle)
+        self.assertLess(sizes['float16'], sizes['float64'] / 3)
+        self.assertLess(sizes['int8'], sizes['float64'] / 6)
+
+    def test_compressed_pickle_storage(self):
+        for compression in ('gzip', 'bz2'):
+            self.check_storage(
+                storage.save_pickle, storage.load_pickle,
+                compression=compression)
+
+        connection = create_connection()
+
+        with tempfile.NamedTemporaryFile() as temp:
+            storage.save_pickle(
+                connection, temp.name, precision='int8', compression='gzip')
+
+            with gzip.open(temp.name) as f:
+                self.assertEqual(f.read(1), b'\x80')
+
+    def test_hdf5_storage_with_precision(self):
+        self.check_storage(storage.save_hdf5, storage.load_hdf5)
+        self.check_storage(
+            storage.save_hdf5, storage.load_hdf5, compression='gzip')
+
+    def test_json_storage_with_precision(self):
+        self.check_storage(storage.save_json, storage.load_json)
+        self.check_storage(
+            storage.save_json, storage.load_json, binary=True)
+
+    def test_memmap_storage_with_precision(self):
+        sizes = self.check_storage(storage.save_memmap, storage.load_memmap)
+        self.assertLess(sizes['int8'], sizes['float64'] / 4)
+
+    def test_save_dict_with_precision(self):
+        connection = create_connection()
+        data = storage.save_dict(connection, precision='int8')
+
+        weight = data['layers'][1]['parameters']['weight']['value']
+        self.assertEqual(sorted(weight.keys()),
+                         ['precision', 'scale', 'value', 'zero_point'])
+
+        storage.load_dict(create_connection(), data)